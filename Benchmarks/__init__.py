@@ -0,0 +1,10 @@
+from .boards import standard_spaces, enlarge_spaces, generate_spaces
+
+__all__ = ["standard_spaces", "enlarge_spaces", "generate_spaces", "run_benchmarks", "compare_results"]
+
+def __getattr__(name):
+	# Imported on first use, so "python -m Benchmarks.benchmark" does not load the module twice
+	if name in ("run_benchmarks", "compare_results"):
+		from . import benchmark
+		return getattr(benchmark, name)
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
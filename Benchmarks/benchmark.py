@@ -0,0 +1,337 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, Any, List, Callable, Optional
+from Core import Game, Bank
+from Core.turn import GAME_OVER
+from Core.save import save_game, load_game
+from Core.results_store import Game_Recorder
+from Core.batch_simulator import Batch_Simulator
+from Players import AI
+from Board import Board
+from Board.Space_Types import Property_Group
+from Cards import Deck
+from Data.Config import load_config, load_chance, load_community_chest, compile_config
+from Benchmarks.boards import standard_spaces, enlarge_spaces, generate_spaces
+
+# Board sizes every benchmark is run across: name -> number of copies of the standard board
+BOARDS = {"standard": 1, "enlarged_x4": 4, "enlarged_x16": 16}
+PLAYER_COUNTS = [2, 4, 8]
+# Group counts for the generated board scaling benchmark (about 4 spaces per group)
+LARGE_BOARD_GROUPS = [100, 400, 1600]
+MAX_TURNS = 1000  # Cap so a stalemated game can not hang the suite
+
+def build_game(board: str, players: int, seed: int, parameters: Optional[List[Optional[Dict[str, float]]]] = None) -> "Game":
+	"""
+	Build a game of AI players on one of the benchmark boards.
+	The game is begun (house rule start hooks run) once every player is seated.
+
+	:param board: A key of BOARDS.
+	:param players: How many AI players to add.
+	:param seed: Seed for the random module, so runs are repeatable.
+	:param parameters: Optionally the strategy parameters of each AI, in seat order
+					   (None for the defaults).
+	:return: A ready to play Game.
+	"""
+	random.seed(seed)
+	data = {
+		"Config": load_config(),
+		"Spaces": enlarge_spaces(standard_spaces(), BOARDS[board]),
+		"Chance": load_chance(),
+		"Comunity_Chest": load_community_chest()
+	}
+	game = Game(data=data)
+	for i in range(players):
+		game.add_ai(f"AI {i + 1}", parameters[i] if parameters else None)
+	game.begin()
+	return game
+
+def play_turn(game: "Game", recorder: Optional["Game_Recorder"] = None) -> int:
+	"""
+	Play a single turn through the game's turn machine (see Core.turn), as a real game does,
+	including the AI's end of turn actions.
+
+	:param recorder: Optionally record the turn into a Results_Store.
+	:return: 1 if a turn was played, 0 if the game was already over.
+	"""
+	machine = game.turn_machine
+	played = machine.run_until(turns=1)
+	if played and recorder is not None:
+		recorder.record_turn(machine.player)
+	return played
+
+def play_turns(game: "Game", turns: int, recorder: Optional["Game_Recorder"] = None) -> int:
+	"""
+	Play up to the given number of turns, stopping early if the game ends.
+
+	:param recorder: Optionally record every turn into a Results_Store (finish is left to the caller).
+	:return: The number of turns actually played.
+	"""
+	if recorder is None:
+		return game.run_until(turns=turns)
+	played = 0
+	while played < turns and game.turn_machine.phase != GAME_OVER:
+		played += play_turn(game, recorder)
+	return played
+
+def _result(name: str, board: str, players: Optional[int], ops: int, seconds: float) -> Dict[str, Any]:
+	return {
+		"name": name,
+		"board": board,
+		"players": players,
+		"ops": ops,
+		"seconds": seconds,
+		"ops_per_sec": ops / seconds if seconds > 0 else None,
+		"mean_ms": seconds * 1000 / ops if ops else None
+	}
+
+def bench_full_game(board: str, players: int, games: int, seed: int) -> Dict[str, Any]:
+	"""
+	Games per second: play whole games of AI players until one is left (or MAX_TURNS).
+	"""
+	seconds = 0.0
+	for i in range(games):
+		game = build_game(board, players, seed + i)
+		start = time.perf_counter()
+		play_turns(game, MAX_TURNS)
+		seconds += time.perf_counter() - start
+	return _result("full_game", board, players, games, seconds)
+
+def bench_turns(board: str, players: int, turns: int, seed: int) -> Dict[str, Any]:
+	"""
+	Turns per second, restarting the game whenever it ends before enough turns are played.
+	"""
+	seconds = 0.0
+	played = 0
+	while played < turns:
+		game = build_game(board, players, seed + played)
+		start = time.perf_counter()
+		played += play_turns(game, turns - played)
+		seconds += time.perf_counter() - start
+	return _result("turn", board, players, played, seconds)
+
+def bench_save_load(board: str, players: int, repeats: int, seed: int) -> List[Dict[str, Any]]:
+	"""
+	Latency of save_game and load_game on a game part way through.
+	Runs inside a temporary directory so real save slots are never touched.
+	"""
+	game = build_game(board, players, seed)
+	play_turns(game, 50)
+	save_seconds = 0.0
+	load_seconds = 0.0
+	compressed_seconds = 0.0
+	cwd = os.getcwd()
+	with tempfile.TemporaryDirectory() as folder:
+		os.chdir(folder)
+		try:
+			for _ in range(repeats):
+				start = time.perf_counter()
+				save_game(game, 0)
+				save_seconds += time.perf_counter() - start
+
+				start = time.perf_counter()
+				load_game(game, 0)
+				load_seconds += time.perf_counter() - start
+
+				start = time.perf_counter()
+				save_game(game, 1, compressed=True)
+				compressed_seconds += time.perf_counter() - start
+		finally:
+			os.chdir(cwd)
+	return [
+		_result("save_game", board, players, repeats, save_seconds),
+		_result("load_game", board, players, repeats, load_seconds),
+		_result("save_game_compressed", board, players, repeats, compressed_seconds)
+	]
+
+def bench_ai_decisions(board: str, players: int, repeats: int, seed: int) -> Dict[str, Any]:
+	"""
+	Latency of AI.decide_turn_actions on a game part way through.
+	Each call is made on a fresh copy of the same position so the AI has the same decisions to make.
+	"""
+	seconds = 0.0
+	for i in range(repeats):
+		game = build_game(board, players, seed)
+		play_turns(game, 50)
+		ai = game.players[game.current_turn]
+		start = time.perf_counter()
+		ai.decide_turn_actions(game)
+		seconds += time.perf_counter() - start
+	return _result("ai_decide_turn_actions", board, players, repeats, seconds)
+
+def bench_card_draw(board: str, draws: int, seed: int) -> Dict[str, Any]:
+	"""
+	Cost of drawing (and resolving) cards from the Chance and Community Chest decks.
+	"""
+	game = build_game(board, 2, seed)
+	player = game.players[0]
+	decks = list(game.decks.values())
+	seconds = 0.0
+	for i in range(draws):
+		start = time.perf_counter()
+		decks[i % len(decks)].draw_card(player, game)
+		seconds += time.perf_counter() - start
+		# Keep the player solvent so later draws measure the same work
+		player.bankrupt = False
+		player.balance = max(player.balance, 1500)
+	return _result("card_draw", board, None, draws, seconds)
+
+def bench_batch_simulator(players: int, games: int, turns: int, seed: int) -> Dict[str, Any]:
+	"""
+	Game turns per second of the vectorised Batch_Simulator on the standard board, to compare
+	with the "turn" results of the object model.
+	"""
+	simulator = Batch_Simulator(games, players, seed=seed)
+	played = 0
+	start = time.perf_counter()
+	for _ in range(turns):
+		played += int((~simulator.finished).sum())
+		if not simulator.step():
+			break
+	seconds = time.perf_counter() - start
+	return _result("batch_turn", "standard", players, played, seconds)
+
+def bench_large_board(groups: int, group_size: int = 3) -> List[Dict[str, Any]]:
+	"""
+	Per operation cost of board construction, ownership transfers and build checks on a
+	generated board. The mean times should stay flat as the board grows.
+	"""
+	board_name = f"generated_{groups}x{group_size}"
+	spaces = generate_spaces(groups, group_size)
+	rules = compile_config(load_config())
+	decks = {"Chance": Deck(load_chance()), "Comunity_Chest": Deck(load_community_chest())}
+
+	start = time.perf_counter()
+	board = Board(spaces, rules, decks)
+	construction = time.perf_counter() - start
+	# Later games on the same layout reuse its shared space definitions
+	start = time.perf_counter()
+	Board(spaces, rules, decks)
+	rebuild = time.perf_counter() - start
+
+	bank = Bank(rules.houses, rules.hotels)
+	player = AI("AI 1", rules.starting_amount)
+	start = time.perf_counter()
+	for space in board.ownable_spaces:
+		bank.transfer_property(space, player)
+	transfers = time.perf_counter() - start
+
+	cards = [space.get_card() for space in board.ownable_spaces if isinstance(space.group, Property_Group)]
+	start = time.perf_counter()
+	for card in cards:
+		card.location.group.can_build_house(card)
+	checks = time.perf_counter() - start
+
+	return [
+		_result("board_construction_per_space", board_name, None, len(spaces), construction),
+		_result("board_rebuild_per_space", board_name, None, len(spaces), rebuild),
+		_result("ownership_transfer", board_name, None, len(board.ownable_spaces), transfers),
+		_result("build_check", board_name, None, len(cards), checks)
+	]
+
+def run_benchmarks(quick: bool = False, seed: int = 0, boards: Optional[List[str]] = None) -> Dict[str, Any]:
+	"""
+	Run the full benchmark suite.
+
+	:param quick: Use far fewer repeats, for a fast smoke run.
+	:param seed: Base seed for every benchmark.
+	:param boards: Which BOARDS to run on (defaults to all of them).
+	:return: A dictionary of run metadata and a list of results.
+	"""
+	scale = 1 if quick else 10
+	results: List[Dict[str, Any]] = []
+	# Game output is printed constantly, swallow it so it does not dominate the timings
+	with contextlib.redirect_stdout(io.StringIO()):
+		for board in boards or list(BOARDS):
+			for players in PLAYER_COUNTS:
+				results.append(bench_full_game(board, players, 2 * scale, seed))
+				results.append(bench_turns(board, players, 200 * scale, seed))
+				results.append(bench_ai_decisions(board, players, 5 * scale, seed))
+			results.extend(bench_save_load(board, 4, 5 * scale, seed))
+			results.append(bench_card_draw(board, 500 * scale, seed))
+		for players in PLAYER_COUNTS:
+			results.append(bench_batch_simulator(players, 100 * scale, 200, seed))
+		for groups in LARGE_BOARD_GROUPS:
+			results.extend(bench_large_board(groups))
+	return {
+		"commit": _git_commit(),
+		"python": platform.python_version(),
+		"platform": platform.platform(),
+		"time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+		"quick": quick,
+		"seed": seed,
+		"results": results
+	}
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.1) -> List[str]:
+	"""
+	Compare two benchmark runs and list every result that got slower by more than the tolerance.
+
+	:param baseline: Results from an earlier run (e.g. the last deployed commit).
+	:param current: Results from this run.
+	:param tolerance: Allowed slowdown as a fraction of the baseline mean time.
+	:return: A description of each regression, empty if there are none.
+	"""
+	def key(result):
+		return (result["name"], result["board"], result["players"])
+
+	previous = {key(result): result for result in baseline.get("results", [])}
+	regressions = []
+	for result in current.get("results", []):
+		old = previous.get(key(result))
+		if not old or not old["mean_ms"] or result["mean_ms"] is None:
+			continue
+		change = result["mean_ms"] / old["mean_ms"] - 1
+		if change > tolerance:
+			regressions.append(
+				f"{result['name']} ({result['board']}, players={result['players']}): "
+				f"{old['mean_ms']:.3f}ms -> {result['mean_ms']:.3f}ms (+{change:.0%})"
+			)
+	return regressions
+
+def _git_commit() -> Optional[str]:
+	try:
+		return subprocess.run(
+			["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+		).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+def main(argv: Optional[List[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description="Monopoly performance benchmarks.")
+	parser.add_argument("--output", help="Write the json results to this file instead of stdout.")
+	parser.add_argument("--compare", help="A previous json results file to check for regressions against.")
+	parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed slowdown before failing (default 0.1 = 10%%).")
+	parser.add_argument("--quick", action="store_true", help="Run far fewer repeats.")
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--board", action="append", choices=list(BOARDS), help="Only run on this board (repeatable).")
+	args = parser.parse_args(argv)
+
+	results = run_benchmarks(args.quick, args.seed, args.board)
+	if args.output:
+		with open(args.output, 'w') as file:
+			json.dump(results, file, indent=4)
+	else:
+		json.dump(results, sys.stdout, indent=4)
+		print()
+
+	if args.compare:
+		with open(args.compare, 'r') as file:
+			baseline = json.load(file)
+		regressions = compare_results(baseline, results, args.tolerance)
+		for regression in regressions:
+			print(f"Regression: {regression}", file=sys.stderr)
+		if regressions:
+			return 1
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,91 @@
+import copy
+from typing import Dict, Any, List
+from Data.Config import load_spaces
+
+# Spaces that only make sense once per board (turn flow looks them up by type)
+SINGLE_SPACE_TYPES = ["Go", "Jail", "Free_Parking", "Go_To_Jail"]
+
+def standard_spaces() -> List[Dict[str, Any]]:
+	"""
+	Return the bundled spaces.json board definition.
+	"""
+	return load_spaces()
+
+def enlarge_spaces(json_spaces: List[Dict[str, Any]], copies: int) -> List[Dict[str, Any]]:
+	"""
+	Build a larger synthetic board by repeating the ownable and card spaces of a board.
+
+	The first copy is the original board unchanged so card targets (e.g. "Trafalgar Square")
+	still resolve. Every further copy renames its ownable spaces and property groups with a
+	copy suffix, so each copy adds new groups rather than growing the existing ones.
+	Go, Jail, Free Parking and Go To Jail are only kept from the original board.
+
+	:param json_spaces: A spaces.json style list of space definitions.
+	:param copies: How many times the board is repeated (1 returns the board unchanged).
+	:return: The enlarged list of space definitions.
+	"""
+	board = copy.deepcopy(json_spaces)
+	for n in range(1, copies):
+		for space in json_spaces:
+			if space.get("Type") in SINGLE_SPACE_TYPES:
+				continue
+			space = copy.deepcopy(space)
+			if space.get("Type") in ["Property", "Railroad", "Utility"]:
+				space["Name"] = f"{space['Name']} {n}"
+			if "Property_Group" in space:
+				space["Property_Group"] = f"{space['Property_Group']} {n}"
+			board.append(space)
+	return board
+
+def generate_spaces(groups: int, group_size: int = 3) -> List[Dict[str, Any]]:
+	"""
+	Generate a synthetic spaces.json style board of any size, for house-rule and scaling tests.
+
+	Each property group gets prices and rents that rise around the board like the real one.
+	Between groups the board cycles through Chance, a railroad, Community Chest, a tax and a
+	utility, and Jail, Free Parking and Go To Jail sit at the quarter points.
+
+	:param groups: How many property groups to generate.
+	:param group_size: How many properties are in each group.
+	:return: The list of space definitions.
+	"""
+	between = [
+		{"Type": "Card_Space", "Name": "Chance"},
+		{"Type": "Railroad", "Price": 200, "Mortgage": 100, "Rent": 25},
+		{"Type": "Card_Space", "Name": "Community Chest"},
+		{"Type": "Tax", "Name": "Income Tax", "Amount": 200},
+		{"Type": "Utility", "Price": 150, "Mortgage": 75}
+	]
+	ownables: List[Dict[str, Any]] = []
+	for g in range(groups):
+		price = 60 + (340 * g) // max(groups - 1, 1)
+		build_cost = 50 * (1 + (4 * g) // max(groups, 1))
+		base_rent = max(2, price // 25)
+		for p in range(group_size):
+			ownables.append({
+				"Type": "Property",
+				"Name": f"Street {g}-{p}",
+				"Property_Group": f"Group {g}",
+				"Price": price,
+				"Build_Cost": build_cost,
+				"Mortgage": price // 2,
+				"Rent": {str(h): base_rent * m for h, m in enumerate([1, 5, 15, 45, 80, 125])}
+			})
+		space = dict(between[g % len(between)])
+		if space["Type"] in ["Railroad", "Utility"]:
+			space["Name"] = f"{space['Type']} {g}"
+		ownables.append(space)
+
+	board = [{"Type": "Go", "Name": "Go"}]
+	quarter = max(len(ownables) // 4, 1)
+	corners = [
+		{"Type": "Jail", "Name": "Jail"},
+		{"Type": "Free_Parking", "Name": "Free Parking"},
+		{"Type": "Go_To_Jail", "Name": "Go To Jail"}
+	]
+	for i, space in enumerate(ownables):
+		if i and i % quarter == 0 and corners:
+			board.append(corners.pop(0))
+		board.append(space)
+	board.extend(corners)
+	return board
@@ -1,13 +1,13 @@
-from .card import Card_Space
-from .free_parking import Free_Parking
-from .go_to_jail import Go_To_Jail
-from .go import Go
-from .group import Group
-from .jail import Jail
-from .property_group import Property_Group
-from .property import Property, Property_Card
-from .railroad import Railroad, Railroad_Card
-from .tax import Tax
-from .utility import Utility, Utility_Card
-
-__all__ = ["Card_Space", "Free_Parking", "Go_To_Jail", "Go", "Group", "Jail", "Property_Group", "Property", "Property_Card", "Railroad", "Railroad_Card", "Tax", "Utility", "Utility_Card"]
\ No newline at end of file
+from .card import Card_Space
+from .free_parking import Free_Parking
+from .go_to_jail import Go_To_Jail
+from .go import Go
+from .group import Group, MONOPOLY_FORMED, MONOPOLY_BROKEN
+from .jail import Jail
+from .property_group import Property_Group
+from .property import Property, Property_Card
+from .railroad import Railroad, Railroad_Card
+from .tax import Tax
+from .utility import Utility, Utility_Card
+
+__all__ = ["Card_Space", "Free_Parking", "Go_To_Jail", "Go", "Group", "MONOPOLY_FORMED", "MONOPOLY_BROKEN", "Jail", "Property_Group", "Property", "Property_Card", "Railroad", "Railroad_Card", "Tax", "Utility", "Utility_Card"]
\ No newline at end of file
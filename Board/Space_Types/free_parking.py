@@ -1,24 +1,29 @@
-from Board import Space
-from Players import Player
-from Core import Game
-
-class Free_Parking(Space):
-	def __init__(self, name: str, position: int):
-		"""
-		Initialize Free Parking.
-		"""
-		super().__init__(name, position)
-		self.saved_money = 0
-
-	def add_money(self, amount: int) -> None:
-		"""
-		Add money to the Free Parking pot.
-		"""
-		self.saved_money += amount
-
-	def on_land(self, player: "Player", game: "Game") -> None:
-		"""
-		Let the player collect the accumulated money.
-		"""
-		player.collect(self.saved_money)
+from typing import TYPE_CHECKING, Optional
+from Board import Space
+if TYPE_CHECKING:
+	from Board.space_definitions import Space_Definition
+	from Players import Player
+	from Core import Game
+
+class Free_Parking(Space):
+	__slots__ = ("saved_money",)
+
+	def __init__(self, definition: "Space_Definition"):
+		"""
+		Initialize Free Parking.
+		"""
+		super().__init__(definition)
+		self.saved_money = 0
+
+	def add_money(self, amount: int) -> None:
+		"""
+		Add money to the Free Parking pot.
+		"""
+		self.saved_money += amount
+
+	def on_land(self, player: "Player", game: "Game", dice_roll: Optional[int] = None) -> None:
+		"""
+		Let the player collect the accumulated money.
+		"""
+		player.collect(self.saved_money)
 		self.saved_money = 0
\ No newline at end of file
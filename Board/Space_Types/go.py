@@ -1,20 +1,23 @@
-from Board import Space
-from Players import Player
-from Core import Game
-
-class Go(Space):
-	def __init__(self, name: str, position: int, base_salary: int = 200):
-		"""
-		Initialize the Go space.
-		"""
-		super().__init__(name, position)
-		self.base_salary = base_salary
-
-	def on_land(self, player: "Player", game: "Game") -> None:
-		"""
-		When landing on Go, the player collects their salary.
-		If the game config specifies 'double_salary_on_go', an extra amount is added.
-		"""
-		base_salary = 200  # or however your board is configured
-		if game.config.get("Double_Salary_On_Go", False):
-			player.collect(base_salary)
\ No newline at end of file
+from typing import TYPE_CHECKING, Optional
+from Board import Space
+if TYPE_CHECKING:
+	from Board.space_definitions import Space_Definition
+	from Players import Player
+	from Core import Game
+
+class Go(Space):
+	__slots__ = ("base_salary",)
+
+	def __init__(self, definition: "Space_Definition", base_salary: int = 200):
+		"""
+		Initialize the Go space.
+		"""
+		super().__init__(definition)
+		self.base_salary = base_salary
+
+	def on_land(self, player: "Player", game: "Game", dice_roll: Optional[int] = None) -> None:
+		"""
+		Landing on Go does nothing more than passing it: the salary is paid by Board.move_player.
+		(Double_Salary_On_Go is a house rule, see Core.house_rules.)
+		"""
+		pass
\ No newline at end of file
@@ -1,16 +1,21 @@
-from Board import Space
-from Players import Player
-from Core import Game
-
-class Go_To_Jail(Space):
-	def __init__(self, name: str, position: int):
-		"""
-		Initialize the Go To Jail space.
-		"""
-		super().__init__(name, position)
-
-	def on_land(self, player: "Player", game: "Game") -> None:
-		"""
-		Send the player directly to jail.
-		"""
+from typing import TYPE_CHECKING, Optional
+from Board import Space
+if TYPE_CHECKING:
+	from Board.space_definitions import Space_Definition
+	from Players import Player
+	from Core import Game
+
+class Go_To_Jail(Space):
+	__slots__ = ()
+
+	def __init__(self, definition: "Space_Definition"):
+		"""
+		Initialize the Go To Jail space.
+		"""
+		super().__init__(definition)
+
+	def on_land(self, player: "Player", game: "Game", dice_roll: Optional[int] = None) -> None:
+		"""
+		Send the player directly to jail.
+		"""
 		player.go_to_jail(game)
\ No newline at end of file
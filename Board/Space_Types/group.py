@@ -1,74 +1,160 @@
-from Board import Ownable_Space
-from Players import Player
-from typing import Dict, List, Optional
-
-class Group:
-	def __init__(self, colour: str, properties: List["Ownable_Space"] = []):
-		"""
-		Initialize the group.
-
-		:param colour: The group’s colour or identifier.
-		:param properties: A list of ownable space instances belonging to this group.
-		"""
-		self.colour = colour
-		self.properties = properties  # references to Ownable_Space instances
-		self.ownership: Dict["Player", int] = {}  # maps Player -> count of owned spaces
-		self.update_ownership()
-
-	def update_ownership(self) -> None:
-		"""
-		Recalculates and stores the ownership information for this group.
-		This method should be called whenever any property's owner changes.
-		"""
-		self.ownership = {}
-		for prop in self.properties:
-			card = prop.get_card()
-			if card.owner is not None:
-				self.ownership[card.owner] = self.ownership.get(card.owner, 0) + 1
-
-	def owned_by(self) -> Dict["Player", int]:
-		"""
-		Returns the stored dictionary mapping each player to the number of ownable spaces in
-		this group that they currently own.
-
-		:return: A dictionary where the key is a Player and the value is a count.
-		"""
-		return self.ownership
-
-	def is_monopoly(self) -> bool:
-		"""
-		Returns True if any single player owns every ownable space in this group.
-		(Unowned or partially owned groups do not count as a monopoly.)
-
-		:return: True if a monopoly exists, False otherwise.
-		"""
-		total = len(self.properties)
-		for count in self.ownership.values():
-			if count == total:
-				return True
-		return False
-
-	def all_owned_by(self) -> Optional["Player"]:
-		"""
-		If a monopoly exists in this group (i.e. one player owns every ownable space),
-		returns that player. Otherwise, returns None.
-
-		:return: The Player who owns all spaces in the group or None.
-		"""
-		total = len(self.properties)
-		for player, count in self.ownership.items():
-			if count == total:
-				return player
-		return None
-
-	def count_owned(self, player: "Player") -> int:
-		"""
-		Returns the number of ownable spaces in this group that are owned by the given player.
-
-		:param player: The player whose ownership count is requested.
-		:return: The count of spaces owned by the player.
-		"""
-		return self.ownership.get(player, 0)
-
-	def add_property(self, property: "Ownable_Space"):
-		self.properties.append(property)
\ No newline at end of file
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+if TYPE_CHECKING:
+	from Board import Ownable_Space, Board
+	from Players import Player
+
+# Events sent to monopoly listeners
+MONOPOLY_FORMED = "monopoly_formed"
+MONOPOLY_BROKEN = "monopoly_broken"
+
+class Group:
+	def __init__(self, colour: str, properties: Optional[List["Ownable_Space"]] = None):
+		"""
+		Initialize the group.
+
+		:param colour: The group’s colour or identifier.
+		:param properties: A list of ownable space instances belonging to this group.
+		"""
+		self.colour = colour
+		self.properties = properties if properties is not None else []  # references to Ownable_Space instances
+		self.ownership: Dict["Player", int] = {}  # maps Player -> count of owned spaces
+		self.monopoly_owner: Optional["Player"] = None  # the player owning every space, if any
+		self.listeners: List[Callable[["Group", str, "Player"], None]] = []
+		# Bumped on every ownership, building or mortgage change in the group, so derived values
+		# can be cached against it. The board the group belongs to (if any) is bumped too.
+		self.version = 0
+		self.board: Optional["Board"] = None
+		self.recount_ownership()
+
+	def changed(self) -> None:
+		"""
+		Record that the state of a space in this group changed.
+		"""
+		self.version += 1
+		if self.board is not None:
+			self.board.version += 1
+
+	def subscribe(self, listener: Callable[["Group", str, "Player"], None]) -> None:
+		"""
+		Register a function to be called as listener(group, event, player) whenever a monopoly
+		in this group is formed (MONOPOLY_FORMED) or broken (MONOPOLY_BROKEN).
+
+		:param listener: The function to call.
+		"""
+		self.listeners.append(listener)
+
+	def unsubscribe(self, listener: Callable[["Group", str, "Player"], None]) -> None:
+		"""
+		Stop sending monopoly events to a previously subscribed listener.
+		"""
+		if listener in self.listeners:
+			self.listeners.remove(listener)
+
+	def _set_monopoly_owner(self, player: Optional["Player"]) -> None:
+		"""
+		Store the monopoly owner, notifying listeners if it changed.
+		"""
+		previous_owner = self.monopoly_owner
+		if previous_owner is player:
+			return
+		self.monopoly_owner = player
+		if previous_owner is not None:
+			for listener in list(self.listeners):
+				listener(self, MONOPOLY_BROKEN, previous_owner)
+		if player is not None:
+			for listener in list(self.listeners):
+				listener(self, MONOPOLY_FORMED, player)
+
+	def recount_ownership(self) -> None:
+		"""
+		Recalculates the ownership information for this group from scratch.
+		Only needed when the counts can not be trusted, e.g. after properties were added
+		with owners already set. Ownership changes update the counts via update_ownership.
+		"""
+		self.ownership = {}
+		for prop in self.properties:
+			card = prop.get_card()
+			if card is not None and card.owner is not None:
+				self.ownership[card.owner] = self.ownership.get(card.owner, 0) + 1
+		self._refresh_monopoly()
+
+	def _refresh_monopoly(self) -> None:
+		"""
+		Work out the monopoly owner from the ownership counts.
+		"""
+		total = len(self.properties)
+		for player, count in self.ownership.items():
+			if count == total:
+				self._set_monopoly_owner(player)
+				return
+		self._set_monopoly_owner(None)
+
+	def update_ownership(self, previous_owner: Optional["Player"], new_owner: Optional["Player"]) -> None:
+		"""
+		Updates the stored ownership counts when one space in this group changes owner.
+		Called by Ownable_Card whenever its owner is set, so the cost is independent of group size.
+		Also keeps the monopoly owner up to date, notifying listeners when it changes.
+
+		:param previous_owner: The player who owned the space before, or None.
+		:param new_owner: The player who owns the space now, or None.
+		"""
+		if previous_owner is new_owner:
+			return
+		self.changed()
+		if previous_owner is not None:
+			count = self.ownership.get(previous_owner, 0) - 1
+			if count > 0:
+				self.ownership[previous_owner] = count
+			else:
+				self.ownership.pop(previous_owner, None)
+			if previous_owner is self.monopoly_owner:
+				self._set_monopoly_owner(None)
+		if new_owner is not None:
+			count = self.ownership.get(new_owner, 0) + 1
+			self.ownership[new_owner] = count
+			if count == len(self.properties):
+				self._set_monopoly_owner(new_owner)
+
+	def owned_by(self) -> Dict["Player", int]:
+		"""
+		Returns the stored dictionary mapping each player to the number of ownable spaces in
+		this group that they currently own.
+
+		:return: A dictionary where the key is a Player and the value is a count.
+		"""
+		return self.ownership
+
+	def is_monopoly(self) -> bool:
+		"""
+		Returns True if any single player owns every ownable space in this group.
+		(Unowned or partially owned groups do not count as a monopoly.)
+
+		:return: True if a monopoly exists, False otherwise.
+		"""
+		return self.monopoly_owner is not None
+
+	def all_owned_by(self) -> Optional["Player"]:
+		"""
+		If a monopoly exists in this group (i.e. one player owns every ownable space),
+		returns that player. Otherwise, returns None.
+
+		:return: The Player who owns all spaces in the group or None.
+		"""
+		return self.monopoly_owner
+
+	def count_owned(self, player: "Player") -> int:
+		"""
+		Returns the number of ownable spaces in this group that are owned by the given player.
+
+		:param player: The player whose ownership count is requested.
+		:return: The count of spaces owned by the player.
+		"""
+		return self.ownership.get(player, 0)
+
+	def add_property(self, property: "Ownable_Space"):
+		self.properties.append(property)
+		card = property.get_card()
+		if card is not None and card.owner is not None:
+			self.ownership[card.owner] = self.ownership.get(card.owner, 0) + 1
+		# Adding a space changes the group size, so any monopoly has to be rechecked
+		self._refresh_monopoly()
\ No newline at end of file
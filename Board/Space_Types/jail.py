@@ -1,16 +1,21 @@
-from Board import Space
-from Players import Player
-from Core import Game
-
-class Jail(Space):
-	def __init__(self, name: str, position: int):
-		"""
-		Initialize the Jail space.
-		"""
-		super().__init__(name, position)
-
-	def on_land(self, player: "Player", game: "Game") -> None:
-		"""
-		Landing on Jail (just visiting) does nothing.
-		"""
-		pass
+from typing import TYPE_CHECKING, Optional
+from Board import Space
+if TYPE_CHECKING:
+	from Board.space_definitions import Space_Definition
+	from Players import Player
+	from Core import Game
+
+class Jail(Space):
+	__slots__ = ()
+
+	def __init__(self, definition: "Space_Definition"):
+		"""
+		Initialize the Jail space.
+		"""
+		super().__init__(definition)
+
+	def on_land(self, player: "Player", game: "Game", dice_roll: Optional[int] = None) -> None:
+		"""
+		Landing on Jail (just visiting) does nothing.
+		"""
+		pass
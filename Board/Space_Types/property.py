@@ -1,48 +1,88 @@
-from typing import Dict, Optional
-from Board import Ownable_Space, Ownable_Card
-from Space_Types import Property_Group, Property_Card
-
-# Property (colored real-estate)
-class Property(Ownable_Space):
-	def __init__(self, name: str, position: int, buying_price: int, mortgage_value: int,
-				 build_cost: int, group: "Property_Group", rent: Dict[str, int],
-				 card: Optional["Property_Card"] = None):
-		"""
-		Initialize a property space.
-
-		:param build_cost: The cost to build houses/hotels.
-		:param rent: A dictionary mapping the number of buildings (0-5) to rent amounts.
-		:param card: The Property_Card holding the current state.
-		"""
-		super().__init__(name, position, buying_price, mortgage_value, rent, group)
-		self.build_cost = build_cost
-		self.card = card
-
-	def get_card(self) -> "Property_Card":
-		return self.card
-	
-
-
-class Property_Card(Ownable_Card):
-	def __init__(self, property: "Property"):
-		"""
-		Card representing a property that can be built on (houses/hotels).
-
-		:param property: The Property instance this card represents.
-		"""
-		super().__init__(property)
-		self.houses = 0
-
-	def calculate_rent(self, dice_roll: Optional[int] = None) -> int:
-		"""
-		Calculates the rent for a property based on the number of houses.
-		The dice_roll parameter is ignored in this calculation.
-
-		:param dice_roll: Ignored.
-		:return: Rent amount determined from the property's rent table.
-		"""
-		if  self.owner is None or self.mortgaged or (not(self.collect_in_jail) & self.owner.in_jail()):
-			return 0
-		if self.houses == 0 and self.location.group.is_monopoly:
-			return self.location.rent[0] * 2
-		return self.location.rent[self.houses]
\ No newline at end of file
+from typing import TYPE_CHECKING, Optional
+from Board import Ownable_Space, Ownable_Card, HOUSES, MORTGAGED
+if TYPE_CHECKING:
+	from Board.Space_Types import Property_Group
+	from Board.space_definitions import Space_Definition
+
+# Property (colored real-estate)
+class Property(Ownable_Space):
+	__slots__ = ()
+
+	def __init__(self, definition: "Space_Definition", group: "Property_Group",
+				 card: Optional["Property_Card"] = None):
+		"""
+		Initialize a property space. Its rent (definition.rent) maps the number of buildings
+		(0-5) to rent amounts.
+
+		:param card: The Property_Card holding the current state.
+		"""
+		super().__init__(definition, group)
+		self.card = card
+
+	@property
+	def build_cost(self) -> int:
+		"""The cost to build each house or hotel."""
+		return self.definition.build_cost
+
+	def get_card(self) -> "Property_Card":
+		return self.card
+	
+
+
+class Property_Card(Ownable_Card):
+	__slots__ = ()
+
+	def __init__(self, property: "Property", state: Optional[bytearray] = None, index: int = 0):
+		"""
+		Card representing a property that can be built on (houses/hotels).
+
+		:param property: The Property instance this card represents.
+		"""
+		super().__init__(property, state, index)
+
+	@property
+	def houses(self) -> int:
+		return self._state[self.index] & HOUSES
+
+	@houses.setter
+	def houses(self, houses: int) -> None:
+		"""
+		Set the number of houses (5 = hotel), keeping the group's building counts
+		and the owner's net worth and holdings up to date.
+		"""
+		if not 0 <= houses <= 5:
+			raise ValueError(f"A property can have 0 to 5 houses, not {houses}.")
+		state = self._state[self.index]
+		previous_houses = state & HOUSES
+		before = self.wealth_value()
+		zobrist = self.zobrist()
+		if zobrist is not None:
+			zobrist.houses(self.location.position, previous_houses, houses)
+		self._state[self.index] = state & ~HOUSES | houses
+		if self._owner is not None:
+			self._owner.net_worth += self.wealth_value() - before
+			self._owner.owned_properties.update_houses(previous_houses, houses)
+		self.location.group.update_houses(previous_houses, houses)
+
+	def wealth_value(self) -> int:
+		"""
+		As for any ownable card, plus the build cost of each house when not mortgaged.
+		"""
+		state = self._state[self.index]
+		if state & MORTGAGED:
+			return self.location.mortgage_value
+		return self.location.buying_price + (state & HOUSES) * self.location.build_cost
+
+	def calculate_rent(self, dice_roll: Optional[int] = None) -> int:
+		"""
+		Calculates the rent for a property based on the number of houses.
+		The dice_roll parameter is ignored in this calculation.
+
+		:param dice_roll: Ignored.
+		:return: Rent amount determined from the property's rent table.
+		"""
+		if self.owner is None or self.mortgaged or (not self.collect_in_jail and self.owner.in_jail):
+			return 0
+		if self.houses == 0 and self.location.group.is_monopoly():
+			return self.location.rent["0"] * 2
+		return self.location.rent[str(self.houses)]
\ No newline at end of file
@@ -1,47 +1,74 @@
-from Space_Types import Group, Property, Property_Card
-from Players import Player
-from typing import List
-
-class Property_Group(Group):
-	def __init__(self, colour: str, properties: List["Property"]):
-		"""
-		Initialize the property group.
-
-		:param colour: The group’s colour.
-		:param properties: A list of Property instances.
-		"""
-		super().__init__(colour, properties)
-
-	def can_build_house(self, property_card: "Property_Card") -> bool:
-		"""
-		Determines whether a house can be built on the property associated with the given property card.
-		Building a house is allowed only if:
-		  1. The property belongs to this group.
-		  2. The property has an owner.
-		  3. The owner owns every property in this group (i.e. a monopoly exists).
-		  4. Houses are built evenly; the property in question must have the minimum number of houses
-			 among the properties in this group owned by that same owner.
-
-		:param property_card: The Property_Card representing the property's current state.
-		:return: True if a house can be built on the property, False otherwise.
-		"""
-		# Get the cards for all properties in this group.
-		group_cards = [prop.get_card() for prop in self.properties]
-		if property_card not in group_cards:
-			return False  # The property is not part of this group.
-
-		owner = property_card.owner
-		if owner is None:
-			return False  # Cannot build on an unowned property.
-
-		# Ensure that the owner has a monopoly in this group.
-		if self.all_owned_by() != owner:
-			return False
-
-		# Enforce the even building rule:
-		# Find the minimum number of houses among all properties in the group owned by this owner.
-		owner_cards = [card for card in group_cards if card.owner == owner]
-		if not owner_cards:
-			return False  # This should not happen if property_card has an owner.
-		min_houses = min(card.houses for card in owner_cards)
-		return property_card.houses == min_houses
\ No newline at end of file
+from typing import TYPE_CHECKING, List
+from Board.Space_Types.group import Group
+if TYPE_CHECKING:
+	from Board.Space_Types import Property, Property_Card
+	from Players import Player
+
+class Property_Group(Group):
+	def __init__(self, colour: str, properties: List["Property"]):
+		"""
+		Initialize the property group.
+
+		:param colour: The group’s colour.
+		:param properties: A list of Property instances.
+		"""
+		# house_levels[n] is the number of properties in the group with n houses (5 = hotel)
+		self.house_levels: List[int] = [0] * 6
+		super().__init__(colour, properties)
+		for prop in self.properties:
+			self.house_levels[prop.get_card().houses] += 1
+
+	def add_property(self, property: "Property"):
+		super().add_property(property)
+		self.house_levels[property.get_card().houses] += 1
+
+	def update_houses(self, previous_houses: int, houses: int) -> None:
+		"""
+		Updates the stored building counts when the houses on one property in this group change.
+		Called by Property_Card whenever its houses are set.
+
+		:param previous_houses: The number of houses before the change.
+		:param houses: The number of houses after the change.
+		"""
+		self.house_levels[previous_houses] -= 1
+		self.house_levels[houses] += 1
+		self.changed()
+
+	def min_houses(self) -> int:
+		"""
+		Returns the fewest houses on any property in this group.
+		"""
+		for houses, count in enumerate(self.house_levels):
+			if count:
+				return houses
+		return 0
+
+	def can_build_house(self, property_card: "Property_Card") -> bool:
+		"""
+		Determines whether a house can be built on the property associated with the given property card.
+		Building a house is allowed only if:
+		  1. The property belongs to this group.
+		  2. The property has an owner.
+		  3. The owner owns every property in this group (i.e. a monopoly exists).
+		  4. Houses are built evenly; the property in question must have the minimum number of houses
+			 among the properties in this group owned by that same owner.
+
+		Uses the stored ownership and building counts, so the check does not depend on group size.
+
+		:param property_card: The Property_Card representing the property's current state.
+		:return: True if a house can be built on the property, False otherwise.
+		"""
+		if property_card.location.group is not self:
+			return False  # The property is not part of this group.
+
+		owner = property_card.owner
+		if owner is None:
+			return False  # Cannot build on an unowned property.
+
+		# Ensure that the owner has a monopoly in this group.
+		if self.monopoly_owner is not owner:
+			return False
+
+		# Enforce the even building rule. As the owner holds the whole group,
+		# the minimum over the group is the minimum over the owner's properties.
+		return property_card.houses == self.min_houses()
\ No newline at end of file
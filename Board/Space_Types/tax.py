@@ -1,19 +1,26 @@
-from Board import Space
-from Players import Player
-from Core import Game
-
-class Tax(Space):
-	def __init__(self, name: str, position: int, amount: int):
-		"""
-		Initialize a tax space.
-
-		:param amount: The tax amount to be paid.
-		"""
-		super().__init__(name, position)
-		self.amount = amount
-
-	def on_land(self, player: "Player", game: "Game") -> None:
-		"""
-		Charge the player the tax amount.
-		"""
+from typing import TYPE_CHECKING, Optional
+from Board import Space
+if TYPE_CHECKING:
+	from Board.space_definitions import Space_Definition
+	from Players import Player
+	from Core import Game
+
+class Tax(Space):
+	__slots__ = ()
+
+	def __init__(self, definition: "Space_Definition"):
+		"""
+		Initialize a tax space.
+		"""
+		super().__init__(definition)
+
+	@property
+	def amount(self) -> int:
+		"""The tax amount to be paid."""
+		return self.definition.amount
+
+	def on_land(self, player: "Player", game: "Game", dice_roll: Optional[int] = None) -> None:
+		"""
+		Charge the player the tax amount.
+		"""
 		player.pay(self.amount)
\ No newline at end of file
@@ -1,4 +1,5 @@
-from .board import Board
-from .spaces import Space, Ownable_Space, Ownable_Card
-
-__all__ = ["Board", "Space", "Ownable_Space", "Ownable_Card"]
\ No newline at end of file
+from .space_definitions import Space_Definition, space_definitions
+from .spaces import Space, Ownable_Space, Ownable_Card, HOUSES, MORTGAGED
+from .board import Board
+
+__all__ = ["Board", "Space", "Ownable_Space", "Ownable_Card", "HOUSES", "MORTGAGED", "Space_Definition", "space_definitions"]
\ No newline at end of file
@@ -0,0 +1,68 @@
+import json
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union
+
+MAX_CACHED_BOARDS = 16  # Distinct spaces.json layouts kept compiled at once
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Space_Definition:
+	"""
+	The fixed facts about one space as read from spaces.json: never changed once built, and
+	shared by every game played on the same layout, so a game only allocates the spaces' links
+	to its own group, card and deck plus its compact card state (see Board.card_state).
+
+	rent is as in the json, except that a table becomes a read only view; group is the name of
+	the group the space belongs to. Definitions compare by identity, as each game's spaces
+	point at the same ones.
+
+	key responsibilities:
+	- holding a space's name, type, prices and rent table
+	"""
+	type: str
+	name: str
+	position: int
+	price: int = 0
+	mortgage: int = 0
+	build_cost: int = 0
+	rent: Optional[Union[int, Mapping[str, int]]] = None
+	group: str = ""
+	amount: int = 0
+
+# Group every ownable space type belongs to (properties name their own colour group)
+GROUP_NAMES = {"Railroad": "Railroad", "Utility": "Utilities"}
+
+_by_content: Dict[str, Tuple["Space_Definition", ...]] = {}
+
+def _compile(json_spaces: List[Dict[str, Any]]) -> Tuple["Space_Definition", ...]:
+	definitions = []
+	for i, space in enumerate(json_spaces):
+		space_type = space.get("Type")
+		rent = space.get("Rent")
+		definitions.append(Space_Definition(
+			type=space_type,
+			name=space.get("Name"),
+			position=i,
+			price=space.get("Price", 0),
+			mortgage=space.get("Mortgage", 0),
+			build_cost=space.get("Build_Cost", 0),
+			rent=MappingProxyType(dict(rent)) if isinstance(rent, dict) else rent,
+			group=space.get("Property_Group") if space_type == "Property" else GROUP_NAMES.get(space_type, ""),
+			amount=space.get("Amount", 0)
+		))
+	return tuple(definitions)
+
+def space_definitions(json_spaces: List[Dict[str, Any]]) -> Tuple["Space_Definition", ...]:
+	"""
+	The shared definitions of a board's spaces (as loaded from spaces.json), compiled the first
+	time a layout is seen. Layouts are looked up by their content, so any list equal to one
+	seen before gets the same definitions back, and a list changed in place since is compiled
+	afresh.
+	"""
+	key = json.dumps(json_spaces, sort_keys=True)
+	definitions = _by_content.get(key)
+	if definitions is None:
+		if len(_by_content) >= MAX_CACHED_BOARDS:
+			_by_content.clear()
+		definitions = _by_content[key] = _compile(json_spaces)
+	return definitions
@@ -1,117 +1,217 @@
-from abc import ABC, abstractmethod
-from Players import Player
-from Core import Game
-from typing import Dict, Any, Optional
-from Space_Types import Group
-
-
-class Space(ABC):
-	def __init__(self, name: str, position: int):
-		"""
-		Initialize a board space.
-
-		:param name: The name of the space.
-		:param position: The board position index.
-		"""
-		self.name = name
-		self.position = position
-
-	def __str__(self):
-		return f"Name: {self.name}\nPosition: {self.position}"
-	
-	@abstractmethod
-	def on_land(self, player: "Player", game: "Game") -> None:
-		"""
-		Define what happens when a player lands on this space.
-		Must be implemented by subclasses.
-		"""
-		pass
-	
-
-
-
-
-
-
-
-
-# Abstract class for spaces that can be owned
-class Ownable_Space(Space, ABC):
-	def __init__(self, name: str, position: int, buying_price: int,
-				 mortgage_value: int, rent: Dict[str, int], group: "Group"):
-		"""
-		Initialize an ownable space.
-
-		:param name: The name of the space.
-		:param position: The board position index.
-		:param buying_price: The purchase price.
-		:param mortgage_value: The mortgage value.
-		:param group: The group (color or type) to which this property belongs.
-		"""
-		super().__init__(name, position)
-		self.buying_price = buying_price
-		self.mortgage_value = mortgage_value
-		self.rent = rent
-		self.group = group
-
-	def on_land(self, player: "Player", game: "Game") -> None:
-		"""
-		When a player lands on an ownable space:
-		  - If unowned: let the player buy the property (or trigger an auction).
-		  - If owned by another player: charge rent.
-		  - If owned by the same player: do nothing.
-		"""
-		card = self.get_card()
-		if card.owner is None:
-			# Example logic: if the player can afford it, they buy automatically.
-			# Otherwise, the space is auctioned.
-			if player.total_wealth() < self.buying_price:
-				game.bank.auction_propety(game.alive_players())
-			elif player.can_afford(self.buying_price):
-				player.buy_property(self, game)
-		elif card.owner != player:
-			rent = card.calculate_rent()
-			player.pay(rent, card.owner)
-		# If the player owns the property, nothing happens.
-
-	def __str__(self):
-		return f"Name: {self.name}\nPosition: {self.position}\nrent: {self.rent}\nGroup: {self.group.colour}"
-	
-	@abstractmethod
-	def get_card(self) -> "Ownable_Card":
-		"""
-		Return the card (entity) that represents the current state of this property.
-		Must be implemented by subclasses.
-		"""
-		pass
-
-
-
-
-
-
-class Ownable_Card:
-	def __init__(self, location: "Ownable_Space", config: Dict[str, Any]):
-		"""
-		Base card for any ownable space.
-
-		:param location: The ownable space (e.g. Property, Utility, Railroad)
-						 that this card represents.
-		"""
-		self.location = location  # Reference to the ownable space.
-		self.mortgaged = False	# Indicates if the property is mortgaged.
-		self.owner: Optional["Player"] = None		 # The Player instance who owns this property.
-		self.collect_in_jail = config.get("Rent_In_Jail", True)
-
-	def __str__(self):
-		return f"Name: {self.name}\nPosition: {self.position}\nrent: {self.rent}\nMortgage Value: {self.mortgage_value}\nGroup: {self.group.colour}"
-	
-	def calculate_rent(self, dice_roll: Optional[int] = None) -> int:
-		"""
-		Abstract method to calculate rent. For some cards (like utilities), a dice roll
-		value is required for the calculation.
-
-		:param dice_roll: Optional dice roll value, used in certain rent calculations.
-		:return: The rent amount.
-		"""
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Mapping, Optional, Union
+if TYPE_CHECKING:
+	from Players import Player
+	from Core import Game
+	from Core.zobrist import Zobrist
+	from Board.Space_Types import Group
+	from Board.space_definitions import Space_Definition
+
+# Layout of a card's byte in its board's card state (see Board.card_state)
+HOUSES = 0x07  # Houses on the property (5 = hotel)
+MORTGAGED = 0x08
+
+
+class Space(ABC):
+	# Spaces are built for every game, so they carry no per instance dict and hold only their
+	# links to the game; the fixed values are read from the definition shared with the other
+	# games on the same board (see Space_Definition)
+	__slots__ = ("definition",)
+
+	def __init__(self, definition: "Space_Definition"):
+		"""
+		Initialize a board space.
+
+		:param definition: The space's name, position, prices and rent as read from spaces.json.
+		"""
+		self.definition = definition
+
+	@property
+	def name(self) -> str:
+		return self.definition.name
+
+	@property
+	def position(self) -> int:
+		return self.definition.position
+
+	def __str__(self):
+		return f"Name: {self.name}\nPosition: {self.position}"
+	
+	@abstractmethod
+	def on_land(self, player: "Player", game: "Game", dice_roll: Optional[int] = None) -> None:
+		"""
+		Define what happens when a player lands on this space.
+		Must be implemented by subclasses.
+
+		:param dice_roll: The total of the roll that moved the player here, if they rolled
+						  (utility rent is a multiple of it).
+		"""
+		pass
+	
+
+
+
+
+
+
+
+
+# Abstract class for spaces that can be owned
+class Ownable_Space(Space, ABC):
+	__slots__ = ("group", "card")
+
+	def __init__(self, definition: "Space_Definition", group: "Group"):
+		"""
+		Initialize an ownable space.
+
+		:param definition: The space's name, position, prices and rent as read from spaces.json.
+		:param group: The group (color or type) to which this property belongs.
+		"""
+		super().__init__(definition)
+		self.group = group
+		self.card: Optional["Ownable_Card"] = None
+
+	@property
+	def buying_price(self) -> int:
+		return self.definition.price
+
+	@property
+	def mortgage_value(self) -> int:
+		return self.definition.mortgage
+
+	@property
+	def rent(self) -> Optional[Union[int, Mapping[str, int]]]:
+		return self.definition.rent
+
+	def on_land(self, player: "Player", game: "Game", dice_roll: Optional[int] = None) -> None:
+		"""
+		When a player lands on an ownable space:
+		  - If unowned: let the player buy the property (or trigger an auction).
+		  - If owned by another player: charge rent.
+		  - If owned by the same player: do nothing.
+
+		:param dice_roll: The roll that moved the player here; when a card moved them, their
+						  last roll is used.
+		"""
+		card = self.get_card()
+		if card.owner is None:
+			# If the player can afford it, they buy automatically.
+			# Otherwise, the space is auctioned.
+			if player.can_afford(self.buying_price):
+				player.buy_property(self, game)
+			else:
+				game.bank.auction(self, game)
+		elif card.owner != player:
+			if dice_roll is None:
+				dice_roll = player.dice_roll.get("total")
+			rent = card.calculate_rent(dice_roll)
+			player.pay(rent, card.owner)
+		# If the player owns the property, nothing happens.
+
+	def __str__(self):
+		return f"Name: {self.name}\nPosition: {self.position}\nrent: {self.rent}\nGroup: {self.group.colour}"
+	
+	@abstractmethod
+	def get_card(self) -> "Ownable_Card":
+		"""
+		Return the card (entity) that represents the current state of this property.
+		Must be implemented by subclasses.
+		"""
+		pass
+
+
+
+
+
+
+class Ownable_Card:
+	__slots__ = ("location", "_owner", "_state", "index", "collect_in_jail")
+
+	def __init__(self, location: "Ownable_Space", state: Optional[bytearray] = None, index: int = 0):
+		"""
+		Base card for any ownable space.
+
+		:param location: The ownable space (e.g. Property, Utility, Railroad)
+						 that this card represents.
+		:param state: The board's card state the card keeps its houses and mortgage in, one byte
+					  per card (the card gets a byte of its own if None).
+		:param index: The card's byte in state.
+		"""
+		self.location = location  # Reference to the ownable space.
+		self._owner: Optional["Player"] = None		 # The Player instance who owns this property.
+		self._state = state if state is not None else bytearray(1)
+		self.index = index
+		self.collect_in_jail = False  # Whether rent is owed while the owner is in jail (see the Rent_In_Jail house rule)
+
+	@property
+	def owner(self) -> Optional["Player"]:
+		return self._owner
+
+	@owner.setter
+	def owner(self, player: Optional["Player"]) -> None:
+		"""
+		Set the owner, keeping the group's ownership counts and both owners' net worth
+		and holdings up to date.
+		"""
+		previous_owner = self._owner
+		value = self.wealth_value()
+		if previous_owner is not None:
+			previous_owner.net_worth -= value
+			previous_owner.owned_properties.discard(self)
+		self._owner = player
+		if player is not None:
+			player.net_worth += value
+			player.owned_properties.add(self)
+		zobrist = self.zobrist()
+		if zobrist is not None:
+			zobrist.owner(self.location.position, getattr(previous_owner, "seat", None), getattr(player, "seat", None))
+		self.location.group.update_ownership(previous_owner, player)
+
+	@property
+	def mortgaged(self) -> bool:
+		return bool(self._state[self.index] & MORTGAGED)
+
+	@mortgaged.setter
+	def mortgaged(self, mortgaged: bool) -> None:
+		"""
+		Set whether the card is mortgaged, keeping the owner's net worth and holdings up to date.
+		"""
+		before = self.wealth_value()
+		state = self._state[self.index]
+		zobrist = self.zobrist()
+		if zobrist is not None and mortgaged != bool(state & MORTGAGED):
+			zobrist.mortgage(self.location.position)
+		self._state[self.index] = state | MORTGAGED if mortgaged else state & ~MORTGAGED
+		if self._owner is not None:
+			self._owner.net_worth += self.wealth_value() - before
+			self._owner.owned_properties.update_mortgaged(self)
+		self.location.group.changed()
+
+	def zobrist(self) -> Optional["Zobrist"]:
+		"""
+		The state hash of the game this card's board is in, if one is attached.
+		"""
+		board = self.location.group.board
+		return board.zobrist if board is not None else None
+
+	def wealth_value(self) -> int:
+		"""
+		What this card adds to its owner's total wealth: the mortgage value if mortgaged,
+		otherwise the purchase price.
+		"""
+		if self._state[self.index] & MORTGAGED:
+			return self.location.mortgage_value
+		return self.location.buying_price
+
+	def __str__(self):
+		return f"Name: {self.name}\nPosition: {self.position}\nrent: {self.rent}\nMortgage Value: {self.mortgage_value}\nGroup: {self.group.colour}"
+	
+	def calculate_rent(self, dice_roll: Optional[int] = None) -> int:
+		"""
+		Abstract method to calculate rent. For some cards (like utilities), a dice roll
+		value is required for the calculation.
+
+		:param dice_roll: Optional dice roll value, used in certain rent calculations.
+		:return: The rent amount.
+		"""
 		raise NotImplementedError("calculate_rent must be implemented by subclasses")
\ No newline at end of file
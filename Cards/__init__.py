@@ -1,4 +1,4 @@
-from card import Card
-from deck import Deck
-
+from .card import Card
+from .deck import Deck
+
 __all__ = ["Card", "Deck"]
\ No newline at end of file
@@ -1,5 +1,7 @@
-from bank import Bank
-from dice import Dice
-from game import Game
-
-__all__ = ["Bank", "Dice", "Game"]
\ No newline at end of file
+from .bank import Bank
+from .dice import Dice
+from .game import Game
+from .transaction import Transaction
+from .actions import Action_Stack
+
+__all__ = ["Bank", "Dice", "Game", "Transaction", "Action_Stack"]
\ No newline at end of file
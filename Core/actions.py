@@ -0,0 +1,137 @@
+from typing import TYPE_CHECKING, List, Optional
+from Core.transaction import Journal
+if TYPE_CHECKING:
+	from Board.Space_Types import Property
+	from Board import Ownable_Space, Ownable_Card
+	from Players import Player
+	from Core import Game
+
+class Action_Stack(Journal):
+	"""
+	Make/unmake moves for searching ahead: every action is applied straight away and can be
+	undone, most recent first.
+
+	Actions are the bank operations (with the same rule checks as a Transaction) plus pay,
+	collect and move. Each one records only the attributes it changed, so undoing the last k
+	actions costs O(k) whatever the size of the game, and a search can explore a branch and back
+	out of it without copying the Game:
+
+		mark = actions.mark()
+		actions.upgrade(property); actions.pay(player, rent, owner)
+		score = evaluate(game)
+		actions.undo_to(mark)
+
+	Payments move money directly: a player may go negative, and is never liquidated or made
+	bankrupt, so a search can see and score the shortfall. A rejected action raises ValueError
+	(or TypeError) and changes nothing.
+
+	key responsibilities:
+	- applying actions with their inverse deltas recorded
+	- undoing the last k actions
+	"""
+	def __init__(self, game: "Game"):
+		"""
+		:param game: The game the actions are made in (for its bank and Go salary).
+		"""
+		super().__init__(game.bank)
+		self.game = game
+		self.frames: List[int] = []  # journal length before each action
+
+	def __len__(self) -> int:
+		return len(self.frames)
+
+	def _apply(self, operation, *args) -> None:
+		start = len(self.journal)
+		try:
+			operation(*args)
+		except BaseException:
+			self._undo_to(start)
+			raise
+		self.frames.append(start)
+
+	# === Actions ===
+	def pay(self, player: "Player", amount: int, recipient: Optional["Player"] = None) -> None:
+		"""
+		Pay the bank, or another player if a recipient is given.
+		"""
+		self._apply(self._pay, player, amount, recipient)
+
+	def collect(self, player: "Player", amount: int) -> None:
+		"""
+		Collect money from the bank.
+		"""
+		if amount < 0:
+			raise ValueError("Collected amounts can not be negative.")
+		self._apply(self._change_balance, player, amount)
+
+	def transfer_property(self, property: "Ownable_Space", target: Optional["Player"]) -> None:
+		"""
+		Change a property's owner (None returns it to the bank).
+		"""
+		self._apply(self._transfer, property.get_card(), target)
+
+	def upgrade(self, property: "Property") -> None:
+		"""
+		Build one house (or a hotel on 4 houses), paid for by the owner.
+		"""
+		self._apply(self._build, property.get_card())
+
+	def downgrade(self, property: "Property") -> None:
+		"""
+		Sell one house (or a hotel) back to the bank for half its build cost.
+		"""
+		self._apply(self._sell, property.get_card())
+
+	def mortgage(self, card: "Ownable_Card") -> None:
+		self._apply(self._mortgage, card)
+
+	def unmortgage(self, card: "Ownable_Card") -> None:
+		self._apply(self._unmortgage, card)
+
+	def move(self, player: "Player", steps: int) -> None:
+		"""
+		Move a player, collecting the Go salary if a forward move passes Go.
+		Landing effects are not triggered.
+		"""
+		self._apply(self._move, player, steps)
+
+	def _move(self, player: "Player", steps: int) -> None:
+		board = self.game.board
+		position = (player.position + steps) % board.board_size
+		if steps > 0 and position < player.position:
+			self._change_balance(player, board.base_salary)
+		self._set(player, "position", position)
+
+	# === Undo ===
+	def mark(self) -> int:
+		"""
+		The current depth, to undo back to later with undo_to.
+		"""
+		return len(self.frames)
+
+	def undo(self, count: int = 1) -> None:
+		"""
+		Undo the last count actions, most recent first.
+
+		:raises ValueError: If fewer than count actions have been made.
+		"""
+		if count > len(self.frames):
+			raise ValueError(f"Only {len(self.frames)} actions can be undone.")
+		if count <= 0:
+			return
+		start = self.frames[-count]
+		del self.frames[-count:]
+		self._undo_to(start)
+
+	def undo_to(self, mark: int) -> None:
+		"""
+		Undo every action made since mark was taken.
+		"""
+		self.undo(len(self.frames) - mark)
+
+	def clear(self) -> None:
+		"""
+		Forget the history, keeping the current state (nothing can be undone afterwards).
+		"""
+		self.journal = []
+		self.frames = []
@@ -0,0 +1,297 @@
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple
+import numpy as np
+from Board import Ownable_Space
+from Board.Space_Types import Property, Railroad, Utility, Go_To_Jail, Card_Space
+from Board.Space_Types.utility import UTILITY_MULTIPLIERS
+if TYPE_CHECKING:
+	from Core import Game
+	from Board import Board
+	from Players import Player
+
+CONVERGENCE = 1e-10  # Stop the landing probability iteration once it moves less than this
+MAX_ITERATIONS = 1000
+
+class Analytics:
+	"""
+	Rent and investment analytics for a game, computed with NumPy over the whole board at once.
+
+	Combines the long-run probability of landing on each space (from the dice, Go To Jail and
+	the movement cards) with every space's rent table and the current ownership, buildings and
+	mortgages, giving:
+	- expected rent per opponent turn for each space and each player
+	- the return on, and payback time of, the next house on each property
+	- how much a player's income would change by owning a property
+	- the rent of a railroad or utility for a given number owned
+
+	Landing probabilities depend only on the board, so they are computed once. Everything that
+	depends on ownership, buildings or mortgages is cached against Board.version and only
+	recomputed after one of those changes.
+
+	key responsibilities:
+	- expected income and return on investment figures for AI decisions
+	"""
+	def __init__(self, game: "Game"):
+		"""
+		:param game: The game to analyse.
+		"""
+		self.game = game
+		self.board: "Board" = game.board
+		spaces = self.board.spaces
+		size = len(spaces)
+		self.index = {space: i for i, space in enumerate(spaces)}
+
+		# Static tables
+		self.is_property = np.array([isinstance(s, Property) for s in spaces])
+		self.is_railroad = np.array([isinstance(s, Railroad) for s in spaces])
+		self.is_utility = np.array([isinstance(s, Utility) for s in spaces])
+		self.rent_table = np.zeros((size, 6))
+		self.build_cost = np.zeros(size)
+		for i, space in enumerate(spaces):
+			if isinstance(space, Property):
+				self.rent_table[i] = [space.rent[str(h)] for h in range(6)]
+				self.build_cost[i] = space.build_cost
+		self.groups = list(self.board.groups.values())
+		group_ids = {group: g for g, group in enumerate(self.groups)}
+		self.group_index = np.array([group_ids[s.group] if isinstance(s, Ownable_Space) else -1 for s in spaces])
+		self.group_size = np.array([len(group.properties) for group in self.groups])
+
+		self._landing: Optional[np.ndarray] = None
+		self._version = -1
+		self._players: List["Player"] = []
+		self._space_income: Optional[np.ndarray] = None
+		self._player_income: Optional[np.ndarray] = None
+		self._owner: Optional[np.ndarray] = None
+		self._houses: Optional[np.ndarray] = None
+		self._monopoly: Optional[np.ndarray] = None
+
+	@classmethod
+	def for_game(cls, game: "Game") -> "Analytics":
+		"""
+		The game's shared Analytics, created on first use (or when the board is replaced).
+		"""
+		analytics = getattr(game, "analytics", None)
+		if analytics is None or analytics.board is not game.board:
+			analytics = cls(game)
+			game.analytics = analytics
+		return analytics
+
+	def flat_rent(self, space: "Ownable_Space", owned: int) -> float:
+		"""
+		Rent of a railroad or utility whose owner has the given number of its group
+		(a utility's is for an average roll).
+
+		:param space: The railroad or utility.
+		:param owned: How many spaces of its group the owner has.
+		:return: The rent per landing (0 if owned is 0).
+		"""
+		if owned <= 0:
+			return 0.0
+		if isinstance(space, Utility):
+			dice = self.game.dice
+			table = space.rent if isinstance(space.rent, Mapping) else UTILITY_MULTIPLIERS
+			return table.get(str(owned), 0) * dice.number * (dice.size + 1) / 2
+		if isinstance(space.rent, Mapping):
+			return space.rent.get(str(owned), 0)
+		return space.rent * 2 ** (owned - 1)  # Railroads: 25, 50, 100, 200
+
+	# === Landing probabilities ===
+	def _roll_distribution(self) -> Dict[int, float]:
+		"""
+		Probability of each total of the standard dice.
+		"""
+		dice = self.game.dice
+		totals = {0: 1.0}
+		for _ in range(dice.number):
+			rolled: Dict[int, float] = {}
+			for total, p in totals.items():
+				for face in range(1, dice.size + 1):
+					rolled[total + face] = rolled.get(total + face, 0) + p / dice.size
+			totals = rolled
+		return totals
+
+	def _redirects(self) -> List[Tuple[int, List[Tuple[int, float]]]]:
+		"""
+		For every space that moves the player on (Go To Jail, movement cards), where they end up
+		and with what probability. Probability left over means staying put.
+		"""
+		spaces = self.board.spaces
+		size = len(spaces)
+		redirects = []
+		for i, space in enumerate(spaces):
+			if isinstance(space, Go_To_Jail):
+				redirects.append((i, [(self.board.jail, 1.0)]))
+			elif isinstance(space, Card_Space) and space.deck is not None and space.deck.cards:
+				moves: Dict[int, float] = {}
+				share = 1 / len(space.deck.cards)
+				for card in space.deck.cards:
+					effect = card.effect
+					kind = effect.get("Type")
+					target = None
+					if kind == "go_to_jail":
+						target = self.board.jail
+					elif kind == "advance_to":
+						found = self.board.find_by_name(effect["Target"])
+						target = found.position if found else None
+					elif kind == "advance_steps":
+						target = (i + int(effect["Amount"])) % size
+					elif kind == "advance_to_nearest":
+						kind_of = Utility if effect["Target"] == "Utility" else Railroad
+						ahead = [s.position for s in spaces if isinstance(s, kind_of)]
+						if ahead:
+							target = min(ahead, key=lambda position: (position - i) % size)
+					if target is not None:
+						moves[target] = moves.get(target, 0) + share
+				if moves:
+					redirects.append((i, list(moves.items())))
+		return redirects
+
+	def landing_probabilities(self) -> np.ndarray:
+		"""
+		Long-run probability of ending a move on each space, found by iterating the movement
+		Markov chain to its stationary distribution. Computed once per board.
+		"""
+		if self._landing is not None:
+			return self._landing
+		size = len(self.board.spaces)
+		rolls = self._roll_distribution()
+		redirects = self._redirects()
+		pi = np.full(size, 1 / size)
+		for _ in range(MAX_ITERATIONS):
+			moved = np.zeros(size)
+			for total, p in rolls.items():
+				moved += p * np.roll(pi, total)
+			for source, targets in redirects:
+				mass = moved[source]
+				for target, p in targets:
+					moved[source] -= mass * p
+					moved[target] += mass * p
+			if np.abs(moved - pi).sum() < CONVERGENCE:
+				pi = moved
+				break
+			pi = moved
+		self._landing = pi / pi.sum()
+		return self._landing
+
+	# === State dependent figures ===
+	def _refresh(self) -> None:
+		"""
+		Recompute the ownership dependent arrays if the board has changed since last time.
+		"""
+		players = self.game.players
+		if self._version == self.board.version and self._players == players:
+			return
+		spaces = self.board.spaces
+		size = len(spaces)
+		player_ids = {player: p for p, player in enumerate(players)}
+		owner = np.full(size, -1)
+		houses = np.zeros(size, dtype=int)
+		mortgaged = np.zeros(size, dtype=bool)
+		group_rent = np.zeros(size)  # Railroad and utility rent, which depends on how many the owner has
+		for space in self.board.ownable_spaces:
+			i = self.index[space]
+			card = space.get_card()
+			if card.owner is not None:
+				owner[i] = player_ids.get(card.owner, -1)
+			houses[i] = getattr(card, "houses", 0)
+			mortgaged[i] = card.mortgaged
+			if isinstance(space, (Railroad, Utility)) and card.owner is not None:
+				group_rent[i] = self.flat_rent(space, space.group.count_owned(card.owner))
+
+		owned = owner >= 0
+		# Monopoly: the owner holds every space of the group
+		counts = np.zeros((len(self.groups), max(len(players), 1)))
+		np.add.at(counts, (self.group_index[owned], owner[owned]), 1)
+		monopoly = np.zeros(size, dtype=bool)
+		monopoly[owned] = counts[self.group_index[owned], owner[owned]] == self.group_size[self.group_index[owned]]
+
+		rent = self.rent_table[np.arange(size), houses]
+		rent = np.where(self.is_property & (houses == 0) & monopoly, rent * 2, rent)
+		rent = np.where(self.is_railroad | self.is_utility, group_rent, rent)
+		rent = np.where(owned & ~mortgaged, rent, 0.0)
+
+		self._owner = owner
+		self._houses = houses
+		self._monopoly = monopoly
+		self._space_income = self.landing_probabilities() * rent
+		self._player_income = np.bincount(owner[owned], weights=self._space_income[owned], minlength=len(players))
+		self._players = list(players)
+		self._version = self.board.version
+
+	def space_income(self) -> np.ndarray:
+		"""
+		Expected rent each space collects per opponent turn.
+		"""
+		self._refresh()
+		return self._space_income
+
+	def player_income(self, player: "Player") -> float:
+		"""
+		Expected rent a player collects per opponent turn.
+		"""
+		self._refresh()
+		if player not in self._players:
+			return 0.0
+		return float(self._player_income[self._players.index(player)])
+
+	def income_by_player(self) -> Dict["Player", float]:
+		"""
+		Expected rent per opponent turn for every player.
+		"""
+		self._refresh()
+		return {player: float(income) for player, income in zip(self._players, self._player_income)}
+
+	def house_returns(self) -> np.ndarray:
+		"""
+		Extra expected rent per opponent turn, per pound of build cost, from the next house on each
+		space (zero where nothing can be built). The first house is measured against the doubled
+		unimproved monopoly rent it replaces.
+		"""
+		self._refresh()
+		size = len(self.board.spaces)
+		houses = self._houses
+		can_build = self.is_property & self._monopoly & (houses < 5)
+		current = self.rent_table[np.arange(size), houses]
+		current = np.where(houses == 0, current * 2, current)
+		following = self.rent_table[np.arange(size), np.minimum(houses + 1, 5)]
+		gain = self.landing_probabilities() * (following - current)
+		cost = np.where(self.build_cost > 0, self.build_cost, 1)
+		return np.where(can_build, gain / cost, 0.0)
+
+	def build_return(self, property: "Property") -> float:
+		"""
+		Extra expected rent per opponent turn, per pound, from the next house on a property.
+		"""
+		return float(self.house_returns()[self.index[property]])
+
+	def payback_turns(self, property: "Property", opponents: int = 1) -> float:
+		"""
+		Opponent turns (shared between the given number of opponents) for the next house on a
+		property to pay for itself. Infinite if it would never pay back.
+		"""
+		rate = self.build_return(property) * opponents
+		return 1 / rate if rate > 0 else float("inf")
+
+	def ownership_gain(self, player: "Player", property: "Ownable_Space", houses: int = 0) -> float:
+		"""
+		How much a player's expected rent per opponent turn would rise if they owned a property
+		(with the group's other spaces as they are now). If it would complete a property monopoly,
+		the whole group is valued with the given number of houses, so callers can value a
+		monopoly's potential rather than its bare unimproved rent.
+		"""
+		p = self.landing_probabilities()
+		group = property.group
+		held = [card.location for card in player.owned_properties.in_group(group)]
+		after = held + [property] if property not in held else held
+		if isinstance(property, Property):
+			def income(spaces: List["Property"]) -> float:
+				full = len(spaces) == len(group.properties)
+				level = houses if full else 0
+				total = 0.0
+				for space in spaces:
+					rent = space.rent[str(level)] * (2 if full and level == 0 else 1)
+					total += p[self.index[space]] * rent
+				return total
+			return income(after) - income(held)
+		# Railroads and utilities: rent scales with how many of the group the owner has
+		held_income = sum(p[self.index[s]] for s in held) * self.flat_rent(property, len(held))
+		return sum(p[self.index[s]] for s in after) * self.flat_rent(property, len(after)) - held_income
@@ -1,192 +1,309 @@
-from Space_Types import Property_Card, Property_Group, Property, Ownable_Space
-from Players import Player, AI
-from Core import Game
-from typing import Dict
-
-class Bank:
-	def __init__(self, houses: int, hotels: int):
-		self.houses = houses
-		self.hotels = hotels
-
-	def upgrade_property(self, property_card: "Property_Card"):
-		"""
-		Upgrade a property by adding a house or converting to a hotel.
-		"""
-		property = property_card.location
-		group = property.group
-
-		if not isinstance(group, Property_Group):
-			raise TypeError("Only properties in a Property_Group can be upgraded.")
-
-		if not group.can_build_house(property_card):
-			raise ValueError("Cannot build on this property now (monopoly or even build rules violated).")
-
-		if property_card.houses < 4:
-			if self.houses <= 0:
-				raise ValueError("No houses left in the bank.")
-			self.houses -= 1
-			property_card.houses += 1
-		elif property_card.houses == 4:
-			if self.hotels <= 0:
-				raise ValueError("No hotels left in the bank.")
-			self.houses += 4  # Return 4 houses to the bank
-			self.hotels -= 1
-			property_card.houses = 5  # 5 = hotel
-		else:
-			raise ValueError("Maximum upgrade (hotel) already reached.")
-
-	def downgrade_property(self, property_card: "Property_Card"):
-		"""
-		Downgrade a property by selling a house or hotel.
-		"""
-		if property_card.houses == 0:
-			raise ValueError("No houses or hotels to sell.")
-		elif property_card.houses == 5:
-			self.hotels += 1
-			self.houses -= 4  # Convert hotel to 4 houses
-			property_card.houses = 4
-		else:
-			self.houses += 1
-			property_card.houses -= 1
-
-		# Optional: Give half the build cost back to the player
-		property_card.owner.collect(property_card.location.build_cost // 2)
-
-	def downgrade_property_group_bankrupt(self, property: "Property"):
-		"""
-		Downgrade all buildings in a group when a player goes bankrupt.
-		"""
-		group = property.group
-		for location in group.properties:
-			card = location.get_card()
-			if hasattr(card, 'houses') and card.houses > 0:
-				if card.houses == 5:
-					self.hotels += 1
-					card.houses = 0
-				else:
-					self.houses += card.houses
-					card.houses = 0
-
-	def liquidate_player(self, player: "Player"):
-		"""
-		Handles complete liquidation of a player's assets.
-		"""
-		for card in player.owned_properties:
-			if hasattr(card, 'houses') and card.houses > 0:
-				self.downgrade_property(card)
-			if not card.mortgaged:
-				player.mortgage_property(card)
-		player.bankrupt = True
-
-	def transfer_property(self, property: "Property", target: "Player"):
-		"""
-		Transfer ownership of a single property to a player.
-		"""
-		card = property.get_card()
-		card.owner = target
-		target.owned_properties.append(card)
-		property.group.update_ownership()
-
-	def transfer_property_multiple(self, properties: list["Property"], target: "Player"):
-		"""
-		Transfer multiple properties to a player.
-		"""
-		for prop in properties:
-			self.transfer_property(prop, target)
-
-	def offer_trade(self, proposer: "Player", target: "Player"):
-		#/////////////////////
-		proposer_resources = proposer.get_resources()
-		target_resources = target.get_resources()
-		give = {
-			"Money": 0,
-			"Get_Out_Of_Jail_Free_Card": (False, False),
-			"Properties": []
-		}
-		recieve = {
-			"Money": 0,
-			"Get_Out_Of_Jail_Free_Card": (False, False),
-			"Properties": []
-		}
-		self.trade(target, give, recieve)
-
-	def to_dict(self) -> Dict[str, str]:
-		return {
-			"houses": self.houses,
-			"hotels": self.hotels
-		}
-	
-	def auction(self, location: "Ownable_Space", game: "Game"):
-		bidders = [p for p in game.players if not p.bankrupt]
-		if not bidders:
-			print("No eligible players for the auction.")
-			return
-
-		current_index = game.current_turn
-		highest_bid = 0
-		highest_bidder = None
-		active_bidders = {p: True for p in bidders}
-
-		print(f"Auction starting for {location.name} (starting at £0)...")
-		while sum(active_bidders.values()) > 1:
-			current_player = bidders[current_index % len(bidders)]
-
-			# Skip if they've withdrawn
-			if not active_bidders[current_player]:
-				current_index += 1
-				continue
-
-			print(f"{current_player.name}'s turn. Highest bid: £{highest_bid} by {highest_bidder.name if highest_bidder else 'None'}")
-			
-			if isinstance(current_player, AI):
-				bid_cap = current_player.evaluate_property_value(location, game)
-				if bid_cap > highest_bid:
-					increment = min(100, max(10, bid_cap - highest_bid))
-					highest_bid = highest_bid + increment
-					highest_bidder = current_player
-					print(f"{current_player.name} (AI) bids £{highest_bid}")
-				else:
-					print(f"{current_player.name} (AI) withdraws.")
-					active_bidders[current_player] = False
-			else:
-				action = input(f"{current_player.name}, choose: pass / withdraw / +10 / +50 / +100 / bid [amount]: ").strip().lower()
-
-			if action == "withdraw":
-				print(f"{current_player.name} has withdrawn from the auction.")
-				active_bidders[current_player] = False
-
-			elif action == "pass":
-				print(f"{current_player.name} passes this round.")
-
-			elif action in ["+10", "+50", "+100"]:
-				bid = highest_bid + int(action[1:])
-				if current_player.can_afford(bid):
-					highest_bid = bid
-					highest_bidder = current_player
-					print(f"{current_player.name} bids £{bid}")
-				else:
-					print("Insufficient funds. Automatically withdrawn.")
-					active_bidders[current_player] = False
-
-			elif action.startswith("bid "):
-				try:
-					bid = int(action.split()[1])
-					if bid > highest_bid and current_player.can_afford(bid):
-						highest_bid = bid
-						highest_bidder = current_player
-						print(f"{current_player.name} bids £{bid}")
-					else:
-						print("Invalid or too low bid.")
-				except ValueError:
-					print("Invalid bid format.")
-			else:
-				print("Invalid input.")
-
-			current_index += 1
-
-		if highest_bidder:
-			highest_bidder.pay(highest_bid)
-			game.bank.transfer_property(location, highest_bidder)
-			print(f"{highest_bidder.name} wins {location.name} for £{highest_bid}!")
-		else:
+from typing import TYPE_CHECKING, Any, Dict, List
+from Board.Space_Types import Property_Group
+if TYPE_CHECKING:
+	from Board import Ownable_Space
+	from Board.Space_Types import Property_Card, Property
+	from Players import Player
+	from Core import Game
+
+class Bank:
+	def __init__(self, houses: int, hotels: int):
+		self.houses = houses
+		self.hotels = hotels
+
+	def upgrade_property(self, property_card: "Property_Card"):
+		"""
+		Upgrade a property by adding a house or converting to a hotel.
+		"""
+		property = property_card.location
+		group = property.group
+
+		if not isinstance(group, Property_Group):
+			raise TypeError("Only properties in a Property_Group can be upgraded.")
+
+		if not group.can_build_house(property_card):
+			raise ValueError("Cannot build on this property now (monopoly or even build rules violated).")
+
+		if property_card.houses < 4:
+			if self.houses <= 0:
+				raise ValueError("No houses left in the bank.")
+			self.houses -= 1
+			property_card.houses += 1
+		elif property_card.houses == 4:
+			if self.hotels <= 0:
+				raise ValueError("No hotels left in the bank.")
+			self.houses += 4  # Return 4 houses to the bank
+			self.hotels -= 1
+			property_card.houses = 5  # 5 = hotel
+		else:
+			raise ValueError("Maximum upgrade (hotel) already reached.")
+
+	def apply_builds(self, player: "Player", plan: List["Property"]) -> None:
+		"""
+		Apply a sequence of builds (e.g. from plan_builds) as a single transaction.
+
+		The whole plan is checked first against the even build rule, monopolies, mortgages (no
+		building in a group with a mortgaged property), the bank's house and hotel stock and the
+		player's balance. Nothing is changed unless every step is legal,
+		then the buildings are placed and the player pays the total build cost once.
+
+		:param player: The player building.
+		:param plan: The properties to build on, in order (once per house or hotel).
+		:raises ValueError: If any step of the plan is not allowed.
+		"""
+		houses = self.houses
+		hotels = self.hotels
+		cost = 0
+		levels: Dict["Property_Group", List[int]] = {}  # Simulated house_levels per touched group
+		cards: Dict["Property_Card", int] = {}  # Simulated houses per touched card
+
+		for property in plan:
+			group = property.group
+			card = property.get_card()
+			if not isinstance(group, Property_Group):
+				raise TypeError("Only properties in a Property_Group can be upgraded.")
+			if card.owner is not player or group.all_owned_by() is not player:
+				raise ValueError(f"{player.name} does not have a monopoly on {property.name}.")
+
+			if group not in levels and any(p.get_card().mortgaged for p in group.properties):
+				raise ValueError(f"Cannot build on {property.name} while its group has a mortgaged property.")
+			group_levels = levels.setdefault(group, list(group.house_levels))
+			current = cards.setdefault(card, card.houses)
+			if current != next(h for h, count in enumerate(group_levels) if count):
+				raise ValueError(f"Cannot build on {property.name} now (even build rule violated).")
+			if current < 4:
+				if houses <= 0:
+					raise ValueError("No houses left in the bank.")
+				houses -= 1
+			elif current == 4:
+				if hotels <= 0:
+					raise ValueError("No hotels left in the bank.")
+				hotels -= 1
+				houses += 4
+			else:
+				raise ValueError(f"Maximum upgrade (hotel) already reached on {property.name}.")
+
+			group_levels[current] -= 1
+			group_levels[current + 1] += 1
+			cards[card] = current + 1
+			cost += property.build_cost
+
+		if not player.can_afford(cost):
+			raise ValueError(f"{player.name} can not afford £{cost} of builds.")
+
+		self.houses = houses
+		self.hotels = hotels
+		for card, card_houses in cards.items():
+			card.houses = card_houses
+		player.pay(cost)
+
+	def downgrade_property(self, property_card: "Property_Card"):
+		"""
+		Downgrade a property by selling a house or hotel.
+		"""
+		if property_card.houses == 0:
+			raise ValueError("No houses or hotels to sell.")
+		elif property_card.houses == 5:
+			self.hotels += 1
+			self.houses -= 4  # Convert hotel to 4 houses
+			property_card.houses = 4
+		else:
+			self.houses += 1
+			property_card.houses -= 1
+
+		# Optional: Give half the build cost back to the player
+		property_card.owner.collect(property_card.location.build_cost // 2)
+
+	def downgrade_property_group_bankrupt(self, property: "Property"):
+		"""
+		Downgrade all buildings in a group when a player goes bankrupt.
+		"""
+		group = property.group
+		for location in group.properties:
+			card = location.get_card()
+			if hasattr(card, 'houses') and card.houses > 0:
+				if card.houses == 5:
+					self.hotels += 1
+					card.houses = 0
+				else:
+					self.houses += card.houses
+					card.houses = 0
+
+	def transaction(self) -> "Transaction":
+		"""
+		Start a batch of operations that is applied atomically (see Core/transaction.py).
+		Use as `with bank.transaction() as tx: tx.pay(...)...` to commit when the block ends.
+		"""
+		from Core.transaction import Transaction
+		return Transaction(self)
+
+	def liquidate_player(self, player: "Player"):
+		"""
+		Handles complete liquidation of a player's assets.
+		All buildings are sold evenly (highest first) before anything is mortgaged,
+		and the whole liquidation is applied as one transaction.
+		"""
+		tx = self.transaction()
+		cards = [card for card in player.owned_properties.unmortgaged if getattr(card, 'houses', 0) > 0]
+		# Staged sells see the state left by earlier ones, so sell in rounds from the top down
+		levels = {card: card.houses for card in cards}
+		for houses in range(5, 0, -1):
+			for card in cards:
+				if levels[card] == houses:
+					tx.sell(card.location)
+					levels[card] -= 1
+		for card in player.owned_properties.unmortgaged:
+			tx.mortgage(card)
+		tx.commit()
+		player.bankrupt = True
+
+	def transfer_property(self, property: "Property", target: "Player"):
+		"""
+		Transfer ownership of a single property to a player.
+		"""
+		card = property.get_card()
+		card.owner = target  # Also moves the card between holdings and updates the group's counts
+
+	def transfer_property_multiple(self, properties: list["Property"], target: "Player"):
+		"""
+		Transfer multiple properties to a player.
+		"""
+		for prop in properties:
+			self.transfer_property(prop, target)
+
+	def offer_trade(self, proposer: "Player", target: "Player", give: Dict[str, Any], recieve: Dict[str, Any], game: "Game") -> bool:
+		"""
+		Offer a trade to a player and carry it out if they accept.
+		AI players decide with is_trade_worth_it, human players are asked.
+
+		:param proposer: The player proposing the trade.
+		:param target: The player being offered it.
+		:param give: What the proposer gives ("Money", "Get_Out_Of_Jail_Free_Card", "Properties").
+		:param recieve: What the proposer wants in return, in the same format.
+		:return: True if the trade was accepted and carried out.
+		"""
+		from Players import AI
+		if isinstance(target, AI):
+			accepted = target.is_trade_worth_it(give, recieve, game)
+		else:
+			print(f"{proposer.name} offers £{give['Money']} and {[p.name for p in give['Properties']]}")
+			print(f"for £{recieve['Money']} and {[p.name for p in recieve['Properties']]}.")
+			accepted = input(f"{target.name}, accept? (y/n): ").strip().lower() == "y"
+		if accepted:
+			self.trade(proposer, target, give, recieve)
+		return accepted
+
+	def trade(self, proposer: "Player", target: "Player", give: Dict[str, Any], recieve: Dict[str, Any]):
+		"""
+		Carry out a trade as a single transaction: money, "Get Out of Jail Free" cards and
+		properties all change hands, or (if either side can not honour it) nothing does.
+
+		:param proposer: The player proposing the trade.
+		:param target: The player accepting it.
+		:param give: What the proposer gives ("Money", "Get_Out_Of_Jail_Free_Card", "Properties").
+		:param recieve: What the proposer receives, in the same format.
+		:raises ValueError: If the trade is not valid; nothing is changed.
+		"""
+		for player, offer in [(proposer, give), (target, recieve)]:
+			for property in offer["Properties"]:
+				if property.get_card().owner is not player:
+					raise ValueError(f"{player.name} does not own {property.name}.")
+			for has_card, offered in zip(player.get_out_of_jail_free_cards, offer["Get_Out_Of_Jail_Free_Card"]):
+				if offered and not has_card:
+					raise ValueError(f"{player.name} does not have that Get Out of Jail Free card.")
+
+		def after_trade(cards, lost, gained):
+			return tuple((has and not out) or got for has, out, got in zip(cards, lost, gained))
+
+		tx = self.transaction()
+		tx.pay(proposer, give["Money"], target)
+		tx.pay(target, recieve["Money"], proposer)
+		tx.set_jail_cards(proposer, after_trade(proposer.get_out_of_jail_free_cards, give["Get_Out_Of_Jail_Free_Card"], recieve["Get_Out_Of_Jail_Free_Card"]))
+		tx.set_jail_cards(target, after_trade(target.get_out_of_jail_free_cards, recieve["Get_Out_Of_Jail_Free_Card"], give["Get_Out_Of_Jail_Free_Card"]))
+		for property in give["Properties"]:
+			tx.transfer(property, target)
+		for property in recieve["Properties"]:
+			tx.transfer(property, proposer)
+		tx.commit()
+
+	def to_dict(self) -> Dict[str, str]:
+		return {
+			"houses": self.houses,
+			"hotels": self.hotels
+		}
+	
+	def auction(self, location: "Ownable_Space", game: "Game"):
+		from Players import AI
+		bidders = [p for p in game.players if not p.bankrupt]
+		if not bidders:
+			print("No eligible players for the auction.")
+			return
+
+		current_index = game.current_turn
+		highest_bid = 0
+		highest_bidder = None
+		active_bidders = {p: True for p in bidders}
+
+		print(f"Auction starting for {location.name} (starting at £0)...")
+		while sum(active_bidders.values()) > 1:
+			current_player = bidders[current_index % len(bidders)]
+
+			# Skip if they've withdrawn, or already hold the highest bid
+			if not active_bidders[current_player] or current_player is highest_bidder:
+				current_index += 1
+				continue
+
+			print(f"{current_player.name}'s turn. Highest bid: £{highest_bid} by {highest_bidder.name if highest_bidder else 'None'}")
+			
+			if isinstance(current_player, AI):
+				bid_cap = current_player.evaluate_property_value(location, game)
+				if bid_cap > highest_bid:
+					increment = min(100, max(10, bid_cap - highest_bid))
+					highest_bid = highest_bid + increment
+					highest_bidder = current_player
+					print(f"{current_player.name} (AI) bids £{highest_bid}")
+				else:
+					print(f"{current_player.name} (AI) withdraws.")
+					active_bidders[current_player] = False
+			else:
+				action = input(f"{current_player.name}, choose: pass / withdraw / +10 / +50 / +100 / bid [amount]: ").strip().lower()
+
+				if action == "withdraw":
+					print(f"{current_player.name} has withdrawn from the auction.")
+					active_bidders[current_player] = False
+
+				elif action == "pass":
+					print(f"{current_player.name} passes this round.")
+
+				elif action in ["+10", "+50", "+100"]:
+					bid = highest_bid + int(action[1:])
+					if current_player.can_afford(bid):
+						highest_bid = bid
+						highest_bidder = current_player
+						print(f"{current_player.name} bids £{bid}")
+					else:
+						print("Insufficient funds. Automatically withdrawn.")
+						active_bidders[current_player] = False
+
+				elif action.startswith("bid "):
+					try:
+						bid = int(action.split()[1])
+						if bid > highest_bid and current_player.can_afford(bid):
+							highest_bid = bid
+							highest_bidder = current_player
+							print(f"{current_player.name} bids £{bid}")
+						else:
+							print("Invalid or too low bid.")
+					except ValueError:
+						print("Invalid bid format.")
+				else:
+					print("Invalid input.")
+
+			current_index += 1
+
+		if highest_bidder:
+			highest_bidder.pay(highest_bid)
+			game.bank.transfer_property(location, highest_bidder)
+			print(f"{highest_bidder.name} wins {location.name} for £{highest_bid}!")
+		else:
 			print("Auction ended with no valid bids.")
\ No newline at end of file
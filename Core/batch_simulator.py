@@ -0,0 +1,640 @@
+from multiprocessing import Pool
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from Data.Config import load_config, load_spaces, load_chance, load_community_chest, compile_config
+from Core.shared_tables import Shared_Tables
+
+# Space kinds
+OTHER, PROPERTY, RAILROAD, UTILITY, TAX, CHANCE, COMMUNITY_CHEST, GO_TO_JAIL = range(8)
+SPACE_KINDS = {"Property": PROPERTY, "Railroad": RAILROAD, "Utility": UTILITY, "Tax": TAX, "Go_To_Jail": GO_TO_JAIL}
+# Card kinds
+NO_EFFECT, ADVANCE_TO, NEAREST_RAILROAD, NEAREST_UTILITY, ADVANCE_STEPS, COLLECT, PAY, PAY_BUILDINGS, PAY_PLAYERS, JAIL_FREE, CARD_TO_JAIL = range(11)
+
+UTILITY_MULTIPLIERS = {"1": 4, "2": 10}  # Used when a utility has no rent table
+NEAREST_UTILITY_MULTIPLIER = 10  # Dice multiplier paid after "advance to nearest utility"
+NEAREST_RAILROAD_FACTOR = 2  # Rent factor paid after "advance to nearest railroad"
+MAX_CARD_CHAIN = 3  # Card moves followed in one turn (e.g. back 3 spaces onto another card space)
+
+# The compiled rules, as shared between processes (see Batch_Simulator.tables)
+RULES = ("starting_amount", "base_salary", "bail", "max_jail_turns", "rent_in_jail", "build_in_jail", "unmortgage_in_jail",
+		 "double_salary_on_go", "house_supply", "hotel_supply", "dice_size", "dice_number", "speed_dice", "speed_faces",
+		 "size", "jail", "group_count", "config_hash")
+TABLES = ("kind", "price", "mortgage_value", "build_cost", "rent", "tax", "group", "group_size", "ownable",
+		  "railroad_rent", "utility_multiplier", "next_railroad", "next_utility")
+DECK_COLUMNS = ("kind", "amount", "target", "house", "hotel")
+
+class Batch_Simulator:
+	"""
+	Plays thousands of games at once as rows of NumPy arrays, one turn of every game per step.
+
+	The full object model (Game, Player, Board, ...) is not used: each game is a row of
+	positions, balances, jail state, ownership, houses, mortgages and deck cursors, and a step
+	rolls every game's dice, moves, pays Go salary, rent and tax and resolves cards with array
+	operations over all games still running. The rules (board, rents, cards, salary, bail,
+	dice and house rules) are compiled from the same spaces.json, card json and config.json
+	the Game is built from.
+
+	Every player follows one simple, fast policy: buy an unowned space when it leaves at least
+	buy_reserve, leave jail with a card or bail when possible, unmortgage and then build one
+	house per monopoly per turn while at least build_reserve is left, and raise cash by selling
+	houses and mortgaging (bankruptcy returns everything to the bank). Auctions, trades and the
+	speed die's Bus and Monopoly Man faces are not modelled.
+
+	key responsibilities:
+	- compiling the rules into lookup arrays
+	- advancing every game a turn at a time
+	- reporting winners, turn counts, balances and landing counts
+	"""
+	def __init__(self, games: int, players: int, data: Optional[Dict[str, Any]] = None, seed: int = 0,
+				 buy_reserve: int = 0, build_reserve: int = 200, tables: Optional["Shared_Tables"] = None):
+		"""
+		:param games: Number of games played side by side.
+		:param players: Players per game.
+		:param data: Game data (Config, Spaces, Chance, Comunity_Chest) as Game takes it,
+					 defaults to the bundled json files.
+		:param seed: Seed for the dice and deck shuffles.
+		:param buy_reserve: Cash a player keeps when buying.
+		:param build_reserve: Cash a player keeps when unmortgaging and building.
+		:param tables: Already compiled rules published by another simulator (see tables), used
+					   in place of data without copying them.
+		"""
+		self.games = games
+		self.players = players
+		self.seed = seed
+		self.buy_reserve = buy_reserve
+		self.build_reserve = build_reserve
+		self.rng = np.random.default_rng(seed)
+		if tables is not None:
+			self._load_tables(tables.arrays, tables.values)
+		else:
+			if data is None:
+				data = {"Config": load_config(), "Spaces": load_spaces(), "Chance": load_chance(), "Comunity_Chest": load_community_chest()}
+			self._compile_rules(data["Config"])
+			self._compile_board(data["Spaces"])
+			self.decks = [self._compile_deck(data["Chance"]), self._compile_deck(data["Comunity_Chest"])]
+		self.reset()
+
+	# === Rules ===
+	def _compile_rules(self, config: Dict[str, Any]) -> None:
+		rules = compile_config(config)
+		self.config_hash = rules.hash  # Tags recorded games with the rules they were played under
+		self.starting_amount = rules.starting_amount
+		self.base_salary = rules.base_salary
+		self.bail = rules.bail_amount
+		self.max_jail_turns = rules.max_turns_in_jail
+		self.rent_in_jail = rules.rent_in_jail
+		self.build_in_jail = rules.build_in_jail
+		self.unmortgage_in_jail = rules.unmortgage_in_jail
+		self.double_salary_on_go = rules.double_salary_on_go
+		self.house_supply = rules.houses
+		self.hotel_supply = rules.hotels
+		self.dice_size = rules.dice_size
+		self.dice_number = rules.dice_number
+		speed = rules.speed_dice
+		self.speed_dice = speed.active
+		# Faces of the speed die that move the player (the rest are Bus and Monopoly Man)
+		self.speed_faces = self.dice_size - speed.bus_count - speed.monopoly_man_count
+
+	def _compile_board(self, spaces: List[Dict[str, Any]]) -> None:
+		size = len(spaces)
+		self.size = size
+		self.kind = np.zeros(size, dtype=np.int8)
+		self.price = np.zeros(size, dtype=np.int64)
+		self.mortgage_value = np.zeros(size, dtype=np.int64)
+		self.build_cost = np.zeros(size, dtype=np.int64)
+		self.rent = np.zeros((size, 6), dtype=np.int64)
+		self.tax = np.zeros(size, dtype=np.int64)
+		self.group = np.full(size, -1)
+		self.names: Dict[str, int] = {}
+		groups: Dict[str, int] = {}
+		railroad_rent = None
+		utility_rent = None
+		self.jail = 0
+		for i, space in enumerate(spaces):
+			space_type = space.get("Type")
+			self.names[space.get("Name")] = i
+			self.kind[i] = SPACE_KINDS.get(space_type, OTHER)
+			if space_type == "Card_Space":
+				self.kind[i] = CHANCE if space.get("Name") == "Chance" else COMMUNITY_CHEST
+			elif space_type == "Jail":
+				self.jail = i
+			elif space_type == "Tax":
+				self.tax[i] = int(space.get("Amount", 0))
+			if space_type in ("Property", "Railroad", "Utility"):
+				group_name = space.get("Property_Group") if space_type == "Property" else space_type
+				self.group[i] = groups.setdefault(group_name, len(groups))
+				self.price[i] = space.get("Price", 0)
+				self.mortgage_value[i] = space.get("Mortgage", 0)
+			if space_type == "Property":
+				self.build_cost[i] = space.get("Build_Cost", 0)
+				self.rent[i] = [space["Rent"][str(h)] for h in range(6)]
+			elif space_type == "Railroad":
+				railroad_rent = space.get("Rent")
+			elif space_type == "Utility":
+				utility_rent = space.get("Rent") or UTILITY_MULTIPLIERS
+
+		self.group_count = len(groups)
+		self.group_size = np.bincount(self.group[self.group >= 0], minlength=self.group_count)
+		self.ownable = np.flatnonzero(self.group >= 0)
+		self.property_groups = [np.flatnonzero((self.group == g) & (self.kind == PROPERTY)) for g in range(self.group_count)]
+		self.property_groups = [members for members in self.property_groups if len(members)]
+		# Rent by how many of the group the owner has (index 0 unused)
+		counts = np.arange(max(self.group_size.max(initial=0), 1) + 1)
+		if isinstance(railroad_rent, dict):
+			self.railroad_rent = np.array([railroad_rent.get(str(c), 0) for c in counts])
+		else:
+			self.railroad_rent = np.where(counts > 0, (railroad_rent or 0) * 2 ** np.maximum(counts - 1, 0), 0)
+		utility_rent = utility_rent or UTILITY_MULTIPLIERS
+		self.utility_multiplier = np.array([utility_rent.get(str(c), 0) for c in counts])
+		# Next railroad and utility from every space (for the "advance to nearest" cards)
+		self.next_railroad = self._next_of(RAILROAD)
+		self.next_utility = self._next_of(UTILITY)
+
+	def _next_of(self, kind: int) -> np.ndarray:
+		targets = np.flatnonzero(self.kind == kind)
+		if not len(targets):
+			return np.arange(self.size)
+		ahead = (targets[None, :] - np.arange(self.size)[:, None] - 1) % self.size
+		return targets[np.argmin(ahead, axis=1)]
+
+	def _compile_deck(self, cards: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+		count = len(cards)
+		deck = {name: np.zeros(count, dtype=np.int64) for name in ("kind", "amount", "target", "house", "hotel")}
+		for i, card in enumerate(cards):
+			effect = card["Effect"]
+			effect_type = effect.get("Type")
+			if effect_type == "advance_to":
+				deck["kind"][i] = ADVANCE_TO
+				deck["target"][i] = self.names[effect["Target"]]
+			elif effect_type == "advance_to_nearest":
+				deck["kind"][i] = NEAREST_UTILITY if effect["Target"] == "Utility" else NEAREST_RAILROAD
+			elif effect_type == "advance_steps":
+				deck["kind"][i] = ADVANCE_STEPS
+				deck["amount"][i] = int(effect["Amount"])
+			elif effect_type in ("collect_money", "pay_money", "pay_money_to_players"):
+				deck["kind"][i] = {"collect_money": COLLECT, "pay_money": PAY, "pay_money_to_players": PAY_PLAYERS}[effect_type]
+				deck["amount"][i] = int(effect["Amount"])
+			elif effect_type == "pay_money_buildings":
+				deck["kind"][i] = PAY_BUILDINGS
+				deck["house"][i] = int(effect.get("House_Price", effect.get("house", 0)))
+				deck["hotel"][i] = int(effect.get("Hotel_Price", effect.get("hotel", 0)))
+			elif effect_type == "get_out_of_jail_free":
+				deck["kind"][i] = JAIL_FREE
+			elif effect_type == "go_to_jail":
+				deck["kind"][i] = CARD_TO_JAIL
+		return deck
+
+	def tables(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+		"""
+		The compiled rules as (arrays, scalars), to publish with Shared_Tables.publish and hand to
+		other simulators as tables. None of them change during play.
+		"""
+		arrays = {name: getattr(self, name) for name in TABLES}
+		for d, deck in enumerate(self.decks):
+			for column in DECK_COLUMNS:
+				arrays[f"deck{d}_{column}"] = deck[column]
+		values = {name: getattr(self, name) for name in RULES}
+		values["decks"] = len(self.decks)
+		return arrays, values
+
+	def _load_tables(self, arrays: Dict[str, np.ndarray], values: Dict[str, Any]) -> None:
+		for name in RULES:
+			setattr(self, name, values[name])
+		for name in TABLES:
+			setattr(self, name, arrays[name])
+		self.decks = [{column: arrays[f"deck{d}_{column}"] for column in DECK_COLUMNS} for d in range(values["decks"])]
+		self.property_groups = [np.flatnonzero((self.group == g) & (self.kind == PROPERTY)) for g in range(self.group_count)]
+		self.property_groups = [members for members in self.property_groups if len(members)]
+
+	# === State ===
+	def reset(self) -> None:
+		"""
+		Start every game from the beginning.
+		"""
+		n, p = self.games, self.players
+		self.position = np.zeros((n, p), dtype=np.int64)
+		self.balance = np.full((n, p), self.starting_amount, dtype=np.int64)
+		self.alive = np.ones((n, p), dtype=bool)
+		self.in_jail = np.zeros((n, p), dtype=bool)
+		self.jail_turns = np.zeros((n, p), dtype=np.int64)
+		self.owner = np.full((n, self.size), -1, dtype=np.int64)
+		self.houses = np.zeros((n, self.size), dtype=np.int64)
+		self.mortgaged = np.zeros((n, self.size), dtype=bool)
+		self.owned_in_group = np.zeros((n, p, self.group_count), dtype=np.int64)
+		self.house_supply_left = np.full(n, self.house_supply, dtype=np.int64)
+		self.hotel_supply_left = np.full(n, self.hotel_supply, dtype=np.int64)
+		self.current = np.zeros(n, dtype=np.int64)
+		self.doubles = np.zeros(n, dtype=np.int64)
+		self.turns = np.zeros(n, dtype=np.int64)
+		self.finished = np.zeros(n, dtype=bool)
+		self.landings = np.zeros((n, self.size), dtype=np.int64)
+		# Per deck: each game's shuffled order, its cursor, and who holds its jail card (-1 nobody)
+		self.deck_order = [self.rng.permuted(np.tile(np.arange(len(deck["kind"])), (n, 1)), axis=1) for deck in self.decks]
+		self.deck_cursor = [np.zeros(n, dtype=np.int64) for _ in self.decks]
+		self.jail_card_holder = np.full((n, len(self.decks)), -1, dtype=np.int64)
+
+	# === Money ===
+	def _pay(self, rows: np.ndarray, payers: np.ndarray, amounts: np.ndarray, payees: Optional[np.ndarray] = None) -> None:
+		"""
+		Charge payers (one per row), raising cash or going bankrupt if they can not cover it.
+		A payee (-1 for the bank) receives what the payer could actually pay.
+		"""
+		amounts = np.broadcast_to(np.asarray(amounts, dtype=np.int64), rows.shape)
+		self.balance[rows, payers] -= amounts
+		short = self.balance[rows, payers] < 0
+		if short.any():
+			self._raise_cash(rows[short], payers[short])
+		unpaid = np.maximum(-self.balance[rows, payers], 0)
+		if payees is not None:
+			to_player = payees >= 0
+			np.add.at(self.balance, (rows[to_player], payees[to_player]), (amounts - unpaid)[to_player])
+		broke = unpaid > 0
+		if broke.any():
+			self._bankrupt(rows[broke], payers[broke])
+
+	def _raise_cash(self, rows: np.ndarray, players: np.ndarray) -> None:
+		"""
+		Sell houses, then mortgage, until each player's balance is back to zero (or nothing is left).
+		"""
+		for space in self.ownable:
+			need = (self.balance[rows, players] < 0) & (self.owner[rows, space] == players) & (self.houses[rows, space] > 0)
+			if need.any():
+				r, p = rows[need], players[need]
+				levels = self.houses[r, space]
+				hotel = levels == 5
+				self.hotel_supply_left[r[hotel]] += 1
+				self.house_supply_left[r[~hotel]] += levels[~hotel]
+				self.balance[r, p] += levels * self.build_cost[space] // 2
+				self.houses[r, space] = 0
+		for space in self.ownable:
+			need = (self.balance[rows, players] < 0) & (self.owner[rows, space] == players) & ~self.mortgaged[rows, space]
+			if need.any():
+				r, p = rows[need], players[need]
+				self.mortgaged[r, space] = True
+				self.balance[r, p] += self.mortgage_value[space]
+
+	def _bankrupt(self, rows: np.ndarray, players: np.ndarray) -> None:
+		"""
+		Knock players out, returning everything they own to the bank.
+		"""
+		self.alive[rows, players] = False
+		self.balance[rows, players] = 0
+		self.in_jail[rows, players] = False
+		self.owned_in_group[rows, players] = 0
+		for d in range(len(self.decks)):
+			held = self.jail_card_holder[rows, d] == players
+			self.jail_card_holder[rows[held], d] = -1
+		owned = self.owner[rows] == players[:, None]
+		levels = np.where(owned, self.houses[rows], 0)
+		self.hotel_supply_left[rows] += (levels == 5).sum(axis=1)
+		self.house_supply_left[rows] += np.where(levels == 5, 0, levels).sum(axis=1)
+		self.owner[rows] = np.where(owned, -1, self.owner[rows])
+		self.houses[rows] = np.where(owned, 0, self.houses[rows])
+		self.mortgaged[rows] = np.where(owned, False, self.mortgaged[rows])
+
+	def _send_to_jail(self, rows: np.ndarray, players: np.ndarray) -> None:
+		self.position[rows, players] = self.jail
+		self.in_jail[rows, players] = True
+		self.jail_turns[rows, players] = 0
+		self.doubles[rows] = 0
+
+	def _move_to(self, rows: np.ndarray, players: np.ndarray, targets: np.ndarray, forwards: bool = True) -> None:
+		"""
+		Move players to spaces, paying Go salary if a forward move passes Go.
+		"""
+		if forwards:
+			passed = targets < self.position[rows, players]
+			self.balance[rows[passed], players[passed]] += self.base_salary
+			if self.double_salary_on_go:
+				on_go = targets == 0
+				self.balance[rows[on_go], players[on_go]] += self.base_salary
+		self.position[rows, players] = targets
+
+	# === Landing ===
+	def _land(self, rows: np.ndarray, players: np.ndarray, totals: np.ndarray, nearest: Optional[np.ndarray] = None, depth: int = 0) -> None:
+		"""
+		Resolve landing on the current space for each (game, player).
+
+		:param totals: The dice totals (for utility rent).
+		:param nearest: Rows moved by an "advance to nearest" card (special rent).
+		"""
+		alive = self.alive[rows, players]
+		rows, players, totals = rows[alive], players[alive], totals[alive]
+		nearest = nearest[alive] if nearest is not None else np.zeros(len(rows), dtype=bool)
+		spaces = self.position[rows, players]
+		np.add.at(self.landings, (rows, spaces), 1)
+		kinds = self.kind[spaces]
+
+		ownable = self.group[spaces] >= 0
+		if ownable.any():
+			self._land_ownable(rows[ownable], players[ownable], spaces[ownable], totals[ownable], nearest[ownable])
+
+		taxed = kinds == TAX
+		if taxed.any():
+			self._pay(rows[taxed], players[taxed], self.tax[spaces[taxed]])
+
+		jailed = kinds == GO_TO_JAIL
+		if jailed.any():
+			self._send_to_jail(rows[jailed], players[jailed])
+
+		for d, kind in enumerate((CHANCE, COMMUNITY_CHEST)):
+			drawing = kinds == kind
+			if drawing.any():
+				self._draw(d, rows[drawing], players[drawing], totals[drawing], depth)
+
+	def _land_ownable(self, rows: np.ndarray, players: np.ndarray, spaces: np.ndarray, totals: np.ndarray, nearest: np.ndarray) -> None:
+		owners = self.owner[rows, spaces]
+		groups = self.group[spaces]
+
+		# Buy unowned spaces the player can afford
+		buying = (owners < 0) & (self.balance[rows, players] - self.price[spaces] >= self.buy_reserve)
+		if buying.any():
+			r, p, s = rows[buying], players[buying], spaces[buying]
+			self.balance[r, p] -= self.price[s]
+			self.owner[r, s] = p
+			self.owned_in_group[r, p, self.group[s]] += 1
+
+		# Pay rent to other owners
+		safe_owner = np.maximum(owners, 0)
+		charging = (owners >= 0) & (owners != players) & ~self.mortgaged[rows, spaces]
+		if not self.rent_in_jail:
+			charging &= ~self.in_jail[rows, safe_owner]
+		if not charging.any():
+			return
+		r, p, s, o, g = rows[charging], players[charging], spaces[charging], owners[charging], groups[charging]
+		t, near = totals[charging], nearest[charging]
+		kinds = self.kind[s]
+		count = self.owned_in_group[r, o, g]
+		levels = self.houses[r, s]
+		rent = self.rent[s, levels]
+		monopoly = count == self.group_size[g]
+		rent = np.where((kinds == PROPERTY) & (levels == 0) & monopoly, rent * 2, rent)
+		railroad = self.railroad_rent[count] * np.where(near, NEAREST_RAILROAD_FACTOR, 1)
+		rent = np.where(kinds == RAILROAD, railroad, rent)
+		utility = np.where(near, NEAREST_UTILITY_MULTIPLIER, self.utility_multiplier[count]) * t
+		rent = np.where(kinds == UTILITY, utility, rent)
+		self._pay(r, p, rent, o)
+
+	def _draw(self, d: int, rows: np.ndarray, players: np.ndarray, totals: np.ndarray, depth: int) -> None:
+		"""
+		Draw a card from deck d for each (game, player) and apply it.
+		"""
+		deck = self.decks[d]
+		cursor = self.deck_cursor[d]
+		cards = self.deck_order[d][rows, cursor[rows]]
+		cursor[rows] = (cursor[rows] + 1) % len(deck["kind"])
+		kinds = deck["kind"][cards]
+		amounts = deck["amount"][cards]
+		spaces = self.position[rows, players]
+
+		def select(kind: int) -> np.ndarray:
+			return kinds == kind
+
+		moved = np.zeros(len(rows), dtype=bool)
+		nearest = np.zeros(len(rows), dtype=bool)
+		for kind, targets in ((ADVANCE_TO, deck["target"][cards]), (NEAREST_RAILROAD, self.next_railroad[spaces]),
+							  (NEAREST_UTILITY, self.next_utility[spaces])):
+			m = select(kind)
+			if m.any():
+				self._move_to(rows[m], players[m], targets[m])
+				moved |= m
+				nearest |= m & (kind != ADVANCE_TO)
+		m = select(ADVANCE_STEPS)
+		if m.any():
+			self._move_to(rows[m], players[m], (spaces[m] + amounts[m]) % self.size, forwards=False)
+			forward = m & (amounts > 0) & (spaces + amounts >= self.size)
+			self.balance[rows[forward], players[forward]] += self.base_salary
+			moved |= m
+
+		m = select(COLLECT)
+		self.balance[rows[m], players[m]] += amounts[m]
+		m = select(PAY)
+		if m.any():
+			self._pay(rows[m], players[m], amounts[m])
+		m = select(PAY_BUILDINGS)
+		if m.any():
+			r, p = rows[m], players[m]
+			owned = self.owner[r] == p[:, None]
+			levels = np.where(owned, self.houses[r], 0)
+			hotels = (levels == 5).sum(axis=1)
+			houses = np.where(levels == 5, 0, levels).sum(axis=1)
+			self._pay(r, p, houses * deck["house"][cards[m]] + hotels * deck["hotel"][cards[m]])
+		m = select(PAY_PLAYERS)
+		if m.any():
+			for other in range(self.players):
+				paying = m & (players != other) & self.alive[rows, other] & self.alive[rows, players]
+				if paying.any():
+					self._pay(rows[paying], players[paying], amounts[paying], np.full(paying.sum(), other))
+		m = select(JAIL_FREE) & (self.jail_card_holder[rows, d] < 0)
+		self.jail_card_holder[rows[m], d] = players[m]
+		m = select(CARD_TO_JAIL)
+		if m.any():
+			self._send_to_jail(rows[m], players[m])
+
+		if moved.any() and depth < MAX_CARD_CHAIN:
+			self._land(rows[moved], players[moved], totals[moved], nearest[moved], depth + 1)
+
+	# === Turn ===
+	def _roll(self, count: int) -> tuple:
+		dice = self.rng.integers(1, self.dice_size + 1, (count, self.dice_number))
+		totals = dice.sum(axis=1)
+		doubles = (dice == dice[:, :1]).all(axis=1) if self.dice_number > 1 else np.zeros(count, dtype=bool)
+		if self.speed_dice:
+			speed = self.rng.integers(1, self.dice_size + 1, count)
+			totals += np.where(~doubles & (speed <= self.speed_faces), speed, 0)
+		return totals, doubles
+
+	def _end_of_turn(self, rows: np.ndarray, players: np.ndarray) -> None:
+		"""
+		Unmortgage, then build one house per monopoly, keeping build_reserve in cash.
+		"""
+		free = ~self.in_jail[rows, players]
+		unmortgaging = free if not self.unmortgage_in_jail else np.ones(len(rows), dtype=bool)
+		for space in np.flatnonzero(self.mortgaged[rows].any(axis=0)):
+			cost = self.mortgage_value[space] * 11 // 10
+			m = unmortgaging & self.mortgaged[rows, space] & (self.owner[rows, space] == players) \
+				& (self.balance[rows, players] - cost >= self.build_reserve)
+			self.mortgaged[rows[m], space] = False
+			self.balance[rows[m], players[m]] -= cost
+
+		building = free if not self.build_in_jail else np.ones(len(rows), dtype=bool)
+		for members in self.property_groups:
+			g = self.group[members[0]]
+			m = building & (self.owned_in_group[rows, players, g] == len(members))
+			if not m.any():
+				continue
+			r, p = rows[m], players[m]
+			levels = self.houses[r][:, members]
+			unmortgaged = ~self.mortgaged[r][:, members].any(axis=1)
+			pick = members[np.argmin(levels, axis=1)]
+			level = levels.min(axis=1)
+			cost = self.build_cost[pick]
+			stock = np.where(level < 4, self.house_supply_left[r] > 0, self.hotel_supply_left[r] > 0)
+			ok = unmortgaged & (level < 5) & stock & (self.balance[r, p] - cost >= self.build_reserve)
+			r, p, pick, level, cost = r[ok], p[ok], pick[ok], level[ok], cost[ok]
+			self.balance[r, p] -= cost
+			self.houses[r, pick] += 1
+			hotel = level == 4
+			self.house_supply_left[r] += np.where(hotel, 4, -1)
+			self.hotel_supply_left[r[hotel]] -= 1
+
+	def step(self) -> int:
+		"""
+		Play one turn in every unfinished game.
+
+		:return: The number of games still running.
+		"""
+		rows = np.flatnonzero(~self.finished)
+		if not len(rows):
+			return 0
+		players = self.current[rows]
+
+		# Jail: use a card, else pay bail, else try for doubles
+		jailed = self.in_jail[rows, players]
+		totals, doubles = self._roll(len(rows))
+		if jailed.any():
+			for d in range(len(self.decks)):
+				card = jailed & (self.jail_card_holder[rows, d] == players)
+				self.jail_card_holder[rows[card], d] = -1
+				self.in_jail[rows[card], players[card]] = False
+				jailed &= ~card
+			bail = jailed & (self.balance[rows, players] >= self.bail)
+			self.balance[rows[bail], players[bail]] -= self.bail
+			self.in_jail[rows[bail], players[bail]] = False
+			jailed &= ~bail
+			self.in_jail[rows[jailed & doubles], players[jailed & doubles]] = False
+			trying = jailed & ~doubles
+			self.jail_turns[rows[trying], players[trying]] += 1
+			served = trying & (self.jail_turns[rows, players] >= self.max_jail_turns)
+			if served.any():
+				self.in_jail[rows[served], players[served]] = False
+				self._pay(rows[served], players[served], np.full(served.sum(), self.bail))
+			stays = trying & ~served
+		else:
+			stays = np.zeros(len(rows), dtype=bool)
+		left_jail = jailed & ~stays  # Doubles out of jail do not give another turn
+
+		# Three doubles in a row go to jail
+		rolling_doubles = doubles & ~jailed
+		self.doubles[rows] = np.where(rolling_doubles, self.doubles[rows] + 1, 0)
+		speeding = rolling_doubles & (self.doubles[rows] >= 3)
+		if speeding.any():
+			self._send_to_jail(rows[speeding], players[speeding])
+
+		moving = ~stays & ~speeding & self.alive[rows, players]
+		r, p, t = rows[moving], players[moving], totals[moving]
+		self._move_to(r, p, (self.position[r, p] + t) % self.size)
+		self._land(r, p, t)
+
+		active = self.alive[rows, players]
+		self._end_of_turn(rows[active], players[active])
+
+		# Doubles (not out of jail, not sent back to jail) give the same player another turn
+		again = rolling_doubles & ~speeding & ~left_jail & self.alive[rows, players] & ~self.in_jail[rows, players]
+		self.doubles[rows[~again]] = 0
+		advance = rows[~again]
+		for _ in range(self.players):
+			if not len(advance):
+				break
+			self.current[advance] = (self.current[advance] + 1) % self.players
+			advance = advance[~self.alive[advance, self.current[advance]]]
+
+		self.turns[rows] += 1
+		self.finished[rows] = self.alive[rows].sum(axis=1) <= 1
+		return int((~self.finished).sum())
+
+	def run(self, max_turns: int = 1000) -> Dict[str, np.ndarray]:
+		"""
+		Play every game until it ends or reaches max_turns turns.
+
+		:return: See results.
+		"""
+		while self.step():
+			self.finished |= self.turns >= max_turns
+		return self.results()
+
+	# === Results ===
+	def net_worth(self) -> np.ndarray:
+		"""
+		Each player's cash plus property (price, or mortgage value if mortgaged) and buildings,
+		shape (games, players).
+		"""
+		value = np.where(self.mortgaged, self.mortgage_value, self.price) + self.houses * self.build_cost
+		worth = self.balance.copy()
+		owned = self.owner >= 0
+		rows = np.nonzero(owned)[0]
+		np.add.at(worth, (rows, self.owner[owned]), value[owned])
+		return np.where(self.alive, worth, 0)
+
+	def results(self) -> Dict[str, np.ndarray]:
+		"""
+		:return: winner (the last player standing, else the wealthiest; -1 if nobody is left),
+				 turns, balances (games x players), landings (games x spaces).
+		"""
+		worth = np.where(self.alive, self.net_worth(), -1)
+		winner = np.where(self.alive.any(axis=1), np.argmax(worth, axis=1), -1)
+		return {"winner": winner, "turns": self.turns.copy(), "balances": self.balance.copy(), "landings": self.landings.copy()}
+
+	def record(self, store: "Results_Store", config_hash: Optional[int] = None) -> None:
+		"""
+		Append every game to a Results_Store's games table (seed column: the batch seed times
+		the number of games plus the game's row).
+
+		:param config_hash: Hash the games are tagged with, defaults to the compiled config's.
+		"""
+		from Core.results_store import MAX_PLAYERS
+		if config_hash is None:
+			config_hash = self.config_hash
+		results = self.results()
+		balances = np.zeros((self.games, MAX_PLAYERS), dtype=np.int64)
+		balances[:, :min(self.players, MAX_PLAYERS)] = results["balances"][:, :MAX_PLAYERS]
+		store.games.append({
+			"seed": self.seed * self.games + np.arange(self.games),
+			"config_hash": np.full(self.games, config_hash, dtype=np.uint64),
+			"winner": results["winner"],
+			"turns": results["turns"],
+			"players": np.full(self.games, self.players),
+			"final_balances": balances,
+			"landings": results["landings"]
+		})
+
+# === Multiprocess ===
+_worker_tables: Optional["Shared_Tables"] = None  # The tables a worker process attached to
+
+def _attach_worker(handle: Tuple) -> None:
+	global _worker_tables
+	_worker_tables = Shared_Tables.attach(handle)
+
+def _simulate_batch(task: Tuple[int, int, int, int, int, int]) -> Dict[str, np.ndarray]:
+	"""
+	Play one batch on the worker's shared tables. Runs in a worker process.
+
+	:param task: (games, players, seed, max turns, buy reserve, build reserve).
+	"""
+	games, players, seed, max_turns, buy_reserve, build_reserve = task
+	simulator = Batch_Simulator(games, players, seed=seed, buy_reserve=buy_reserve,
+								build_reserve=build_reserve, tables=_worker_tables)
+	return simulator.run(max_turns)
+
+def simulate_parallel(batches: int, games: int, players: int, max_turns: int = 1000, workers: Optional[int] = None,
+					  data: Optional[Dict[str, Any]] = None, seed: int = 0, buy_reserve: int = 0,
+					  build_reserve: int = 200) -> Dict[str, np.ndarray]:
+	"""
+	Play batches of Batch_Simulator games over a pool of worker processes.
+
+	The rules are compiled once here and published in shared memory; each worker attaches to
+	them once when it starts, so the tasks sent to it are just seeds, and memory per worker
+	does not grow with the size of the board or the number of workers.
+
+	:param batches: Batches to play (batch b is seeded seed + b).
+	:param games: Games per batch.
+	:param workers: Worker processes (defaults to every core).
+	:return: The batches' results (see Batch_Simulator.results) concatenated in batch order.
+	"""
+	compiled = Batch_Simulator(1, players, data)
+	arrays, values = compiled.tables()
+	tasks = [(games, players, seed + b, max_turns, buy_reserve, build_reserve) for b in range(batches)]
+	with Shared_Tables.publish(arrays, values) as tables:
+		with Pool(workers, initializer=_attach_worker, initargs=(tables.handle(),)) as pool:
+			parts = pool.map(_simulate_batch, tasks)
+	return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
@@ -0,0 +1,88 @@
+import heapq
+from typing import TYPE_CHECKING, Dict, List, Tuple
+from Board.Space_Types import Property_Group
+if TYPE_CHECKING:
+	from Board.Space_Types import Property
+	from Players import Player
+
+def rent_gain(property: "Property", houses: int) -> int:
+	"""
+	The extra rent a property charges after building its next house (or hotel).
+	An unimproved property in a monopoly already charges double rent, so the first
+	house only gains the difference from that.
+
+	:param property: The property being built on.
+	:param houses: The number of houses on it before the build.
+	:return: The increase in rent.
+	"""
+	current = property.rent[str(houses)] * (2 if houses == 0 else 1)
+	return property.rent[str(houses + 1)] - current
+
+def plan_builds(player: "Player", budget: int, houses: int, hotels: int) -> List["Property"]:
+	"""
+	Plan the builds a player should make this turn across all their monopolies in one pass.
+
+	Every step of the plan is legal when applied in order: it only builds on a property with the
+	fewest houses in its group (the even build rule), never in a group with a mortgaged property,
+	stays within the budget, and never uses more houses or hotels than the bank has at that point
+	(a hotel returns its 4 houses to the bank).
+	Steps are chosen greedily by rent gained per pound spent, always from the properties that can
+	legally be built on next, so the planner never has to back out of a choice.
+
+	:param player: The player building.
+	:param budget: The most the player is willing to spend.
+	:param houses: Houses left in the bank.
+	:param hotels: Hotels left in the bank.
+	:return: The properties to build on, in order (a property appears once per build).
+	"""
+	groups: Dict["Property_Group", Dict["Property", int]] = {}
+	for group in player.owned_properties.groups():
+		if isinstance(group, Property_Group) and group.all_owned_by() is player \
+				and not any(prop.get_card().mortgaged for prop in group.properties):
+			groups[group] = {prop: prop.get_card().houses for prop in group.properties}
+
+	# One candidate per group: its best next build among the properties at the group's minimum
+	heap: List[Tuple[float, int, "Property_Group"]] = []
+	order = 0
+
+	def push(group: "Property_Group") -> None:
+		nonlocal order
+		levels = groups[group]
+		lowest = min(levels.values())
+		if lowest >= 5:
+			return
+		prop = max((p for p, h in levels.items() if h == lowest), key=lambda p: rent_gain(p, lowest))
+		ratio = rent_gain(prop, lowest) / prop.build_cost
+		heapq.heappush(heap, (-ratio, order, group))
+		order += 1
+
+	for group in groups:
+		push(group)
+
+	plan: List["Property"] = []
+	waiting: List["Property_Group"] = []  # Groups blocked until a hotel frees up houses
+	while heap:
+		_, _, group = heapq.heappop(heap)
+		levels = groups[group]
+		lowest = min(levels.values())
+		prop = max((p for p, h in levels.items() if h == lowest), key=lambda p: rent_gain(p, lowest))
+		if prop.build_cost > budget:
+			continue  # Budgets only shrink, so this group's next build will never be affordable
+		if lowest < 4:
+			if houses <= 0:
+				waiting.append(group)
+				continue
+			houses -= 1
+		else:
+			if hotels <= 0:
+				continue
+			hotels -= 1
+			houses += 4
+			for blocked in waiting:
+				push(blocked)
+			waiting = []
+		budget -= prop.build_cost
+		levels[prop] = lowest + 1
+		plan.append(prop)
+		push(group)
+	return plan
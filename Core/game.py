@@ -1,166 +1,251 @@
-import os
-from typing import Dict, Any, Optional
-from Cards import Deck, Card
-from Players import Player, AI
-from Board import Board
-from Core import Bank, Dice
-
-# Note: The following classes/interfaces are assumed to be defined elsewhere:
-# - Card (for returning "Get Out of Jail Free" cards to decks)
-
-class Game:
-	def __init__(self, save_slot: int = 0, autosave: bool = False):
-		data = self.get_data()
-		self.config: Dict[str, Any] = data.get("Config")
-		self.players = []
-		self.current_turn = 0
-		self.bank = Bank(self.config.get("Houses", 32), self.config.get("Hotels", 16))
-		self.decks: Dict[str, Deck] = {
-			"Chance": Deck(data.get("Chance")), 
-			"Comunity_Chest": Deck(data.get("Comunity_Chest"))
-			}
-		self.board = Board(data.get("Spaces"), self.config, self.decks)
-		self.save_slot = save_slot
-		self.autosave = autosave
-		self.first_player_index = 0
-		self.dice = Dice(self.config)
-
-	def start_game(self):
-		"""
-		Runs the main game loop.
-		In a real game you’d have a much more detailed turn‐by‐turn process,
-		but here we simulate turns until only one active player remains.
-		"""
-		print("Starting the game!")
-		while not self.is_game_over():
-			current_player = self.players[self.current_turn]
-			# If the current player is bankrupt, skip to the next one.
-			if current_player.bankrupt:
-				self.next_player()
-				continue
-
-			print(f"\nIt's {current_player.name}'s turn.")
-			self.first_player_index = self.current_turn
-
-			# Example turn:
-			roll = self.dice.roll()
-			print(f"{current_player.name} rolled a {roll}.")
-			current_player.dice_roll = roll
-			
-			# Move the player and process the landing space.
-			# (Assuming Board has a method process_space that takes the player, dice roll, and game instance.)
-
-			# End-of-turn procedures (buying, auctions, etc.) would be handled here.
-			# Optionally, you could save the game after each complete round:
-			# self.save_game(self.save_slot)
-			
-			self.next_player()
-
-		self.end_game()
-	
-	def add_player(self, name):
-		"""Adds a human player to the game."""
-		self.players.append(Player(name, self.config["starting_amount"]))
-	
-	def add_ai(self, name):
-		"""Adds an AI-controlled player."""
-		self.players.append(AI(name, self.config["starting_amount"]))
-
-	def remove_player(self, player: Player):
-		"""Removes a player from the game."""
-		if player in self.players:
-			self.players.remove(player)
-			print(f"{player.name} has been removed from the game.")
-		else:
-			print(f"{player.name} is not in the game.")
-
-	def get_player_by_name(self, name: str) -> Optional[Player]:
-		for player in self.players:
-			if player.name == name:
-				return player
-		return None
-
-	def reset_game_state(self):
-		"""Reset all transient game state except config."""
-		self.players = []
-		self.current_turn = 0
-		self.bank = Bank(self.config.get("Houses", 32), self.config.get("Hotels", 16))
-		self.board = Board(self.get_data().get("Spaces"), self.config, self.decks)
-		self.dice = Dice(self.config)
-		self.first_player_index = 0
-		print("Game state has been reset.")
-
-	def return_get_out_of_jail_cards(self):
-		for player in self.players:
-			cc_card, chance_card = player.get_out_of_jail_free_cards
-			if chance_card:
-				self.decks["Chance"].cards.append(Card("Get out of Jail Free", {"Type": "get_out_of_jail_free", "Card_Type": "chance"}))
-			if cc_card:
-				self.decks["Comunity_Chest"].cards.append(Card("Get out of Jail Free", {"Type": "get_out_of_jail_free", "Card_Type": "community_chest"}))
-			player.get_out_of_jail_free_cards = (False, False)
-
-	def debug_view_game_state(self):
-		print(f"\n=== GAME STATE ===")
-		print(f"Turn: {self.current_turn} / Player: {self.players[self.current_turn].name}")
-		print(f"Players Alive: {len(self.alive_players())}")
-		print("Owned Properties:")
-		for name, owner in self.board.owned_properties().items():
-			print(f"  {name}: {owner}")
-		print("==================\n")
-
-	def next_player(self):
-		"""
-		Updates current_turn to the next active (i.e. not bankrupt) player.
-		Triggers autosave if a full rotation completes.
-		"""
-		num_players = len(self.players)
-		if num_players == 0:
-			return
-
-		prev_index = self.current_turn
-
-		for _ in range(num_players):
-			self.current_turn = (self.current_turn + 1) % num_players
-			if not self.players[self.current_turn].bankrupt:
-				break
-
-		# Check if we've looped back to the player we started the round with
-		if self.autosave and self.current_turn == self.first_player_index:
-			print("Autosaving after completed rotation...")
-			self.save_game(self.save_slot)
-			self.first_player_index = self.current_turn  # Reset for next round
-
-	def alive_players(self) -> list["Player"]:
-		return [p for p in self.players if not p.bankrupt]
-	
-	def is_game_over(self) -> bool:
-		"""
-		Returns True if there is one (or zero) active players left.
-		"""
-		active_players = [p for p in self.players if not p.bankrupt]
-		return len(active_players) <= 1
-	
-	def end_game(self):
-		"""
-		Ends the game and prints out the winner.
-		"""
-		winners = self.determine_winner()
-		if winners:
-			winner = winners[0]
-			print(f"\nGame Over! The winner is {winner.name} with a total wealth of {winner.total_wealth()}.")
-		else:
-			print("\nGame Over! No winner could be determined.")
-	
-	def determine_winner(self):
-		"""
-		Determines the winner by sorting all active players by their total wealth.
-		Assumes that each player has a method total_wealth() which calculates the sum
-		of cash and property values.
-		"""
-		active_players = self.alive_players()
-		# Sort in descending order of wealth.
-		return sorted(active_players, key=lambda p: p.total_wealth(), reverse=True)
-
-	def save_game(self, save_slot: int):
-		from Core.save import save_game
+import os
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional
+from Cards import Deck, Card
+from Board import Board
+from Core import Bank, Dice
+from Data.Config import load_config, load_spaces, load_chance, load_community_chest, Game_Config, compile_config
+if TYPE_CHECKING:
+	from Players import Player
+
+# Note: The following classes/interfaces are assumed to be defined elsewhere:
+# - Card (for returning "Get Out of Jail Free" cards to decks)
+
+class Game:
+	def __init__(self, save_slot: int = 0, autosave: bool = False, data: Optional[Dict[str, Any]] = None):
+		"""
+		Initialise a new game.
+
+		:param save_slot: The slot used for saving this game.
+		:param autosave: Whether to save after every completed rotation.
+		:param data: Optional game data (config, spaces and cards) to build from instead of the
+					 bundled json files, e.g. a custom or synthetic board.
+		:raises ValueError: If the config is invalid (see compile_config).
+		"""
+		data = data if data is not None else self.get_data()
+		self.config: Dict[str, Any] = data.get("Config")
+		# The config compiled once; rule checks read its attributes
+		self.rules: Game_Config = compile_config(self.config)
+		self.players = []
+		self.current_turn = 0
+		self.bank = Bank(self.rules.houses, self.rules.hotels)
+		self.decks: Dict[str, Deck] = {
+			"Chance": Deck(data.get("Chance")), 
+			"Comunity_Chest": Deck(data.get("Comunity_Chest"))
+			}
+		self.board = Board(data.get("Spaces"), self.rules, self.decks)
+		self.save_slot = save_slot
+		self.autosave = autosave
+		self.first_player_index = 0
+		self.dice = Dice(self.rules)
+		self.compile_house_rules()
+		self._turn_machine: Optional["Turn_Machine"] = None
+		self.started = False
+		self.zobrist: Optional["Zobrist"] = None
+		self.attach_zobrist()
+
+	def compile_house_rules(self) -> None:
+		"""
+		Compile the house rules the config enables (see Core.house_rules) and set them up on
+		the current board. Needed whenever the rules or the board are replaced.
+		"""
+		from Core.house_rules import House_Rules
+		self.house_rules = House_Rules(self.rules)
+		self.house_rules.setup(self)
+
+	def attach_zobrist(self) -> None:
+		"""
+		(Re)attach the game's state hash to the current board, players and decks. Needed whenever
+		players join or leave or the board is replaced.
+		"""
+		from Core.zobrist import Zobrist
+		if self.zobrist is None:
+			self.zobrist = Zobrist()
+		self.zobrist.attach(self)
+
+	def state_hash(self) -> int:
+		"""
+		64 bit Zobrist hash of the current game state (see Core.zobrist), kept up to date in O(1)
+		per change.
+		"""
+		return self.zobrist.value
+
+	def get_data(self) -> Dict[str, Any]:
+		"""
+		Load the config, spaces and card definitions the game is built from.
+		"""
+		return {
+			"Config": load_config(),
+			"Spaces": load_spaces(),
+			"Chance": load_chance(),
+			"Comunity_Chest": load_community_chest()
+		}
+
+	def start_game(self):
+		"""
+		Runs the main game loop: plays turns (see step) until only one active player remains.
+		"""
+		print("Starting the game!")
+		self.run_until()
+		self.end_game()
+
+	def begin(self) -> None:
+		"""
+		Run the house rules' start hooks (e.g. dealing starting properties) once every player is
+		seated. Done by the first step if not called before.
+		"""
+		if not self.started:
+			self.started = True
+			self.house_rules.start(self)
+
+	def step(self) -> list["Turn_Event"]:
+		"""
+		Advance the game by one phase of the current turn (see Core.turn.Turn_Machine).
+
+		:return: The events the phase emitted.
+		"""
+		return self.turn_machine.step()
+
+	def run_until(self, turns: Optional[int] = None, predicate: Optional[Callable[["Game"], bool]] = None) -> int:
+		"""
+		Step until the game is over, the given number of turns have been played, or
+		predicate(game) is true.
+
+		:return: The number of turns played.
+		"""
+		return self.turn_machine.run_until(turns, predicate)
+
+	@property
+	def turn_machine(self) -> "Turn_Machine":
+		if self._turn_machine is None:
+			from Core.turn import Turn_Machine
+			self._turn_machine = Turn_Machine(self)
+		return self._turn_machine
+
+	@property
+	def existing_turn_machine(self) -> Optional["Turn_Machine"]:
+		"""
+		The game's turn machine, or None if it has not been stepped or driven yet
+		(unlike turn_machine, never creates one).
+		"""
+		return self._turn_machine
+
+	def add_player(self, name):
+		"""Adds a human player to the game."""
+		from Players import Player
+		player = Player(name, self.rules.starting_amount)
+		player.bank = self.bank
+		self.players.append(player)
+		self.attach_zobrist()
+	
+	def add_ai(self, name, parameters: Optional[Dict[str, float]] = None):
+		"""Adds an AI-controlled player, optionally with its own strategy parameters."""
+		from Players import AI
+		ai = AI(name, self.rules.starting_amount, parameters)
+		ai.bank = self.bank
+		self.players.append(ai)
+		self.attach_zobrist()
+
+	def remove_player(self, player: "Player"):
+		"""Removes a player from the game."""
+		if player in self.players:
+			self.players.remove(player)
+			player.zobrist = None
+			self.attach_zobrist()
+			print(f"{player.name} has been removed from the game.")
+		else:
+			print(f"{player.name} is not in the game.")
+
+	def get_player_by_name(self, name: str) -> Optional["Player"]:
+		for player in self.players:
+			if player.name == name:
+				return player
+		return None
+
+	def reset_game_state(self):
+		"""Reset all transient game state except config."""
+		self.players = []
+		self.current_turn = 0
+		self.bank = Bank(self.rules.houses, self.rules.hotels)
+		self.board = Board(self.get_data().get("Spaces"), self.rules, self.decks)
+		self.dice = Dice(self.rules)
+		self.first_player_index = 0
+		self.compile_house_rules()
+		self._turn_machine = None
+		self.started = False
+		self.attach_zobrist()
+		print("Game state has been reset.")
+
+	def return_get_out_of_jail_cards(self):
+		for player in self.players:
+			cc_card, chance_card = player.get_out_of_jail_free_cards
+			if chance_card:
+				self.decks["Chance"].add_card(Card("Get out of Jail Free", {"Type": "get_out_of_jail_free", "Card_Type": "chance"}))
+			if cc_card:
+				self.decks["Comunity_Chest"].add_card(Card("Get out of Jail Free", {"Type": "get_out_of_jail_free", "Card_Type": "community_chest"}))
+			player.get_out_of_jail_free_cards = (False, False)
+
+	def debug_view_game_state(self):
+		print(f"\n=== GAME STATE ===")
+		print(f"Turn: {self.current_turn} / Player: {self.players[self.current_turn].name}")
+		print(f"Players Alive: {len(self.alive_players())}")
+		print("Owned Properties:")
+		for name, owner in self.board.owned_properties().items():
+			print(f"  {name}: {owner}")
+		print("==================\n")
+
+	def next_player(self):
+		"""
+		Updates current_turn to the next active (i.e. not bankrupt) player.
+		Triggers autosave if a full rotation completes.
+		"""
+		num_players = len(self.players)
+		if num_players == 0:
+			return
+
+		prev_index = self.current_turn
+
+		for _ in range(num_players):
+			self.current_turn = (self.current_turn + 1) % num_players
+			if not self.players[self.current_turn].bankrupt:
+				break
+
+		# Check if we've looped back to the player we started the round with
+		if self.autosave and self.current_turn == self.first_player_index:
+			print("Autosaving after completed rotation...")
+			self.save_game(self.save_slot)
+			self.first_player_index = self.current_turn  # Reset for next round
+
+	def alive_players(self) -> list["Player"]:
+		return [p for p in self.players if not p.bankrupt]
+	
+	def is_game_over(self) -> bool:
+		"""
+		Returns True if there is one (or zero) active players left.
+		"""
+		active_players = [p for p in self.players if not p.bankrupt]
+		return len(active_players) <= 1
+	
+	def end_game(self):
+		"""
+		Ends the game and prints out the winner.
+		"""
+		winners = self.determine_winner()
+		if winners:
+			winner = winners[0]
+			print(f"\nGame Over! The winner is {winner.name} with a total wealth of {winner.total_wealth()}.")
+		else:
+			print("\nGame Over! No winner could be determined.")
+	
+	def determine_winner(self):
+		"""
+		Determines the winner by sorting all active players by their total wealth.
+		Assumes that each player has a method total_wealth() which calculates the sum
+		of cash and property values.
+		"""
+		active_players = self.alive_players()
+		# Sort in descending order of wealth.
+		return sorted(active_players, key=lambda p: p.total_wealth(), reverse=True)
+
+	def save_game(self, save_slot: int):
+		from Core.save import save_game
 		save_game(self, save_slot)
\ No newline at end of file
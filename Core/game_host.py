@@ -0,0 +1,253 @@
+import gc
+import os
+import sys
+import types
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Set
+from Board.space_definitions import Space_Definition
+from Core import Game
+from Core.save import game_state, restore_game
+from Core.turn import START, GAME_OVER
+from Data.Config import load_config, load_spaces, load_chance, load_community_chest
+from Data.Saves import encode_save, decode_save
+if TYPE_CHECKING:
+	from Core.turn import Turn_Event
+
+DEFAULT_MAX_ACTIVE = 256  # Games kept in memory by default
+REMEASURE_TURNS = 50  # Turns a game plays between measurements of its size
+# Shared by every game, so not counted towards any one game's size
+SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.CodeType, Space_Definition)
+
+def deep_size(root: Any) -> int:
+	"""
+	Approximate bytes held by everything reachable from root (classes, modules and functions
+	excluded, since they are shared).
+	"""
+	seen: Set[int] = set()
+	stack = [root]
+	total = 0
+	while stack:
+		obj = stack.pop()
+		if id(obj) in seen or isinstance(obj, SHARED_TYPES):
+			continue
+		seen.add(id(obj))
+		total += sys.getsizeof(obj)
+		stack.extend(gc.get_referents(obj))
+	return total
+
+class Game_Host:
+	"""
+	Hosts many games by id while keeping only the recently used ones in memory.
+
+	Active games are held in least recently used order. When there are more than max_active, or
+	their estimated size passes max_memory bytes, the least recently used are hibernated: saved
+	as a compressed snapshot (the same encoding as compressed saves) in folder and dropped from
+	memory. Asking for a hibernated game (get, step, run_until) restores it from its snapshot
+	and makes it the most recently used, so callers never need to know where a game is.
+
+	Games are only hibernated between turns (their turn machine at the start of a turn or the
+	game over); one part way through a turn stays in memory until it reaches the next turn.
+	A game's size is measured when it becomes active and, if there is a max_memory, again once
+	step or run_until has played REMEASURE_TURNS more turns of it, so a game that grows as it
+	is played still counts towards the limit without walking every game's objects every turn.
+	Snapshots left in folder are picked up again by a new host, so games survive a restart.
+
+	key responsibilities:
+	- tracking which games are in memory and which on disk
+	- hibernating the least recently used games to stay within the limits
+	- resuming hibernated games on demand
+	"""
+	def __init__(self, folder: str, max_active: int = DEFAULT_MAX_ACTIVE, max_memory: Optional[int] = None,
+				 data: Optional[Dict[str, Any]] = None):
+		"""
+		:param folder: Directory for the snapshots (created if needed).
+		:param max_active: Games kept in memory at most.
+		:param max_memory: Estimated bytes of active games kept in memory at most (no limit if None).
+		:param data: Game data (Config, Spaces, Chance, Comunity_Chest) every hosted game is
+					 built from, defaults to the bundled json files.
+		"""
+		if max_active < 1:
+			raise ValueError("At least one game must be kept active.")
+		os.makedirs(folder, exist_ok=True)
+		self.folder = folder
+		self.max_active = max_active
+		self.max_memory = max_memory
+		self.data = data or {"Config": load_config(), "Spaces": load_spaces(), "Chance": load_chance(), "Comunity_Chest": load_community_chest()}
+		self.active: "OrderedDict[str, Game]" = OrderedDict()
+		self.sizes: Dict[str, int] = {}  # Estimated bytes of each active game
+		self.measured_at: Dict[str, int] = {}  # Turns each active game had played when last measured
+		self.hibernated: Set[str] = {name[:-len(".sav")] for name in os.listdir(folder) if name.endswith(".sav")}
+		self.hibernations = 0
+		self.resumes = 0
+
+	def _path(self, game_id: str) -> str:
+		return os.path.join(self.folder, f"{game_id}.sav")
+
+	def __len__(self) -> int:
+		return len(self.active) + len(self.hibernated)
+
+	def __contains__(self, game_id: str) -> bool:
+		return game_id in self.active or game_id in self.hibernated
+
+	def __iter__(self) -> Iterator[str]:
+		yield from list(self.active)
+		yield from list(self.hibernated)
+
+	@property
+	def memory_used(self) -> int:
+		return sum(self.sizes.values())
+
+	# === Games ===
+	def new_game(self, game_id: str) -> "Game":
+		"""
+		Create and host a new game (add players to it before playing).
+		"""
+		game = Game(data=self.data)
+		self.add(game_id, game)
+		return game
+
+	def add(self, game_id: str, game: "Game") -> None:
+		"""
+		Host an existing game.
+
+		:raises ValueError: If the id is already in use.
+		"""
+		if game_id in self:
+			raise ValueError(f"Game {game_id} is already hosted.")
+		self.active[game_id] = game
+		self._admit(game_id)
+
+	def get(self, game_id: str) -> "Game":
+		"""
+		The game with this id, resumed from disk if it was hibernated.
+
+		:raises KeyError: If no game has this id.
+		"""
+		game = self.active.get(game_id)
+		if game is not None:
+			self.active.move_to_end(game_id)
+			return game
+		if game_id not in self.hibernated:
+			raise KeyError(game_id)
+		return self._resume(game_id)
+
+	def step(self, game_id: str) -> List["Turn_Event"]:
+		"""
+		Advance a game by one phase (see Game.step).
+		"""
+		game = self.get(game_id)
+		events = game.step()
+		self._remeasure(game_id, game)
+		return events
+
+	def run_until(self, game_id: str, **kwargs) -> int:
+		"""
+		Drive a game (see Game.run_until).
+		"""
+		game = self.get(game_id)
+		turns = game.run_until(**kwargs)
+		self._remeasure(game_id, game)
+		return turns
+
+	def remove(self, game_id: str) -> None:
+		"""
+		Stop hosting a game, deleting its snapshot.
+		"""
+		self.active.pop(game_id, None)
+		self.sizes.pop(game_id, None)
+		self.measured_at.pop(game_id, None)
+		if game_id in self.hibernated:
+			self.hibernated.discard(game_id)
+			os.remove(self._path(game_id))
+
+	# === Hibernation ===
+	def hibernate(self, game_id: str) -> bool:
+		"""
+		Write an active game to disk and drop it from memory.
+
+		:return: False if the game is part way through a turn and was left active.
+		"""
+		game = self.active[game_id]
+		machine = game.existing_turn_machine
+		if machine is not None and machine.phase not in (START, GAME_OVER):
+			return False
+		snapshot = {
+			"State": game_state(game, game.save_slot),
+			"Started": game.started,
+			"Turns": machine.turns if machine is not None else 0,
+			"Game_Over": machine is not None and machine.phase == GAME_OVER
+		}
+		path = self._path(game_id)
+		temporary = path + ".tmp"
+		with open(temporary, "wb") as file:
+			file.write(encode_save(snapshot))
+		os.replace(temporary, path)
+		del self.active[game_id]
+		self.sizes.pop(game_id, None)
+		self.measured_at.pop(game_id, None)
+		self.hibernated.add(game_id)
+		self.hibernations += 1
+		return True
+
+	def hibernate_all(self) -> None:
+		"""
+		Hibernate every game that is between turns (e.g. before shutting down).
+		"""
+		for game_id in list(self.active):
+			self.hibernate(game_id)
+
+	def _resume(self, game_id: str) -> "Game":
+		with open(self._path(game_id), "rb") as file:
+			snapshot = decode_save(file.read())
+		game = Game(data=self.data)
+		restore_game(game, snapshot["State"], data=self.data)
+		game.save_slot = snapshot["State"].get("Save_Slot", 0)
+		game.started = snapshot["Started"]
+		machine = game.turn_machine
+		machine.turns = snapshot["Turns"]
+		if snapshot["Game_Over"]:
+			machine.phase = GAME_OVER
+		os.remove(self._path(game_id))
+		self.hibernated.discard(game_id)
+		self.active[game_id] = game
+		self.resumes += 1
+		self._admit(game_id)
+		return game
+
+	def _remeasure(self, game_id: str, game: "Game") -> None:
+		"""
+		Measure a game again if there is a memory limit, it is between turns (so could be
+		hibernated) and it has played REMEASURE_TURNS turns since it was last measured.
+		"""
+		if self.max_memory is None:
+			return
+		machine = game.existing_turn_machine
+		if machine.phase in (START, GAME_OVER) and machine.turns - self.measured_at.get(game_id, 0) >= REMEASURE_TURNS:
+			self._admit(game_id)
+
+	def _admit(self, game_id: str) -> None:
+		"""
+		Measure an active game (newly active, or grown since it was last measured) and hibernate
+		others until the host is within its limits.
+		"""
+		game = self.active[game_id]
+		self.sizes[game_id] = deep_size(game)
+		machine = game.existing_turn_machine
+		self.measured_at[game_id] = machine.turns if machine is not None else 0
+		for candidate in list(self.active):
+			if len(self.active) <= self.max_active and (self.max_memory is None or self.memory_used <= self.max_memory):
+				break
+			if candidate != game_id:
+				self.hibernate(candidate)
+
+	def stats(self) -> Dict[str, int]:
+		"""
+		:return: {"active", "hibernated", "memory_used", "hibernations", "resumes"}
+		"""
+		return {
+			"active": len(self.active),
+			"hibernated": len(self.hibernated),
+			"memory_used": self.memory_used,
+			"hibernations": self.hibernations,
+			"resumes": self.resumes
+		}
@@ -0,0 +1,156 @@
+import random
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, List, Tuple, Type
+from Board.Space_Types import Go
+if TYPE_CHECKING:
+	from Board import Space
+	from Players import Player
+	from Core import Game
+	from Data.Config import Game_Config
+
+# Hooks a house rule can implement, and when the game runs them:
+#   setup(game)                    - after the board is built (new game, reset or load)
+#   start(game)                    - once, when play starts with every player seated
+#   land(space, player, game)      - after a player lands on one of the rule's spaces by a roll
+HOOKS = ("setup", "start", "land")
+
+class House_Rule:
+	"""
+	Base class for house rules. A rule implements only the hooks it needs (see HOOKS), names
+	the Game_Config field that switches it on, and lists the actions it lets a player take
+	while in jail. Register new rules with register_house_rule; nothing in Space_Types needs
+	to change.
+	"""
+	setting: str = ""  # The Game_Config field that enables the rule
+	spaces: Tuple[type, ...] = ()  # Space types the land hook runs for (all spaces if empty)
+	jail_actions: FrozenSet[str] = frozenset()  # Actions the rule allows in jail ("build", "unmortgage", "trade")
+
+	def enabled(self, rules: "Game_Config") -> bool:
+		return bool(getattr(rules, self.setting, False))
+
+	def setup(self, game: "Game") -> None:
+		pass
+
+	def start(self, game: "Game") -> None:
+		pass
+
+	def land(self, space: "Space", player: "Player", game: "Game") -> None:
+		pass
+
+HOUSE_RULES: List[Type[House_Rule]] = []
+
+def register_house_rule(rule: Type[House_Rule]) -> Type[House_Rule]:
+	"""
+	Add a rule to the ones every game compiles (usable as a class decorator).
+	"""
+	if rule not in HOUSE_RULES:
+		HOUSE_RULES.append(rule)
+	return rule
+
+@register_house_rule
+class Double_Salary_On_Go(House_Rule):
+	"""
+	Landing exactly on Go pays the salary a second time.
+	"""
+	setting = "double_salary_on_go"
+	spaces = (Go,)
+
+	def land(self, space: "Go", player: "Player", game: "Game") -> None:
+		player.collect(space.base_salary)
+
+@register_house_rule
+class Rent_In_Jail(House_Rule):
+	"""
+	Owners keep collecting rent while they are in jail.
+	"""
+	setting = "rent_in_jail"
+
+	def setup(self, game: "Game") -> None:
+		for space in game.board.ownable_spaces:
+			space.get_card().collect_in_jail = True
+
+@register_house_rule
+class Starting_Random_Properties(House_Rule):
+	"""
+	Every player starts with a number of random unowned properties, dealt in turn.
+	"""
+	setting = "starting_random_properties"
+
+	def start(self, game: "Game") -> None:
+		unowned = [space for space in game.board.ownable_spaces if space.get_card().owner is None]
+		random.shuffle(unowned)
+		for _ in range(game.rules.starting_random_properties):
+			for player in game.players:
+				if not unowned:
+					return
+				game.bank.transfer_property(unowned.pop(), player)
+
+@register_house_rule
+class Build_In_Jail(House_Rule):
+	setting = "build_in_jail"
+	jail_actions = frozenset({"build"})
+
+@register_house_rule
+class Unmortgage_In_Jail(House_Rule):
+	setting = "unmortgage_in_jail"
+	jail_actions = frozenset({"unmortgage"})
+
+@register_house_rule
+class Trade_In_Jail(House_Rule):
+	setting = "trade_in_jail"
+	jail_actions = frozenset({"trade"})
+
+class House_Rules:
+	"""
+	The house rules a game's config enables, compiled into its hooks when the game is built.
+
+	Only enabled rules are instantiated, and each hook keeps just the rules that implement it,
+	so a disabled rule is never looked at again: with no rules on, running a hook is a loop over
+	an empty tuple and landing is a single failed dict lookup. Landing hooks are indexed by
+	space type when the board is set up, so a rule for Go costs nothing on any other space.
+
+	key responsibilities:
+	- choosing the enabled rules
+	- running their hooks
+	- deciding what a jailed player may do
+	"""
+	def __init__(self, rules: "Game_Config"):
+		self.rules = [rule for rule in (rule_class() for rule_class in HOUSE_RULES) if rule.enabled(rules)]
+		self.setup_hooks = self._hooks("setup")
+		self.start_hooks = self._hooks("start")
+		self.land_rules = [rule for rule in self.rules if type(rule).land is not House_Rule.land]
+		self.landing: Dict[type, Tuple[Callable, ...]] = {}
+		self.jail_actions: FrozenSet[str] = frozenset().union(*(rule.jail_actions for rule in self.rules))
+
+	def _hooks(self, hook: str) -> Tuple[Callable, ...]:
+		return tuple(getattr(rule, hook) for rule in self.rules if getattr(type(rule), hook) is not getattr(House_Rule, hook))
+
+	def setup(self, game: "Game") -> None:
+		"""
+		Index the landing hooks by the board's space types, then run the setup hooks.
+		"""
+		self.landing = {}
+		for space in game.board.spaces:
+			space_type = type(space)
+			if space_type not in self.landing:
+				hooks = tuple(rule.land for rule in self.land_rules if not rule.spaces or isinstance(space, rule.spaces))
+				if hooks:
+					self.landing[space_type] = hooks
+		for hook in self.setup_hooks:
+			hook(game)
+
+	def start(self, game: "Game") -> None:
+		for hook in self.start_hooks:
+			hook(game)
+
+	def land(self, space: "Space", player: "Player", game: "Game") -> None:
+		hooks = self.landing.get(type(space))
+		if hooks:
+			for hook in hooks:
+				hook(space, player, game)
+
+	def allows(self, action: str, player: "Player") -> bool:
+		"""
+		Whether a player may take an action ("build", "unmortgage" or "trade") now: always
+		outside jail, and in jail only if a house rule allows it.
+		"""
+		return not player.in_jail or action in self.jail_actions
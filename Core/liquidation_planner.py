@@ -0,0 +1,196 @@
+import math
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple
+from Board.Space_Types import Property, Utility
+from Board.Space_Types.utility import UTILITY_MULTIPLIERS
+if TYPE_CHECKING:
+	from Board import Ownable_Card
+	from Players import Player
+
+AVERAGE_ROLL = 7  # Used to value utility rent
+
+def expected_rent(card: "Ownable_Card", houses: int) -> float:
+	"""
+	The rent a card charges its owner's opponents with the given number of houses,
+	ignoring mortgages. Used to measure what giving up an asset costs.
+
+	:param card: The card to value.
+	:param houses: The number of houses to value it with (ignored unless it is a property).
+	:return: The rent per landing.
+	"""
+	location = card.location
+	if isinstance(location, Property):
+		rent = location.rent[str(houses)]
+		if houses == 0 and location.group.all_owned_by() is card.owner:
+			rent *= 2
+		return rent
+	owned = max(location.group.count_owned(card.owner), 1)
+	if isinstance(location, Utility):
+		multipliers = location.rent if isinstance(location.rent, Mapping) else UTILITY_MULTIPLIERS
+		return multipliers.get(str(owned), 0) * AVERAGE_ROLL
+	if isinstance(location.rent, Mapping):
+		return location.rent.get(str(owned), 0)
+	return (location.rent or 0) * 2 ** (owned - 1)  # Railroads: 25, 50, 100, 200
+
+def _group_options(cards: List["Ownable_Card"], houses_in_bank: int) -> Tuple[List[Tuple[int, float, List["Property"]]], List[Tuple[int, float, "Ownable_Card"]]]:
+	"""
+	The liquidation choices for one group's cards.
+
+	Breaking up a hotel takes 4 houses from the bank and selling a house puts one back, so the
+	sales stop at the first hotel the bank's stock can not break up.
+
+	:param houses_in_bank: The houses the bank has for hotel break-ups.
+	:return: (sells, mortgages). sells[k] is (cash, rent lost, properties) for selling the
+			 first k buildings in even-selling order. mortgages are the single mortgages that
+			 become possible once every building in the group is sold (none if they can not
+			 all be sold).
+	"""
+	levels = {card: getattr(card, "houses", 0) for card in cards}
+	sells = [(0, 0.0, [])]
+	cash, loss, order = 0, 0.0, []
+	while any(levels.values()):
+		top = max(levels.values())
+		if top == 5:
+			if houses_in_bank < 4:
+				return sells, []
+			houses_in_bank -= 4
+		else:
+			houses_in_bank += 1
+		# Of the properties at the top level, sell where the least rent is lost
+		card = min((c for c in cards if levels[c] == top),
+				   key=lambda c: expected_rent(c, top) - expected_rent(c, top - 1))
+		cash += card.location.build_cost // 2
+		loss += expected_rent(card, top) - expected_rent(card, top - 1)
+		order = order + [card.location]
+		levels[card] = top - 1
+		sells.append((cash, loss, order))
+
+	mortgages = [(card.location.mortgage_value, expected_rent(card, 0), card) for card in cards if not card.mortgaged]
+	return sells, mortgages
+
+def _house_stock_change(sold: List["Property"]) -> Tuple[int, int]:
+	"""
+	What selling buildings from one group in the given order does to the bank's houses.
+
+	:return: (houses the bank needs to start with, change in its houses at the end).
+	"""
+	levels: Dict["Property", int] = {}
+	change = lowest = 0
+	for property in sold:
+		houses = levels.get(property, property.get_card().houses)
+		change += -4 if houses == 5 else 1
+		lowest = min(lowest, change)
+		levels[property] = houses - 1
+	return -lowest, change
+
+def _order_for_house_stock(runs: List[List["Property"]]) -> List["Property"]:
+	"""
+	Order the groups' sales so the bank's houses run short as late as possible: groups that
+	leave the bank with more houses go first (those needing fewest to start with first), then
+	the rest, those leaving the most behind first.
+	"""
+	changes = [(_house_stock_change(run), run) for run in runs if run]
+	gaining = sorted((c for c in changes if c[0][1] >= 0), key=lambda c: c[0][0])
+	losing = sorted((c for c in changes if c[0][1] < 0), key=lambda c: c[0][0] + c[0][1], reverse=True)
+	return [property for _, run in gaining + losing for property in run]
+
+def plan_liquidation(player: "Player", amount: int, allow_sales: bool = True,
+					 houses_in_bank: Optional[int] = None) -> Tuple[List["Property"], List["Ownable_Card"], int]:
+	"""
+	Choose which buildings to sell and properties to mortgage to raise an amount of cash while
+	giving up as little future rent as possible.
+
+	Each group contributes a choice of how many buildings to sell (in legal even-selling order)
+	and, once its buildings are gone, which of its properties to mortgage. The cheapest mix of
+	those choices is found with one knapsack over the cash raised, in steps of the largest
+	amount every sale and mortgage is a multiple of, capped at the amount needed.
+
+	Each group's sales respect the bank's house stock on their own, and the chosen sales are
+	ordered to make the best use of it; several groups breaking up hotels at once can still
+	need more houses than the bank has, in which case the sales fail when applied.
+
+	If the player's assets can not raise the amount, the plan sells and mortgages everything.
+
+	:param player: The player raising money.
+	:param amount: The cash needed.
+	:param allow_sales: Whether buildings may be sold (needs a bank to sell them to).
+	:param houses_in_bank: The houses the bank has for hotel break-ups (by default the
+						   player's bank's).
+	:return: (properties to sell a building from in order, cards to mortgage, cash raised).
+	"""
+	if houses_in_bank is None:
+		houses_in_bank = player.bank.houses if player.bank is not None else 0
+	options = []
+	for group in player.owned_properties.groups():
+		cards = player.owned_properties.in_group(group)
+		has_buildings = any(getattr(card, "houses", 0) for card in cards)
+		if has_buildings and not allow_sales:
+			continue  # Nothing here can be mortgaged without selling first
+		options.append(_group_options(cards, houses_in_bank))
+
+	values = [cash for sells, mortgages in options for cash, _, _ in sells[1:]]
+	values += [cash for sells, mortgages in options for cash, _, _ in mortgages]
+	if amount <= 0 or not values:
+		return [], [], 0
+
+	unit = 0
+	for value in values:
+		unit = math.gcd(unit, value)
+	unit = max(unit, 1)
+	target = -(-amount // unit)  # Cash needed in units, rounded up
+
+	# best[c] = (rent lost, sells, mortgages, cash) for the cheapest way found to raise c units
+	# (c capped at target, so best[target] is "at least the amount")
+	Plan = Tuple[float, List["Property"], List["Ownable_Card"], int]
+	best: List[Optional[Plan]] = [None] * (target + 1)
+	best[0] = (0.0, [], [], 0)
+
+	def shift(table: List[Optional[Plan]], cash: int, loss: float, sold: List["Property"], mortgaged: List["Ownable_Card"]) -> List[Optional[Plan]]:
+		result: List[Optional[Plan]] = [None] * (target + 1)
+		for c, plan in enumerate(table):
+			if plan is None:
+				continue
+			n = min(target, c + cash // unit)
+			candidate = (plan[0] + loss, plan[1] + sold, plan[2] + mortgaged, plan[3] + cash)
+			if result[n] is None or candidate[0] < result[n][0]:
+				result[n] = candidate
+		return result
+
+	def merge(a: List[Optional[Plan]], b: List[Optional[Plan]]) -> List[Optional[Plan]]:
+		return [y if x is None or (y is not None and y[0] < x[0]) else x for x, y in zip(a, b)]
+
+	for sells, mortgages in options:
+		new_best = best
+		for cash, loss, sold in sells[1:-1]:
+			new_best = merge(new_best, shift(best, cash, loss, sold, []))
+		# Selling every building (or having none) opens up the group's mortgages
+		cash, loss, sold = sells[-1]
+		cleared = shift(best, cash, loss, sold, []) if len(sells) > 1 else best
+		for value, lost, card in mortgages:
+			cleared = merge(cleared, shift(cleared, value, lost, [], [card]))
+		best = merge(new_best, cleared)
+
+	if best[target] is not None:
+		_, sold, mortgaged, cash = best[target]
+		return _order_for_house_stock(_group_runs(sold)), mortgaged, cash
+
+	# Not enough: raise everything that can be raised
+	runs, mortgaged, cash = [], [], 0
+	for sells, mortgages in options:
+		runs.append(sells[-1][2])
+		cash += sells[-1][0]
+		for value, _, card in mortgages:
+			mortgaged.append(card)
+			cash += value
+	return _order_for_house_stock(runs), mortgaged, cash
+
+def _group_runs(sold: List["Property"]) -> List[List["Property"]]:
+	"""
+	Split a plan's sales back into each group's (they are planned one group after another).
+	"""
+	runs: List[List["Property"]] = []
+	for property in sold:
+		if runs and runs[-1][-1].group is property.group:
+			runs[-1].append(property)
+		else:
+			runs.append([property])
+	return runs
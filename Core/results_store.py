@@ -0,0 +1,300 @@
+import json
+import os
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Tuple
+import numpy as np
+from Data.Config import compile_config
+if TYPE_CHECKING:
+	from Core import Game
+	from Players import Player
+
+CHUNK_ROWS = 1 << 16  # Rows per chunk file
+MAX_PLAYERS = 8  # Width of the per-game balance columns
+
+def config_hash(config: Dict[str, Any]) -> int:
+	"""
+	A 64 bit hash of a game config, so results from different rules are never mixed up
+	(the compiled config's hash, see Game_Config).
+	"""
+	return compile_config(config).hash
+
+class Column_Table:
+	"""
+	An append-only table stored column by column as NumPy files.
+
+	Every column is split into chunk files of CHUNK_ROWS rows (column/chunk_000000.npy, ...),
+	each a plain .npy file that is memory-mapped rather than read. Appends go straight into the
+	memory-mapped tail chunk; a new chunk file is created when it fills. The row count is kept in
+	table.json and only advances on flush, so a crash part way through a chunk leaves the table
+	at its last flushed length.
+
+	Reading is a scan over chunks: each yields memory-mapped arrays of just the columns asked
+	for, so a table of hundreds of millions of rows can be aggregated chunk by chunk without
+	ever being in memory (or parsed) as a whole.
+
+	key responsibilities:
+	- appending rows in fixed size, memory-mapped chunks
+	- scanning columns chunk by chunk
+	"""
+	def __init__(self, path: str, schema: Optional[Dict[str, Tuple[str, Tuple[int, ...]]]] = None):
+		"""
+		Open a table, creating it if a schema is given and it does not exist yet.
+
+		:param path: The table's directory.
+		:param schema: column name -> (NumPy dtype, per-row shape), e.g. ("int32", (40,)).
+		:raises ValueError: If the table exists with a different schema, or does not exist and no schema is given.
+		"""
+		self.path = path
+		meta_file = os.path.join(path, "table.json")
+		if os.path.exists(meta_file):
+			with open(meta_file) as file:
+				meta = json.load(file)
+			stored = {name: (dtype, tuple(shape)) for name, (dtype, shape) in meta["schema"].items()}
+			if schema is not None and stored != {name: (dtype, tuple(shape)) for name, (dtype, shape) in schema.items()}:
+				raise ValueError(f"Table {path} already exists with a different schema.")
+			self.schema = stored
+			self.rows = meta["rows"]
+		elif schema is None:
+			raise ValueError(f"Table {path} does not exist.")
+		else:
+			self.schema = {name: (dtype, tuple(shape)) for name, (dtype, shape) in schema.items()}
+			self.rows = 0
+			for name in self.schema:
+				os.makedirs(os.path.join(path, name), exist_ok=True)
+			self._write_meta()
+		self._pending = self.rows  # Rows written, including those not yet flushed
+		self._tail: Dict[str, np.memmap] = {}
+		self._tail_chunk = -1
+
+	def __len__(self) -> int:
+		# Rows appended so far; other processes only see the flushed count in table.json
+		return self._pending
+
+	def _chunk_file(self, column: str, chunk: int) -> str:
+		return os.path.join(self.path, column, f"chunk_{chunk:06d}.npy")
+
+	def _write_meta(self) -> None:
+		meta = {"rows": self.rows, "chunk_rows": CHUNK_ROWS,
+				"schema": {name: [dtype, list(shape)] for name, (dtype, shape) in self.schema.items()}}
+		temporary = os.path.join(self.path, "table.json.tmp")
+		with open(temporary, "w") as file:
+			json.dump(meta, file)
+		os.replace(temporary, os.path.join(self.path, "table.json"))
+
+	# === Writing ===
+	def _open_tail(self, chunk: int) -> None:
+		"""
+		Memory-map (creating if needed) the chunk that the next rows go into.
+		"""
+		self._flush_tail()
+		self._tail = {}
+		for name, (dtype, shape) in self.schema.items():
+			file = self._chunk_file(name, chunk)
+			if os.path.exists(file):
+				self._tail[name] = np.load(file, mmap_mode="r+")
+			else:
+				self._tail[name] = np.lib.format.open_memmap(file, mode="w+", dtype=dtype, shape=(CHUNK_ROWS,) + shape)
+		self._tail_chunk = chunk
+
+	def _flush_tail(self) -> None:
+		for array in self._tail.values():
+			array.flush()
+
+	def append(self, columns: Dict[str, Any]) -> None:
+		"""
+		Append a batch of rows.
+
+		:param columns: column name -> array of values (one entry per row; every column needed).
+		:raises ValueError: If a column is missing or the columns have different lengths.
+		"""
+		if set(columns) != set(self.schema):
+			raise ValueError(f"Expected columns {sorted(self.schema)}, got {sorted(columns)}.")
+		arrays = {name: np.asarray(values, dtype=self.schema[name][0]) for name, values in columns.items()}
+		lengths = {len(array) for array in arrays.values()}
+		if len(lengths) != 1:
+			raise ValueError("Every column must have the same number of rows.")
+		count = lengths.pop()
+		done = 0
+		while done < count:
+			chunk, offset = divmod(self._pending, CHUNK_ROWS)
+			if chunk != self._tail_chunk:
+				self._open_tail(chunk)
+			take = min(count - done, CHUNK_ROWS - offset)
+			for name, array in arrays.items():
+				self._tail[name][offset:offset + take] = array[done:done + take]
+			done += take
+			self._pending += take
+			if offset + take == CHUNK_ROWS:
+				self.flush()  # A full chunk is never touched again
+
+	def append_row(self, **values: Any) -> None:
+		"""
+		Append a single row (prefer append with arrays for bulk writes).
+		"""
+		self.append({name: [value] for name, value in values.items()})
+
+	def flush(self) -> None:
+		"""
+		Write appended rows to disk and make them visible to readers.
+		"""
+		self._flush_tail()
+		if self._pending != self.rows:
+			self.rows = self._pending
+			self._write_meta()
+
+	def close(self) -> None:
+		self.flush()
+		self._tail = {}
+		self._tail_chunk = -1
+
+	# === Reading ===
+	def scan(self, columns: Optional[List[str]] = None) -> Iterator[Dict[str, np.ndarray]]:
+		"""
+		Iterate over the table a chunk at a time.
+
+		:param columns: The columns to read (defaults to all of them).
+		:return: For each chunk, column name -> read-only memory-mapped array of that chunk's rows.
+		"""
+		columns = columns or list(self.schema)
+		self._flush_tail()
+		total = len(self)
+		for chunk in range(-(-total // CHUNK_ROWS)):
+			rows = min(CHUNK_ROWS, total - chunk * CHUNK_ROWS)
+			yield {name: np.load(self._chunk_file(name, chunk), mmap_mode="r")[:rows] for name in columns}
+
+	def column(self, name: str) -> np.ndarray:
+		"""
+		A whole column in memory. Only for tables small enough to hold; use scan otherwise.
+		"""
+		parts = [chunk[name] for chunk in self.scan([name])]
+		if not parts:
+			dtype, shape = self.schema[name]
+			return np.zeros((0,) + shape, dtype=dtype)
+		return np.concatenate(parts)
+
+class Results_Store:
+	"""
+	Simulation results on disk: a "games" table with one row per finished game and a "turns"
+	table with one row per turn played, both Column_Tables under one directory.
+
+	games: seed, config_hash, winner (player index, -1 for none), turns, players,
+		   final_balances (MAX_PLAYERS wide, unused seats 0), landings (one count per space)
+	turns: game (row in games), turn, player, position, balance, net_worth
+
+	Only one process should write to a store at a time; any number can read.
+
+	key responsibilities:
+	- holding the games and turns tables
+	- recording games as they are played (see Game_Recorder)
+	"""
+	def __init__(self, path: str, spaces: int = 40):
+		"""
+		:param path: The store's directory (created if needed).
+		:param spaces: Board size, the width of the landing counts (must match an existing store).
+		"""
+		os.makedirs(path, exist_ok=True)
+		self.path = path
+		self.games = Column_Table(os.path.join(path, "games"), {
+			"seed": ("int64", ()),
+			"config_hash": ("uint64", ()),
+			"winner": ("int16", ()),
+			"turns": ("int32", ()),
+			"players": ("int16", ()),
+			"final_balances": ("int32", (MAX_PLAYERS,)),
+			"landings": ("int32", (spaces,))
+		})
+		self.turns = Column_Table(os.path.join(path, "turns"), {
+			"game": ("int64", ()),
+			"turn": ("int32", ()),
+			"player": ("int16", ()),
+			"position": ("int16", ()),
+			"balance": ("int32", ()),
+			"net_worth": ("int32", ())
+		})
+
+	def __enter__(self) -> "Results_Store":
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> bool:
+		self.close()
+		return False
+
+	def recorder(self, game: "Game", seed: int) -> "Game_Recorder":
+		"""
+		Start recording a game into this store.
+		"""
+		return Game_Recorder(self, game, seed)
+
+	def flush(self) -> None:
+		self.turns.flush()
+		self.games.flush()
+
+	def close(self) -> None:
+		self.turns.close()
+		self.games.close()
+
+class Game_Recorder:
+	"""
+	Collects one game's turn rows and landing counts, and writes them to a Results_Store when
+	the game is over. Call record_turn after every turn and finish at the end.
+
+	The game's row in the games table is only taken in finish, just before its turn rows are
+	written, so any number of recorders can be open on one store at once and each game's turn
+	rows point at its own row whichever order they finish in.
+	"""
+	def __init__(self, store: "Results_Store", game: "Game", seed: int):
+		self.store = store
+		self.game = game
+		self.seed = seed
+		self.game_row: Optional[int] = None  # Assigned by finish
+		self.turn = 0
+		self.landings = np.zeros(store.games.schema["landings"][1][0], dtype=np.int64)
+		self._rows: List[Tuple[int, int, int, int, int]] = []
+
+	def record_turn(self, player: "Player") -> None:
+		"""
+		Record the turn a player has just played.
+		"""
+		index = self.game.players.index(player)
+		if player.position < len(self.landings):
+			self.landings[player.position] += 1
+		self._rows.append((self.turn, index, player.position, player.balance, player.net_worth))
+		self.turn += 1
+
+	def _write_turns(self) -> None:
+		if not self._rows:
+			return
+		rows = np.array(self._rows, dtype=np.int64)
+		self.store.turns.append({
+			"game": np.full(len(rows), self.game_row),
+			"turn": rows[:, 0],
+			"player": rows[:, 1],
+			"position": rows[:, 2],
+			"balance": rows[:, 3],
+			"net_worth": rows[:, 4]
+		})
+		self._rows = []
+
+	def finish(self) -> None:
+		"""
+		Write the game's row and its turn rows.
+
+		:raises ValueError: If the game has already been finished.
+		"""
+		if self.game_row is not None:
+			raise ValueError("This game has already been recorded.")
+		self.game_row = len(self.store.games)
+		self._write_turns()
+		players = self.game.players[:MAX_PLAYERS]
+		balances = np.zeros(MAX_PLAYERS, dtype=np.int64)
+		balances[:len(players)] = [player.balance for player in players]
+		standings = self.game.determine_winner()
+		winner = self.game.players.index(standings[0]) if standings else -1
+		self.store.games.append_row(
+			seed=self.seed,
+			config_hash=self.game.rules.hash,
+			winner=winner,
+			turns=self.turn,
+			players=len(self.game.players),
+			final_balances=balances,
+			landings=self.landings
+		)
@@ -1,96 +1,235 @@
-# save.py
-import os
-import json
-from typing import Dict, Any
-from Data.Config import load_spaces, load_config, load_chance, load_community_chest
-from Data.Saves import load_save
-from board import Board
-from Cards import Deck
-from bank import Bank
-from dice import Dice
-from Players import Player
-
-def save_game(game, save_slot: int):
-    """
-    Saves the current game state to a JSON file.
-    """
-    save_folder = 'Saves'
-    if not os.path.exists(save_folder):
-        os.makedirs(save_folder)
-    save_file = os.path.join(save_folder, f'Save_{save_slot}.json')
-
-    game_state = {
-        "Config": game.config,
-        "Players": [player.to_dict() for player in game.players],
-        "Current_Turn": game.current_turn,
-        "Bank": game.bank.to_dict(),
-        "Save_Slot": save_slot
-    }
-
-    with open(save_file, 'w') as file:
-        json.dump(game_state, file, indent=4)
-
-    print(f"Game saved successfully in slot {save_slot}.")
-
-def load_game(game, save_slot: int):
-    """
-    Loads a saved game state from a JSON file into an existing Game instance.
-    """
-    try:
-        game_state: Dict[str, Any] = load_save(save_slot)
-    except FileNotFoundError as e:
-        print(str(e))
-        return
-
-    game.config = game_state.get("Config", load_config())
-    game.bank = Bank(**game_state.get("Bank", {"houses": 32, "hotels": 16}))
-    game.dice = Dice(game.config)
-    game.save_slot = save_slot
-    game.current_turn = game_state.get("Current_Turn", 0)
-
-    # Load board and decks
-    decks_data = {"Chance": load_chance(), "Comunity_Chest": load_community_chest()}
-    game.decks = {
-        "Chance": Deck(decks_data["Chance"]),
-        "Comunity_Chest": Deck(decks_data["Comunity_Chest"])
-    }
-    game.board = Board(load_spaces(), game.config, game.decks)
-
-    # Link cards to players
-    card_lookup = {space.name: card for space, card in game.board.ownable_properties().items()}
-    game.players = [Player.from_dict(p_data, card_lookup) for p_data in game_state.get("Players", [])]
-
-    # Remove Jail cards from decks
-    if any(p.get_out_of_jail_free_cards[0] for p in game.players):
-        game.decks["Chance"].remove_card("get_out_of_jail_free")
-    if any(p.get_out_of_jail_free_cards[1] for p in game.players):
-        game.decks["Comunity_Chest"].remove_card("get_out_of_jail_free")
-
-    print(f"Game loaded successfully from slot {save_slot}.")
-
-def delete_save(save_slot: int):
-    """
-    Deletes the specified save file.
-    """
-    save_folder = 'Saves'
-    save_file = os.path.join(save_folder, f'Save_{save_slot}.json')
-    if os.path.exists(save_file):
-        os.remove(save_file)
-        print(f"Save slot {save_slot} deleted successfully.")
-    else:
-        print(f"Save {save_slot} does not exist.")
-
-def list_saves():
-    """
-    Lists all available save files in the Saves folder.
-    """
-    save_folder = 'Saves'
-    if os.path.exists(save_folder):
-        saves = os.listdir(save_folder)
-        print("Available save files:")
-        for save in saves:
-            print(save)
-        return saves
-    else:
-        print("No saves found.")
+# save.py
+import os
+import json
+import queue
+import threading
+from typing import Dict, Any, Optional, Type
+from Data.Config import load_spaces, load_config, load_chance, load_community_chest, compile_config
+from Data.Saves import load_save, write_save
+from Data.Saves.save_format import generation_paths
+from Board import Board
+from Cards import Deck
+from Core.bank import Bank
+from Core.dice import Dice
+from Players import Player, AI
+
+MAX_PENDING_SAVES = 8  # Saves queued for the background writer before save_game waits
+
+class Save_Writer:
+    """
+    Writes compressed saves on a background thread, so the game thread only pays for taking
+    the snapshot (the game state dict) and not for encoding, compressing and writing it.
+
+    Saves go through a bounded queue: when the disk falls MAX_PENDING_SAVES behind, submit
+    waits for room instead of letting snapshots pile up in memory. A failed write is raised
+    from the next flush or close.
+
+    key responsibilities:
+    - queueing save snapshots
+    - writing them in order on its own thread
+    """
+    def __init__(self, max_pending: int = MAX_PENDING_SAVES, folder: str = 'Saves'):
+        self.folder = folder
+        self.queue: "queue.Queue" = queue.Queue(max_pending)
+        self.error: Optional[BaseException] = None
+        self.thread = threading.Thread(target=self._run, name="Save_Writer", daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        while True:
+            task = self.queue.get()
+            try:
+                if task is None:
+                    return
+                save_slot, game_state = task
+                write_save(save_slot, game_state, self.folder)
+            except BaseException as e:
+                self.error = e
+            finally:
+                self.queue.task_done()
+
+    def submit(self, save_slot: int, game_state: Dict[str, Any]) -> None:
+        """
+        Queue a snapshot to be written (waits if the queue is full).
+        """
+        if not self.thread.is_alive():
+            raise RuntimeError("The save writer has been closed.")
+        self.queue.put((save_slot, game_state))
+
+    def flush(self) -> None:
+        """
+        Wait until every queued save is on disk.
+
+        :raises: The first error a write hit since the last flush.
+        """
+        self.queue.join()
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def __enter__(self) -> "Save_Writer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.close()
+        return False
+
+def game_state(game, save_slot: int) -> Dict[str, Any]:
+    """
+    A snapshot of everything a save holds, independent of the live game objects.
+    """
+    cards = [space.get_card() for space in game.board.ownable_spaces]
+    return {
+        "Config": game.config,
+        "Players": [player.to_dict() for player in game.players],
+        "Current_Turn": game.current_turn,
+        "Bank": game.bank.to_dict(),
+        "Buildings": {card.location.name: card.houses for card in cards if getattr(card, "houses", 0)},
+        "Mortgaged": [card.location.name for card in cards if card.mortgaged],
+        "Decks": {name: [card.description for card in deck.cards] for name, deck in game.decks.items()},
+        "Save_Slot": save_slot
+    }
+
+def save_game(game, save_slot: int, compressed: bool = False, writer: Optional[Save_Writer] = None):
+    """
+    Saves the current game state to a JSON file.
+
+    :param compressed: Write a compressed, checksummed save instead (Save_<slot>.sav), keeping
+                       the previous generations to fall back to if it is ever corrupted.
+    :param writer: Hand the compressed save to this background writer rather than writing it
+                   here (implies compressed).
+    """
+    state = game_state(game, save_slot)
+    if writer is not None:
+        writer.submit(save_slot, state)
+        return
+    save_folder = 'Saves'
+    if compressed:
+        write_save(save_slot, state, save_folder)
+        print(f"Game saved successfully in slot {save_slot}.")
+        return
+
+    if not os.path.exists(save_folder):
+        os.makedirs(save_folder)
+    save_file = os.path.join(save_folder, f'Save_{save_slot}.json')
+
+    with open(save_file, 'w') as file:
+        json.dump(state, file, indent=4)
+
+    print(f"Game saved successfully in slot {save_slot}.")
+
+def restore_game(game, game_state: Dict[str, Any], player_class: Optional[Type[Player]] = None,
+                 data: Optional[Dict[str, Any]] = None):
+    """
+    Loads a game state (as made by game_state) into an existing Game instance.
+
+    :param player_class: The class every loaded player is created as (e.g. AI, to let the
+                         computer play on from a saved position). By default players are
+                         loaded as they were saved, AIs as AIs.
+    :param data: The spaces and cards the game was built from, if not the bundled json files.
+    """
+    data = data or {}
+    game.config = game_state.get("Config", load_config())
+    game.rules = compile_config(game.config)
+    game.bank = Bank(**game_state.get("Bank", {"houses": game.rules.houses, "hotels": game.rules.hotels}))
+    game.dice = Dice(game.rules)
+    game.current_turn = game_state.get("Current_Turn", 0)
+
+    # Load board and decks
+    decks_data = {"Chance": data.get("Chance") or load_chance(), "Comunity_Chest": data.get("Comunity_Chest") or load_community_chest()}
+    game.decks = {
+        "Chance": Deck(decks_data["Chance"]),
+        "Comunity_Chest": Deck(decks_data["Comunity_Chest"])
+    }
+    game.board = Board(data.get("Spaces") or load_spaces(), game.rules, game.decks)
+
+    # Link cards to players
+    card_lookup = {space.name: space.get_card() for space in game.board.ownable_spaces}
+    game.players = []
+    for p_data in game_state.get("Players", []):
+        cls = player_class or (AI if p_data.get("AI") else Player)
+        game.players.append(cls.from_dict(p_data, card_lookup))
+    for player in game.players:
+        player.bank = game.bank
+
+    # Buildings and mortgages (older saves have neither)
+    for name, houses in game_state.get("Buildings", {}).items():
+        if name in card_lookup:
+            card_lookup[name].houses = houses
+    for name in game_state.get("Mortgaged", []):
+        if name in card_lookup:
+            card_lookup[name].mortgaged = True
+
+    # Remove Jail cards from decks
+    if any(p.get_out_of_jail_free_cards[0] for p in game.players):
+        game.decks["Chance"].remove_card("get_out_of_jail_free")
+    if any(p.get_out_of_jail_free_cards[1] for p in game.players):
+        game.decks["Comunity_Chest"].remove_card("get_out_of_jail_free")
+    # Put the decks back in their saved order
+    for name, order in game_state.get("Decks", {}).items():
+        deck = game.decks.get(name)
+        if deck is not None and sorted(order) == sorted(card.description for card in deck.cards):
+            by_description: Dict[str, list] = {}
+            for card in deck.cards:
+                by_description.setdefault(card.description, []).append(card)
+            deck.cards = [by_description[description].pop() for description in order]
+    game.compile_house_rules()
+    game._turn_machine = None
+    game.started = True  # A saved game is already under way
+    game.attach_zobrist()
+
+def load_game(game, save_slot: int, player_class: Optional[Type[Player]] = None):
+    """
+    Loads a saved game state from a JSON file into an existing Game instance.
+
+    :param player_class: The class every loaded player is created as (e.g. AI, to let the
+                         computer play on from a saved position). By default players are
+                         loaded as they were saved.
+    """
+    try:
+        game_state: Dict[str, Any] = load_save(save_slot)
+    except FileNotFoundError as e:
+        print(str(e))
+        return
+
+    restore_game(game, game_state, player_class)
+    game.save_slot = save_slot
+
+    print(f"Game loaded successfully from slot {save_slot}.")
+
+def delete_save(save_slot: int):
+    """
+    Deletes the specified save file.
+    """
+    save_folder = 'Saves'
+    save_files = [os.path.join(save_folder, f'Save_{save_slot}.json')] + generation_paths(save_slot, save_folder)
+    save_files = [save_file for save_file in save_files if os.path.exists(save_file)]
+    if save_files:
+        for save_file in save_files:
+            os.remove(save_file)
+        print(f"Save slot {save_slot} deleted successfully.")
+    else:
+        print(f"Save {save_slot} does not exist.")
+
+def list_saves():
+    """
+    Lists all available save files in the Saves folder.
+    """
+    save_folder = 'Saves'
+    if os.path.exists(save_folder):
+        saves = os.listdir(save_folder)
+        print("Available save files:")
+        for save in saves:
+            print(save)
+        return saves
+    else:
+        print("No saves found.")
         return []
\ No newline at end of file
@@ -0,0 +1,102 @@
+from multiprocessing import shared_memory
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
+
+ALIGNMENT = 64  # Byte alignment of each table in the block (a cache line)
+
+class Shared_Tables:
+	"""
+	Read-only NumPy tables published once in a multiprocessing.shared_memory block, so any number
+	of worker processes can use them without a copy each.
+
+	The publishing process packs every array into one block and keeps it alive; workers attach
+	to it by its handle (the block's name, where each table lies in it, and any small scalar
+	values), which is a few hundred bytes to send however large the tables are. Attached tables
+	are NumPy views straight onto the shared pages and are marked read-only, so a worker can not
+	change them for the others by mistake.
+
+	Use the publisher as a context manager, or call close, to free the block when done.
+
+	key responsibilities:
+	- packing tables into a shared memory block
+	- attaching to a published block as zero-copy views
+	- freeing the block
+	"""
+	def __init__(self, memory: "shared_memory.SharedMemory", layout: Dict[str, Tuple[str, Tuple[int, ...], int]],
+				 values: Dict[str, Any], owner: bool):
+		"""
+		Use publish or attach rather than constructing directly.
+
+		:param layout: table name -> (dtype, shape, byte offset in the block).
+		:param values: Scalars shared alongside the tables (sent with the handle).
+		:param owner: Whether this is the publisher, which frees the block on close.
+		"""
+		self.memory = memory
+		self.layout = layout
+		self.values = values
+		self.owner = owner
+		self.arrays: Dict[str, np.ndarray] = {}
+		for name, (dtype, shape, offset) in layout.items():
+			array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=memory.buf, offset=offset)
+			array.flags.writeable = False
+			self.arrays[name] = array
+
+	@classmethod
+	def publish(cls, arrays: Dict[str, np.ndarray], values: Optional[Dict[str, Any]] = None) -> "Shared_Tables":
+		"""
+		Copy tables into a new shared memory block.
+
+		:param arrays: table name -> array.
+		:param values: Small picklable values to hand to workers with the tables.
+		"""
+		layout: Dict[str, Tuple[str, Tuple[int, ...], int]] = {}
+		size = 0
+		for name, array in arrays.items():
+			array = np.asarray(array)
+			size = -(-size // ALIGNMENT) * ALIGNMENT
+			layout[name] = (array.dtype.str, array.shape, size)
+			size += array.nbytes
+		memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+		for name, array in arrays.items():
+			dtype, shape, offset = layout[name]
+			np.ndarray(shape, dtype=np.dtype(dtype), buffer=memory.buf, offset=offset)[...] = array
+		return cls(memory, layout, dict(values or {}), owner=True)
+
+	def handle(self) -> Tuple[str, Dict[str, Tuple[str, Tuple[int, ...], int]], Dict[str, Any]]:
+		"""
+		What a worker needs to attach (pass it to the pool's initializer, not with every task).
+		"""
+		return self.memory.name, self.layout, self.values
+
+	@classmethod
+	def attach(cls, handle: Tuple[str, Dict[str, Tuple[str, Tuple[int, ...], int]], Dict[str, Any]]) -> "Shared_Tables":
+		"""
+		Attach to tables published by another process.
+		"""
+		name, layout, values = handle
+		return cls(shared_memory.SharedMemory(name=name), layout, values, owner=False)
+
+	@property
+	def nbytes(self) -> int:
+		return self.memory.size
+
+	def __enter__(self) -> "Shared_Tables":
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> bool:
+		self.close()
+		return False
+
+	def close(self) -> None:
+		"""
+		Detach from the block, and free it if this is the publisher. Views still held
+		elsewhere keep the mapping alive until they are dropped.
+		"""
+		self.arrays = {}
+		try:
+			self.memory.close()
+		except BufferError:
+			pass  # Views are still in use; the mapping goes when they do
+		if self.owner:
+			self.owner = False
+			self.memory.unlink()
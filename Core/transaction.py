@@ -0,0 +1,253 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from Board.Space_Types import Property_Group
+if TYPE_CHECKING:
+	from Board.Space_Types import Property
+	from Board import Ownable_Space, Ownable_Card
+	from Players import Player
+	from Core import Bank
+
+class Journal:
+	"""
+	Bank operations that record every change they make, so they can be undone.
+
+	Each operation checks the rules against the current state, then changes it through _set,
+	which records (object, attribute, previous value). Replaying those records backwards with
+	setattr restores the state exactly; cards and players keep their groups, holdings and
+	net worth up to date through their setters both ways. Undoing costs one step per change,
+	independent of the size of the game.
+
+	Used by Transaction (all-or-nothing batches) and Action_Stack (make/unmake for searches).
+
+	key responsibilities:
+	- validated, journaled bank operations
+	- undoing them
+	"""
+	def __init__(self, bank: "Bank"):
+		"""
+		:param bank: The bank whose house and hotel stock the operations use.
+		"""
+		self.bank = bank
+		self.journal: List[Tuple[Any, str, Any]] = []  # (object, attribute, previous value)
+
+	def _undo_to(self, length: int) -> None:
+		"""
+		Undo changes until the journal is back to the given length.
+		"""
+		journal = self.journal
+		while len(journal) > length:
+			obj, attribute, value = journal.pop()
+			setattr(obj, attribute, value)
+
+	def _set(self, obj: Any, attribute: str, value: Any) -> None:
+		"""
+		Set an attribute, journaling its previous value.
+		Attributes with setters (owner, houses) keep their groups up to date both ways.
+		"""
+		self.journal.append((obj, attribute, getattr(obj, attribute)))
+		setattr(obj, attribute, value)
+
+	def _change_balance(self, player: "Player", amount: int) -> None:
+		self._set(player, "balance", player.balance + amount)
+
+	# === Operations ===
+	def _transfer(self, card: "Ownable_Card", target: Optional["Player"]) -> None:
+		previous_owner = card.owner
+		if previous_owner is target:
+			return
+		if any(getattr(p.get_card(), "houses", 0) > 0 for p in card.location.group.properties):
+			raise ValueError(f"Buildings in the group must be sold before {card.location.name} can change hands.")
+		self._set(card, "owner", target)  # Also moves the card between the players' holdings
+
+	def _build(self, card: "Ownable_Card") -> None:
+		property = card.location
+		group = property.group
+		if not isinstance(group, Property_Group):
+			raise TypeError("Only properties in a Property_Group can be upgraded.")
+		if not group.can_build_house(card):
+			raise ValueError(f"Cannot build on {property.name} now (monopoly or even build rules violated).")
+		if card.mortgaged:
+			raise ValueError(f"Cannot build on mortgaged {property.name}.")
+		if card.houses < 4:
+			if self.bank.houses <= 0:
+				raise ValueError("No houses left in the bank.")
+			self._set(self.bank, "houses", self.bank.houses - 1)
+		elif card.houses == 4:
+			if self.bank.hotels <= 0:
+				raise ValueError("No hotels left in the bank.")
+			self._set(self.bank, "hotels", self.bank.hotels - 1)
+			self._set(self.bank, "houses", self.bank.houses + 4)
+		else:
+			raise ValueError("Maximum upgrade (hotel) already reached.")
+		self._set(card, "houses", card.houses + 1)
+		self._change_balance(card.owner, -property.build_cost)
+
+	def _sell(self, card: "Ownable_Card") -> None:
+		property = card.location
+		group = property.group
+		houses = getattr(card, "houses", 0)
+		if houses == 0:
+			raise ValueError("No houses or hotels to sell.")
+		# Even selling: only sell from a property with the most buildings in its group
+		if any(p.get_card().houses > houses for p in group.properties):
+			raise ValueError(f"Cannot sell from {property.name} now (even build rule violated).")
+		if houses == 5:
+			if self.bank.houses < 4:
+				raise ValueError("Not enough houses in the bank to break up the hotel.")
+			self._set(self.bank, "hotels", self.bank.hotels + 1)
+			self._set(self.bank, "houses", self.bank.houses - 4)
+		else:
+			self._set(self.bank, "houses", self.bank.houses + 1)
+		self._set(card, "houses", houses - 1)
+		self._change_balance(card.owner, property.build_cost // 2)
+
+	def _mortgage(self, card: "Ownable_Card") -> None:
+		if card.owner is None:
+			raise ValueError(f"{card.location.name} is not owned.")
+		if card.mortgaged:
+			raise ValueError(f"{card.location.name} is already mortgaged.")
+		if any(getattr(p.get_card(), "houses", 0) > 0 for p in card.location.group.properties):
+			raise ValueError(f"Buildings in the group must be sold before mortgaging {card.location.name}.")
+		self._set(card, "mortgaged", True)
+		self._change_balance(card.owner, card.location.mortgage_value)
+
+	def _unmortgage(self, card: "Ownable_Card") -> None:
+		if card.owner is None or not card.mortgaged:
+			raise ValueError(f"{card.location.name} is not mortgaged.")
+		self._set(card, "mortgaged", False)
+		self._change_balance(card.owner, -int(card.location.mortgage_value * 1.1))
+
+	def _pay(self, player: "Player", amount: int, recipient: Optional["Player"]) -> None:
+		if amount < 0:
+			raise ValueError("Payments can not be negative.")
+		self._change_balance(player, -amount)
+		if recipient is not None:
+			self._change_balance(recipient, amount)
+
+class Transaction(Journal):
+	"""
+	A batch of bank operations that is applied all at once or not at all.
+
+	Operations are staged with transfer, build, sell, mortgage, unmortgage, pay and
+	set_jail_cards, then commit applies them in order. Each operation checks its own rules
+	against the state left by the ones before it, and every change is recorded in a journal.
+	If any operation fails, a player would be left with a negative balance, or anything else
+	raises part way through, the journal is replayed backwards and the error is raised,
+	leaving the game exactly as it was.
+
+	A committed transaction can also be rolled back, which makes trying out candidate
+	batches (e.g. in an AI search) a matter of commit, evaluate, rollback.
+
+	Money moves directly inside a transaction: a player who can not cover a payment makes
+	the whole batch fail rather than being liquidated part way through. A batch that leaves a
+	player in debt is only allowed if it made them no worse off (e.g. mortgages raising part
+	of what they owe).
+
+	key responsibilities:
+	- staging, validating and applying batches of bank operations
+	- undoing them cheaply
+	"""
+	def __init__(self, bank: "Bank"):
+		"""
+		:param bank: The bank whose house and hotel stock the operations use.
+		"""
+		super().__init__(bank)
+		self.operations: List[Tuple[Callable[..., None], Tuple[Any, ...]]] = []
+		self.players: Dict["Player", int] = {}  # balance before the batch of each player it changed
+		self.committed = False
+
+	def __enter__(self) -> "Transaction":
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> bool:
+		# Commit a with block that finished normally, drop the batch if it raised
+		if exc_type is None and not self.committed:
+			self.commit()
+		return False
+
+	# === Staging ===
+	def transfer(self, property: "Ownable_Space", target: Optional["Player"]) -> "Transaction":
+		"""
+		Stage a change of owner (None returns the property to the bank).
+		"""
+		self.operations.append((self._transfer, (property.get_card(), target)))
+		return self
+
+	def build(self, property: "Property") -> "Transaction":
+		"""
+		Stage building one house (or a hotel on 4 houses), paid for by the owner.
+		"""
+		self.operations.append((self._build, (property.get_card(),)))
+		return self
+
+	def sell(self, property: "Property") -> "Transaction":
+		"""
+		Stage selling one house (or a hotel) back to the bank for half its build cost.
+		"""
+		self.operations.append((self._sell, (property.get_card(),)))
+		return self
+
+	def mortgage(self, card: "Ownable_Card") -> "Transaction":
+		"""
+		Stage mortgaging a property for its mortgage value.
+		"""
+		self.operations.append((self._mortgage, (card,)))
+		return self
+
+	def unmortgage(self, card: "Ownable_Card") -> "Transaction":
+		"""
+		Stage unmortgaging a property for its mortgage value plus 10%.
+		"""
+		self.operations.append((self._unmortgage, (card,)))
+		return self
+
+	def pay(self, player: "Player", amount: int, recipient: Optional["Player"] = None) -> "Transaction":
+		"""
+		Stage a payment to the bank, or to another player if a recipient is given.
+		"""
+		self.operations.append((self._pay, (player, amount, recipient)))
+		return self
+
+	def set_jail_cards(self, player: "Player", cards: Tuple[bool, bool]) -> "Transaction":
+		"""
+		Stage setting which "Get Out of Jail Free" cards a player holds.
+		"""
+		self.operations.append((self._set, (player, "get_out_of_jail_free_cards", tuple(cards))))
+		return self
+
+	# === Commit / rollback ===
+	def commit(self) -> None:
+		"""
+		Apply every staged operation, or none of them.
+
+		:raises ValueError: If any operation is not allowed; nothing is changed.
+		"""
+		if self.committed:
+			raise ValueError("Transaction has already been committed.")
+		try:
+			for operation, args in self.operations:
+				operation(*args)
+			for player, before in self.players.items():
+				# Raising money for a player already in debt is allowed even if it is not enough
+				if player.balance < 0 and player.balance < before:
+					raise ValueError(f"{player.name} can not afford this transaction.")
+		except BaseException:
+			# Whatever stopped the batch part way (a rule, a listener, an interrupt), undo it all
+			self._undo()
+			raise
+		self.committed = True
+
+	def rollback(self) -> None:
+		"""
+		Undo a committed transaction, restoring the state from before commit.
+		Costs one step per change made, independent of game size.
+		"""
+		self._undo()
+		self.committed = False
+
+	def _undo(self) -> None:
+		self._undo_to(0)
+		self.players = {}
+
+	def _change_balance(self, player: "Player", amount: int) -> None:
+		self.players.setdefault(player, player.balance)
+		super()._change_balance(player, amount)
@@ -1,62 +1,203 @@
-# turn.py
-
-from Players import Player
-from Core import Game
-
-def process_turn(game: "Game", player: "Player") -> None:
-	"""
-	Process a single player's turn:
-	- If in jail, attempt to resolve jail status.
-	- Roll dice (handling doubles/speed dice).
-	- Move and land on space.
-	- Trigger any effects of landing.
-	- End turn.
-	"""
-	print(f"\n--- {player.name}'s Turn ---")
-
-	if player.in_jail:
-		print(f"{player.name} is in jail.")
-		freed = player.handle_jail_turn(game)
-		if not freed:
-			print(f"{player.name} remains in jail.")
-			return  # End turn early if still jailed
-
-	# Dice rolling
-	roll = game.dice.roll()
-	player.dice_roll = roll
-	print(f"{player.name} rolled: {roll}")
-
-	# Movement
-	steps = roll["total"]
-	game.board.move_player(player, steps)
-	new_space = game.board.spaces[player.position]
-	print(f"{player.name} landed on {new_space.name}.")
-
-	# Space interaction
-	new_space.on_land(player, game)
-
-	# End turn
-	player.end_turn(game)
-
-
-def actions_menu(player: Player, game: Game) -> None:
-	"""
-	Display a menu of actions that the player can take during their turn.
-	"""
-	print("\n--- Actions Menu ---")
-	print("1. Build")
-	print("2. Trade")
-	print("3. Mortgage/Unmortgage")
-	print("4. End Turn")
-
-	choice = input("Choose an action (1-4): ")
-	if choice == "1":
-		player.build(game)###############################
-	elif choice == "2":
-		player.trade(game)
-	elif choice == "3":
-		player.mortgage_unmortgage(game)
-	elif choice == "4":
-		return
-	else:
+# turn.py
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from Players import AI
+if TYPE_CHECKING:
+	from Players import Player
+	from Core import Game
+
+# Turn phases, in the order a turn goes through them
+START, JAIL, ROLL, MOVE, LAND, ACTIONS, END, GAME_OVER = "start", "jail", "roll", "move", "land", "actions", "end", "game_over"
+
+@dataclass(frozen=True, slots=True)
+class Turn_Event:
+	"""
+	Something that happened in a step: kind is one of "game_started", "turn_started", "skipped",
+	"jail", "rolled", "moved", "landed", "actions", "bankrupt", "turn_ended" or "game_over".
+	"""
+	kind: str
+	player: Optional["Player"] = None
+	data: Dict[str, Any] = field(default_factory=dict)
+
+class Turn_Machine:
+	"""
+	The turn flow of a game as an explicit state machine, so a game can be advanced one phase
+	at a time by whoever drives it (a loop, a server, a scheduler interleaving many games)
+	without threads or blocking.
+
+	A turn goes START -> (JAIL) -> ROLL -> MOVE -> LAND -> ACTIONS -> END and back to START for
+	the next player, with the same rules as process_turn (one roll per turn); AI players take
+	their end of turn actions in ACTIONS. Each step runs one phase and returns the events it
+	emitted. Once one player is left the machine stays in GAME_OVER.
+
+	key responsibilities:
+	- tracking the current phase and player
+	- running one phase per step
+	- driving the game until a condition holds
+	"""
+	def __init__(self, game: "Game"):
+		self.game = game
+		self.phase = START
+		self.player: Optional["Player"] = None
+		self.roll: Optional[Dict[str, Any]] = None
+		self.turns = 0  # Turns completed
+		self._phases: Dict[str, Callable[[List["Turn_Event"]], str]] = {
+			START: self._start, JAIL: self._jail, ROLL: self._roll, MOVE: self._move,
+			LAND: self._land, ACTIONS: self._actions, END: self._end, GAME_OVER: self._game_over
+		}
+
+	def step(self) -> List["Turn_Event"]:
+		"""
+		Run the current phase and move on to the next.
+
+		:return: The events emitted.
+		"""
+		events: List["Turn_Event"] = []
+		self.phase = self._phases[self.phase](events)
+		return events
+
+	def run_until(self, turns: Optional[int] = None, predicate: Optional[Callable[["Game"], bool]] = None) -> int:
+		"""
+		Step until the game is over, turns more turns have been completed, or predicate(game)
+		is true after a step.
+
+		:return: The number of turns completed.
+		"""
+		start = self.turns
+		phases = self._phases
+		events: List["Turn_Event"] = []
+		while self.phase != GAME_OVER:
+			self.phase = phases[self.phase](events)
+			events.clear()
+			if turns is not None and self.turns - start >= turns:
+				break
+			if predicate is not None and predicate(self.game):
+				break
+		return self.turns - start
+
+	# === Phases ===
+	def _start(self, events: List["Turn_Event"]) -> str:
+		game = self.game
+		if not game.started:
+			game.begin()
+			events.append(Turn_Event("game_started"))
+		if game.is_game_over():
+			winners = game.determine_winner()
+			events.append(Turn_Event("game_over", winners[0] if winners else None))
+			return GAME_OVER
+		player = game.players[game.current_turn]
+		if player.bankrupt:
+			events.append(Turn_Event("skipped", player))
+			game.next_player()
+			return START
+		self.player = player
+		self.roll = None
+		events.append(Turn_Event("turn_started", player))
+		return JAIL if player.in_jail else ROLL
+
+	def _jail(self, events: List["Turn_Event"]) -> str:
+		freed = self.player.handle_jail_turn(self.game)
+		events.append(Turn_Event("jail", self.player, {"freed": freed}))
+		if self.player.bankrupt:
+			return END
+		return ROLL if freed else END
+
+	def _roll(self, events: List["Turn_Event"]) -> str:
+		self.roll = self.game.dice.roll()
+		self.player.dice_roll = self.roll
+		events.append(Turn_Event("rolled", self.player, {"roll": self.roll}))
+		return MOVE
+
+	def _move(self, events: List["Turn_Event"]) -> str:
+		start = self.player.position
+		self.game.board.move_player(self.player, self.roll["total"])
+		events.append(Turn_Event("moved", self.player, {"from": start, "to": self.player.position}))
+		return LAND
+
+	def _land(self, events: List["Turn_Event"]) -> str:
+		game = self.game
+		space = game.board.spaces[self.player.position]
+		space.on_land(self.player, game, self.roll["total"])
+		game.house_rules.land(space, self.player, game)
+		events.append(Turn_Event("landed", self.player, {"space": space.name}))
+		return ACTIONS
+
+	def _actions(self, events: List["Turn_Event"]) -> str:
+		if isinstance(self.player, AI) and not self.player.bankrupt:
+			self.player.decide_turn_actions(self.game)
+			events.append(Turn_Event("actions", self.player))
+		return END
+
+	def _end(self, events: List["Turn_Event"]) -> str:
+		player = self.player
+		if not player.bankrupt:
+			player.end_turn(self.game)
+		else:
+			events.append(Turn_Event("bankrupt", player))
+		self.game.next_player()
+		self.turns += 1
+		events.append(Turn_Event("turn_ended", player))
+		return START
+
+	def _game_over(self, events: List["Turn_Event"]) -> str:
+		return GAME_OVER
+
+def process_turn(game: "Game", player: "Player") -> None:
+	"""
+	Process a single player's turn:
+	- If in jail, attempt to resolve jail status.
+	- Roll dice (handling doubles/speed dice).
+	- Move and land on space.
+	- Trigger any effects of landing.
+	- End turn.
+	"""
+	print(f"\n--- {player.name}'s Turn ---")
+
+	if player.in_jail:
+		print(f"{player.name} is in jail.")
+		freed = player.handle_jail_turn(game)
+		if not freed:
+			print(f"{player.name} remains in jail.")
+			return  # End turn early if still jailed
+
+	# Dice rolling
+	roll = game.dice.roll()
+	player.dice_roll = roll
+	print(f"{player.name} rolled: {roll}")
+
+	# Movement
+	steps = roll["total"]
+	game.board.move_player(player, steps)
+	new_space = game.board.spaces[player.position]
+	print(f"{player.name} landed on {new_space.name}.")
+
+	# Space interaction
+	new_space.on_land(player, game, steps)
+	game.house_rules.land(new_space, player, game)
+
+	# End turn
+	player.end_turn(game)
+
+
+def actions_menu(player: "Player", game: "Game") -> None:
+	"""
+	Display a menu of actions that the player can take during their turn.
+	"""
+	print("\n--- Actions Menu ---")
+	print("1. Build")
+	print("2. Trade")
+	print("3. Mortgage/Unmortgage")
+	print("4. End Turn")
+
+	choice = input("Choose an action (1-4): ")
+	if choice == "1":
+		player.build(game)###############################
+	elif choice == "2":
+		player.trade(game)
+	elif choice == "3":
+		player.mortgage_unmortgage(game)
+	elif choice == "4":
+		return
+	else:
 		print("Invalid choice. Please try again.")
\ No newline at end of file
@@ -0,0 +1,225 @@
+import contextlib
+import os
+import shutil
+import sys
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, TextIO
+from Core.turn import GAME_OVER
+from Board import Ownable_Space
+if TYPE_CHECKING:
+	from Core import Game
+	from Core.turn import Turn_Event
+	from Players import Player
+
+DEFAULT_FPS = 20  # Frames drawn per second at most
+NAME_WIDTH = 24
+OWNER_WIDTH = 12
+HEADER_ROWS = 2  # Status line and a blank line above the spaces
+
+# ANSI escape sequences
+CLEAR = "\x1b[2J\x1b[H"
+CLEAR_LINE = "\x1b[K"
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+
+def _move_to(row: int) -> str:
+	return f"\x1b[{row + 1};1H"
+
+class Terminal_UI:
+	"""
+	A live view of a game in the terminal: one row per space (owner, houses or hotel, mortgage
+	and the players on it), a row per player and a status line.
+
+	The whole screen is drawn once, after which a frame only rewrites the rows that changed.
+	Only spaces whose group changed (see Group.version) or that a player moved to or from are
+	redrawn, and a row is written only if its text is different from what is on screen, so a
+	frame costs a handful of short writes whatever the board's size.
+
+	Frames are limited to fps: events arriving sooner are only noted, and the changes are drawn
+	together by the next frame. Nothing ever waits for the terminal, so watching a fast AI game
+	does not slow it down, and the terminal gets at most fps small updates a second.
+
+	key responsibilities:
+	- laying out the board, players and status
+	- tracking which rows changed since the last frame
+	- limiting how often frames are drawn
+	"""
+	def __init__(self, game: "Game", stream: Optional[TextIO] = None, fps: float = DEFAULT_FPS,
+				 clock: Callable[[], float] = time.monotonic):
+		"""
+		:param stream: Where to draw (defaults to the current sys.stdout).
+		:param fps: Frames drawn per second at most (every event is drawn if 0).
+		:param clock: Time source in seconds, for the frame limit.
+		"""
+		self.game = game
+		self.stream = stream if stream is not None else sys.stdout
+		self.frame_interval = 1 / fps if fps > 0 else 0.0
+		self.clock = clock
+		self.status = ""
+		self.frames = 0
+		self._last_frame: Optional[float] = None
+		self._lines: List[str] = []  # What is on screen, by row
+		self._dirty: Set[int] = set()  # Spaces to redraw on the next frame
+		self._group_versions: Dict[str, int] = {}
+		self._positions: List[int] = []  # Where each player was drawn
+		self._width = 0
+		self._visible = 0  # Spaces that fit on screen
+		self._player_row = 0
+		self._height = 0
+
+	# === Drawing ===
+	def draw(self, force: bool = False) -> bool:
+		"""
+		Draw a frame if one is due (or force is set): the whole screen the first time, after
+		that only the rows that changed.
+
+		:return: Whether a frame was drawn.
+		"""
+		now = self.clock()
+		if not force and self._last_frame is not None and now - self._last_frame < self.frame_interval:
+			return False
+		self._last_frame = now
+		self.frames += 1
+		if not self._lines:
+			self._draw_all()
+		else:
+			self._draw_changes()
+		return True
+
+	def _draw_all(self) -> None:
+		board = self.game.board
+		columns, rows = shutil.get_terminal_size()
+		self._width = columns
+		# Spaces that do not fit are left off, so rows never scroll out from under the cursor
+		self._visible = max(min(board.board_size, rows - HEADER_ROWS - len(self.game.players) - 2), 0)
+		self._player_row = HEADER_ROWS + self._visible + 1
+		self._height = self._player_row + len(self.game.players)
+		self._lines = [""] * self._height
+		self._note_changes()
+		self._dirty.clear()
+		for i in range(self._visible):
+			self._lines[HEADER_ROWS + i] = self._space_line(i)
+		self._lines[0] = self._status_line()
+		for i, player in enumerate(self.game.players):
+			self._lines[self._player_row + i] = self._player_line(player)
+		self.stream.write(CLEAR + "\n".join(self._lines))
+		self.stream.flush()
+
+	def _draw_changes(self) -> None:
+		self._note_changes()
+		rows: Dict[int, str] = {0: self._status_line()}
+		for position in self._dirty:
+			if position < self._visible:
+				rows[HEADER_ROWS + position] = self._space_line(position)
+		self._dirty.clear()
+		for i, player in enumerate(self.game.players[:self._height - self._player_row]):
+			rows[self._player_row + i] = self._player_line(player)
+		writes = []
+		for row, text in rows.items():
+			if self._lines[row] != text:
+				self._lines[row] = text
+				writes.append(_move_to(row) + text + CLEAR_LINE)
+		if writes:
+			self.stream.write("".join(writes) + _move_to(self._height))
+			self.stream.flush()
+
+	def _note_changes(self) -> None:
+		"""
+		Mark the spaces changed since the last frame: those in a group whose version moved on,
+		and those a player left or arrived at.
+		"""
+		for name, group in self.game.board.groups.items():
+			if self._group_versions.get(name) != group.version:
+				self._group_versions[name] = group.version
+				self._dirty.update(space.position for space in group.properties)
+		positions = [player.position for player in self.game.players]
+		if positions != self._positions:
+			self._dirty.update(self._positions)
+			self._dirty.update(positions)
+			self._positions = positions
+
+	# === Rows ===
+	def _fit(self, text: str) -> str:
+		return text[:self._width - 1]
+
+	def _status_line(self) -> str:
+		game = self.game
+		machine = game.existing_turn_machine
+		turns = machine.turns if machine is not None else 0
+		if machine is not None and machine.phase == GAME_OVER:
+			current = "Game over"
+		else:
+			current = game.players[game.current_turn].name if game.players else ""
+		return self._fit(f"Turn {turns:<6} {current:<{OWNER_WIDTH}} {self.status}")
+
+	def _space_line(self, position: int) -> str:
+		space = self.game.board.spaces[position]
+		owner = buildings = ""
+		if isinstance(space, Ownable_Space):
+			card = space.get_card()
+			owner = card.owner.name if card.owner is not None else "-"
+			houses = getattr(card, "houses", 0)
+			buildings = "Hotel" if houses == 5 else "H" * houses
+			if card.mortgaged:
+				buildings = "Mortgaged"
+		here = " ".join(player.name for player in self.game.players if player.position == position and not player.bankrupt)
+		return self._fit(f"{position:3} {space.name[:NAME_WIDTH]:<{NAME_WIDTH}} {owner[:OWNER_WIDTH]:<{OWNER_WIDTH}} {buildings:<9} {here}")
+
+	def _player_line(self, player: "Player") -> str:
+		if player.bankrupt:
+			state = "Bankrupt"
+		else:
+			space = self.game.board.spaces[player.position]
+			state = f"${player.balance:<7} {len(player.owned_properties):>3} owned   at {space.name}"
+			if player.in_jail:
+				state += " (in jail)"
+		return self._fit(f"{player.name[:OWNER_WIDTH]:<{OWNER_WIDTH}} {state}")
+
+	# === Events ===
+	def handle(self, events: List["Turn_Event"]) -> None:
+		"""
+		Show the latest events in the status line and draw a frame if one is due.
+		"""
+		for event in events:
+			self.status = self._describe(event)
+		self.draw(force=any(event.kind == "game_over" for event in events))
+
+	@staticmethod
+	def _describe(event: "Turn_Event") -> str:
+		name = event.player.name if event.player is not None else ""
+		if event.kind == "rolled":
+			return f"{name} rolled {event.data['roll']['total']}"
+		if event.kind == "landed":
+			return f"{name} landed on {event.data['space']}"
+		if event.kind == "jail":
+			return f"{name} left jail" if event.data["freed"] else f"{name} stays in jail"
+		if event.kind == "game_over":
+			return f"{name} wins" if name else "No winner"
+		return f"{name} {event.kind.replace('_', ' ')}".strip()
+
+	# === Watching ===
+	def watch(self, turns: Optional[int] = None) -> int:
+		"""
+		Play the game step by step while showing it, until it is over or turns more turns have
+		been played. What the game prints is discarded while it plays, as it would scroll the
+		screen.
+
+		:return: The number of turns played.
+		"""
+		machine = self.game.turn_machine
+		start = machine.turns
+		if os.name == "nt":
+			os.system("")  # Turns on escape sequence handling in the Windows console
+		self.stream.write(HIDE_CURSOR)
+		try:
+			with open(os.devnull, "w") as discard, contextlib.redirect_stdout(discard):
+				self.draw(force=True)
+				while machine.phase != GAME_OVER:
+					self.handle(machine.step())
+					if turns is not None and machine.turns - start >= turns:
+						break
+		finally:
+			self.draw(force=True)
+			self.stream.write(SHOW_CURSOR + "\n")
+			self.stream.flush()
+		return machine.turns - start
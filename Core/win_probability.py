@@ -0,0 +1,181 @@
+import contextlib
+import io
+import math
+import os
+import queue
+import random
+import time
+from multiprocessing import Pool
+from typing import Dict, Any, Optional, Tuple
+from Core import Game
+from Core.save import load_game
+from Players import AI
+
+Z_95 = 1.96  # Normal quantile for 95% confidence intervals
+MIN_GAMES = 30  # Continuations played before the intervals are trusted to stop early
+MAX_TURNS = 300  # Turns a continuation is played for before the wealthiest player is taken as the winner
+
+def wilson_interval(wins: int, games: int, z: float = Z_95) -> Tuple[float, float]:
+	"""
+	Wilson score confidence interval for a win rate (well behaved near 0 and 1 and for few games).
+
+	:return: (low, high).
+	"""
+	if games == 0:
+		return 0.0, 1.0
+	p = wins / games
+	denominator = 1 + z * z / games
+	centre = (p + z * z / (2 * games)) / denominator
+	spread = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denominator
+	return max(centre - spread, 0.0), min(centre + spread, 1.0)
+
+def play_continuation(task: Tuple[int, int, int]) -> Optional[int]:
+	"""
+	Play one randomized continuation of a saved game with every player controlled by the AI.
+	Runs in a worker process.
+
+	:param task: (save slot, seed, maximum turns).
+	:return: The index of the winning player, or None if nobody is left standing.
+	"""
+	save_slot, seed, max_turns = task
+	random.seed(seed)
+	with contextlib.redirect_stdout(io.StringIO()):
+		game = Game()
+		load_game(game, save_slot, AI)
+		game.run_until(turns=max_turns)
+	standings = game.determine_winner()
+	return game.players.index(standings[0]) if standings else None
+
+class Win_Probability_Estimator:
+	"""
+	Estimates each player's chance of winning from a saved position by Monte Carlo.
+
+	The save is played on many times from its current state with every player handed to the
+	AI and different dice each time, spread over a pool of worker processes. Each player's win
+	rate comes with a Wilson confidence interval, and sampling stops as soon as every interval
+	is within the requested precision, or the time limit is reached, whichever comes first.
+
+	The worker pool is kept between calls so a live display can ask for a fresh estimate every
+	turn without paying process start up each time. Each call keeps at most one continuation
+	per worker in flight and stops handing out new ones once a continuation would not finish
+	before the deadline; if any are still running when it returns, the pool is replaced, so
+	the next estimate never waits behind them. Use it as a context manager, or call close.
+
+	key responsibilities:
+	- running continuations in parallel
+	- turning them into win probabilities with confidence intervals
+	"""
+	def __init__(self, workers: Optional[int] = None):
+		"""
+		:param workers: Worker processes (defaults to every core).
+		"""
+		self.workers = workers or os.cpu_count() or 1
+		self._pool: Optional["Pool"] = None
+
+	def __enter__(self) -> "Win_Probability_Estimator":
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> bool:
+		self.close()
+		return False
+
+	def close(self) -> None:
+		"""
+		Stop the worker processes.
+		"""
+		if self._pool is not None:
+			self._pool.terminate()
+			self._pool.join()
+			self._pool = None
+
+	def estimate(self, save_slot: int, time_limit: float = 1.0, precision: float = 0.05,
+				 max_games: int = 10000, max_turns: int = MAX_TURNS, seed: Optional[int] = None) -> Dict[str, Any]:
+		"""
+		Estimate every player's win probability from a save slot.
+
+		:param save_slot: The slot to load with Core.save.load_game.
+		:param time_limit: Seconds to spend at most.
+		:param precision: Stop once every 95% interval's half width is at most this.
+		:param max_games: Continuations to play at most.
+		:param max_turns: Turns each continuation is played for; the wealthiest player left
+						  then counts as the winner.
+		:param seed: Base seed for repeatable estimates (random if None).
+		:return: {"games", "seconds", "converged", "players": {name: {"probability", "low", "high"}}}
+		:raises ValueError: If the save slot can not be loaded.
+		"""
+		start = time.perf_counter()
+		deadline = start + time_limit
+		with contextlib.redirect_stdout(io.StringIO()):
+			game = Game()
+			load_game(game, save_slot)
+		names = [player.name for player in game.players]
+		if not names:
+			raise ValueError(f"Save slot {save_slot} could not be loaded.")
+
+		if self._pool is None:
+			self._pool = Pool(self.workers)
+		base_seed = seed if seed is not None else random.randrange(2 ** 31)
+		results: "queue.Queue" = queue.Queue()
+		submitted = 0
+
+		def submit() -> None:
+			nonlocal submitted
+			task = (save_slot, base_seed + submitted, max_turns)
+			self._pool.apply_async(play_continuation, (task,), callback=results.put, error_callback=results.put)
+			submitted += 1
+
+		# One continuation per worker: queueing more would only leave work behind at the deadline
+		for _ in range(min(self.workers, max_games)):
+			submit()
+
+		wins = [0] * len(names)
+		games = 0
+		converged = False
+		while games < max_games:
+			remaining = deadline - time.perf_counter()
+			if remaining <= 0:
+				break
+			try:
+				winner = results.get(timeout=remaining)
+			except queue.Empty:
+				break
+			if isinstance(winner, BaseException):
+				self.close()
+				raise winner
+			games += 1
+			if winner is not None:
+				wins[winner] += 1
+			if games >= MIN_GAMES:
+				intervals = [wilson_interval(w, games) for w in wins]
+				if all(high - low <= 2 * precision for low, high in intervals):
+					converged = True
+					break
+			# A worker takes about (elapsed time * workers / games) per continuation
+			now = time.perf_counter()
+			if submitted < max_games and now + (now - start) * self.workers / games < deadline:
+				submit()
+			elif submitted == games:
+				break  # Nothing left running, and no time (or games) for more
+
+		if submitted > games:
+			# Continuations still running would hold up the next estimate
+			self.close()
+
+		players: Dict[str, Dict[str, float]] = {}
+		for name, w in zip(names, wins):
+			low, high = wilson_interval(w, games)
+			players[name] = {"probability": w / games if games else 1 / len(names), "low": low, "high": high}
+		return {
+			"games": games,
+			"seconds": time.perf_counter() - start,
+			"converged": converged,
+			"players": players
+		}
+
+def estimate_win_probability(save_slot: int, workers: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+	"""
+	One-off estimate with a temporary worker pool (see Win_Probability_Estimator.estimate
+	for the options). Keep a Win_Probability_Estimator open instead for repeated live estimates.
+	"""
+	with Win_Probability_Estimator(workers) as estimator:
+		return estimator.estimate(save_slot, **kwargs)
@@ -0,0 +1,125 @@
+import hashlib
+from typing import Dict, Optional, Tuple
+
+BALANCE_BUCKET = 100  # Balances are hashed in ranges of this width
+BALANCE_BUCKETS = 64  # Balances above the last range share it
+
+class Zobrist:
+	"""
+	An incrementally updated 64 bit Zobrist hash of a game's state.
+
+	Every state feature (a space's owner, its number of houses, whether it is mortgaged, each
+	player's position, balance range and jail flag, and the top card of each deck) has a random
+	64 bit key; the hash is the XOR of the keys of the features present. When a feature changes,
+	XORing out the old key and in the new one updates the hash in O(1), so the cards, players
+	and decks report their own changes to the game's Zobrist and value is always current.
+
+	Keys are derived from the feature's description (space position, player seat, deck name, ...)
+	with blake2b rather than drawn at random, so equal states hash equally in every process and
+	every run: results can be shared between workers and saved snapshots compared by hash.
+
+	Two states with the same hash are almost certainly the same state (balances only to within
+	BALANCE_BUCKET), which makes it a cheap key for transposition tables and duplicate checks.
+
+	key responsibilities:
+	- generating feature keys
+	- updating the hash as the game changes
+	- attaching a game's objects to it
+	"""
+	def __init__(self, seed: int = 0):
+		"""
+		:param seed: Changes every key (hashes from different seeds are not comparable).
+		"""
+		self.seed = seed
+		self.value = 0
+		self._keys: Dict[Tuple, int] = {}
+
+	def key(self, *feature) -> int:
+		"""
+		The 64 bit key of a state feature, e.g. key("owner", 5, 1).
+		"""
+		key = self._keys.get(feature)
+		if key is None:
+			digest = hashlib.blake2b(repr((self.seed,) + feature).encode(), digest_size=8).digest()
+			key = self._keys[feature] = int.from_bytes(digest, "little")
+		return key
+
+	@staticmethod
+	def bucket(balance: int) -> int:
+		return min(max(balance, 0) // BALANCE_BUCKET, BALANCE_BUCKETS - 1)
+
+	# === Updates ===
+	def owner(self, position: int, previous_seat: Optional[int], seat: Optional[int]) -> None:
+		if previous_seat is not None:
+			self.value ^= self.key("owner", position, previous_seat)
+		if seat is not None:
+			self.value ^= self.key("owner", position, seat)
+
+	def houses(self, position: int, previous_houses: int, houses: int) -> None:
+		if previous_houses:
+			self.value ^= self.key("houses", position, previous_houses)
+		if houses:
+			self.value ^= self.key("houses", position, houses)
+
+	def mortgage(self, position: int) -> None:
+		"""
+		Toggle a space's mortgaged flag.
+		"""
+		self.value ^= self.key("mortgaged", position)
+
+	def position(self, seat: int, previous_position: int, position: int) -> None:
+		self.value ^= self.key("position", seat, previous_position) ^ self.key("position", seat, position)
+
+	def balance(self, seat: int, previous_balance: int, balance: int) -> None:
+		previous_bucket, bucket = self.bucket(previous_balance), self.bucket(balance)
+		if previous_bucket != bucket:
+			self.value ^= self.key("balance", seat, previous_bucket) ^ self.key("balance", seat, bucket)
+
+	def jail(self, seat: int) -> None:
+		"""
+		Toggle a player's in jail flag.
+		"""
+		self.value ^= self.key("jail", seat)
+
+	def cursor(self, deck: str, previous_top: Optional[str], top: Optional[str]) -> None:
+		if previous_top != top:
+			self.value ^= self.key("deck", deck, previous_top) ^ self.key("deck", deck, top)
+
+	# === Whole game ===
+	def compute(self, game: "Game") -> int:
+		"""
+		The hash of a game's state computed from scratch (for attaching, and for checking value).
+		"""
+		value = 0
+		for space in game.board.ownable_spaces:
+			card = space.get_card()
+			if card.owner is not None and getattr(card.owner, "seat", None) is not None:
+				value ^= self.key("owner", space.position, card.owner.seat)
+			if getattr(card, "houses", 0):
+				value ^= self.key("houses", space.position, card.houses)
+			if card.mortgaged:
+				value ^= self.key("mortgaged", space.position)
+		for seat, player in enumerate(game.players):
+			value ^= self.key("position", seat, player.position)
+			value ^= self.key("balance", seat, self.bucket(player.balance))
+			if player.in_jail:
+				value ^= self.key("jail", seat)
+		for name, deck in game.decks.items():
+			value ^= self.key("deck", name, deck.top())
+		return value
+
+	def attach(self, game: "Game") -> None:
+		"""
+		Make a game's board, players and decks report their changes to this hash, and
+		set value from the game's current state. Called again whenever players join or the
+		board, players or decks are replaced (e.g. on load).
+		"""
+		game.zobrist = self
+		game.board.zobrist = self
+		for seat, player in enumerate(game.players):
+			player.seat = seat
+			player.zobrist = self
+		for name, deck in game.decks.items():
+			deck.name = name
+			deck.zobrist = self
+		self.value = self.compute(game)
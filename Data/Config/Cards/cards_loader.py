@@ -1,7 +1,8 @@
-from json_loader import load_json
-
-def load_community_chest():
-    return load_json("community_chest.json")
-
-def load_chance():
-    return load_json("chance.json")
+import os
+from Data.json_loader import load_json
+
+def load_community_chest():
+    return load_json(os.path.join("Config", "Cards", "community_chest.json"))
+
+def load_chance():
+    return load_json(os.path.join("Config", "Cards", "chance.json"))
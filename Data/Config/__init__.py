@@ -1,5 +1,6 @@
-from .Cards.cards_loader import load_community_chest, load_chance
-
-from .config_loader import load_config, load_spaces
-
-__all__ = ["load_community_chest", "load_chance", "load_config", "load_spaces"]
+from .Cards.cards_loader import load_community_chest, load_chance
+
+from .config_loader import load_config, load_spaces
+from .game_config import Game_Config, compile_config
+
+__all__ = ["load_community_chest", "load_chance", "load_config", "load_spaces", "Game_Config", "compile_config"]
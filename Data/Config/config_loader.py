@@ -1,7 +1,8 @@
-from json_loader import load_json
-
-def load_config():
-    return load_json("config.json")
-
-def load_spaces():
-    return load_json("spaces.json")
\ No newline at end of file
+import os
+from Data.json_loader import load_json
+
+def load_config():
+    return load_json(os.path.join("Config", "config.json"))
+
+def load_spaces():
+    return load_json(os.path.join("Config", "spaces.json"))
\ No newline at end of file
@@ -0,0 +1,115 @@
+import hashlib
+import json
+from dataclasses import dataclass, fields
+from typing import Dict, Any, List
+
+@dataclass(frozen=True, slots=True)
+class Speed_Dice_Config:
+	active: bool = True
+	monopoly_man_count: int = 2
+	bus_count: int = 1
+
+@dataclass(frozen=True, slots=True)
+class Game_Config:
+	"""
+	The rules of a game compiled from config.json: validated once, then read as plain attributes
+	(game.rules.bail_amount rather than game.config["Bail_Amount"]) and never changed.
+
+	Field names are the json keys in lower case. hash is a 64 bit hash of the config's contents,
+	the same for any two configs that set the same rules, so results and snapshots from
+	different rules are never mixed up.
+
+	key responsibilities:
+	- holding the rules with their types
+	- converting back to the json form
+	"""
+	houses: int = 32
+	hotels: int = 16
+	starting_amount: int = 1500
+	base_salary: int = 200
+	bail_amount: int = 50
+	max_turns_in_jail: int = 3
+	rent_in_jail: bool = False
+	unmortgage_in_jail: bool = False
+	build_in_jail: bool = False
+	trade_in_jail: bool = False
+	double_salary_on_go: bool = False
+	starting_random_properties: int = 0
+	dice_size: int = 6
+	dice_number: int = 2
+	speed_dice: Speed_Dice_Config = Speed_Dice_Config()
+	hash: int = 0
+
+	def to_dict(self) -> Dict[str, Any]:
+		"""
+		The config in its json form (as saved with a game).
+		"""
+		config = {_json_key(f.name): getattr(self, f.name) for f in fields(self) if f.name not in ("speed_dice", "hash")}
+		config["Speed_Dice"] = {_json_key(f.name): getattr(self.speed_dice, f.name) for f in fields(self.speed_dice)}
+		return config
+
+def _json_key(name: str) -> str:
+	return "_".join(word.capitalize() for word in name.split("_"))
+
+def _compile_fields(cls, values: Dict[str, Any], path: str, problems: List[str]) -> Dict[str, Any]:
+	"""
+	Check a json object against a config class's fields, collecting every problem.
+	"""
+	known = {_json_key(f.name): f for f in fields(cls) if f.name != "hash"}
+	compiled = {}
+	for key in values:
+		if key not in known:
+			problems.append(f"{path}{key}: unknown setting")
+	for key, field in known.items():
+		if key not in values:
+			continue
+		value = values[key]
+		if field.type is bool:
+			if not isinstance(value, bool):
+				problems.append(f"{path}{key}: expected true or false, got {value!r}")
+				continue
+		elif field.type is int:
+			# bool is an int in Python, but true is never a sensible count
+			if isinstance(value, bool) or not isinstance(value, int):
+				problems.append(f"{path}{key}: expected a whole number, got {value!r}")
+				continue
+			if value < 0:
+				problems.append(f"{path}{key}: can not be negative")
+				continue
+		compiled[field.name] = value
+	return compiled
+
+def compile_config(config: Dict[str, Any]) -> "Game_Config":
+	"""
+	Validate a config (as loaded from config.json) and compile it into a Game_Config. Settings
+	left out take their standard values.
+
+	:raises ValueError: Listing every unknown setting, wrongly typed or out of range value.
+	"""
+	if not isinstance(config, dict):
+		raise ValueError(f"The config must be a json object, got {type(config).__name__}.")
+	problems: List[str] = []
+	config = dict(config)
+	speed = config.pop("Speed_Dice", {})
+	compiled = _compile_fields(Game_Config, config, "", problems)
+	if isinstance(speed, dict):
+		speed_dice = Speed_Dice_Config(**_compile_fields(Speed_Dice_Config, speed, "Speed_Dice.", problems))
+	else:
+		problems.append(f"Speed_Dice: expected a json object, got {speed!r}")
+		speed_dice = Speed_Dice_Config()
+	rules = Game_Config(speed_dice=speed_dice, **compiled)
+
+	if rules.dice_size < 1:
+		problems.append("Dice_Size: dice need at least one face")
+	if rules.dice_number < 1:
+		problems.append("Dice_Number: at least one die is needed")
+	if rules.max_turns_in_jail < 1:
+		problems.append("Max_Turns_In_Jail: must be at least 1")
+	if speed_dice.active and speed_dice.bus_count + speed_dice.monopoly_man_count > rules.dice_size:
+		problems.append("Speed_Dice: more Bus and Monopoly Man faces than the die has")
+	if problems:
+		raise ValueError("Invalid config:\n  " + "\n  ".join(problems))
+
+	text = json.dumps(rules.to_dict(), sort_keys=True).encode()
+	content_hash = int.from_bytes(hashlib.sha1(text).digest()[:8], "little")
+	return Game_Config(speed_dice=speed_dice, hash=content_hash, **compiled)
@@ -1,3 +1,4 @@
-from .load_save import load_save
-
-__all__ = ["load_save"]
\ No newline at end of file
+from .save_format import encode_save, decode_save, write_save
+from .load_save import load_save
+
+__all__ = ["load_save", "encode_save", "decode_save", "write_save"]
@@ -1,9 +1,24 @@
-from json_loader import load_json
-import os
-
-def load_save(save_slot = 0):
-	save_file = f'Save_{save_slot}.json'
-	if os.path.exists(save_file):
-		return load_json(save_file)
-	else:
-		print(f"error, there is no file under save slot {save_slot}.")
\ No newline at end of file
+from Data.json_loader import load_json
+from .save_format import SAVE_FOLDER, generation_paths, decode_save
+import os
+
+def load_save(save_slot = 0):
+	"""
+	Load a slot's newest good save: its compressed generations newest first, skipping any that
+	fail their checksum, or a plain JSON save if that was written more recently.
+
+	:raises FileNotFoundError: If the slot has no save that can be read.
+	"""
+	json_files = [f for f in (os.path.join(SAVE_FOLDER, f'Save_{save_slot}.json'), f'Save_{save_slot}.json') if os.path.exists(f)]
+	compressed = [f for f in generation_paths(save_slot) if os.path.exists(f)]
+	if json_files and (not compressed or os.path.getmtime(json_files[0]) >= os.path.getmtime(compressed[0])):
+		return load_json(os.path.abspath(json_files[0]))
+	for save_file in compressed:
+		try:
+			with open(save_file, 'rb') as file:
+				return decode_save(file.read())
+		except ValueError as e:
+			print(f"{save_file} could not be loaded ({e}), trying the previous save.")
+	if json_files:
+		return load_json(os.path.abspath(json_files[0]))
+	raise FileNotFoundError(f"error, there is no file under save slot {save_slot}.")
@@ -0,0 +1,68 @@
+import json
+import os
+import struct
+import zlib
+from typing import Dict, Any, List
+
+SAVE_FOLDER = 'Saves'
+GENERATIONS = 3  # Compressed saves kept per slot: the newest and the ones it replaced
+COMPRESSION_LEVEL = 6
+MAGIC = b"MSAV"
+VERSION = 1
+# Magic, format version, CRC-32 and length of the uncompressed JSON
+HEADER = struct.Struct("<4sBII")
+
+def save_path(save_slot: int, generation: int = 0, folder: str = SAVE_FOLDER) -> str:
+	"""
+	The file of a slot's compressed save: generation 0 is the newest, 1 the one before it, ...
+	"""
+	suffix = f".{generation}" if generation else ""
+	return os.path.join(folder, f'Save_{save_slot}{suffix}.sav')
+
+def generation_paths(save_slot: int, folder: str = SAVE_FOLDER) -> List[str]:
+	return [save_path(save_slot, generation, folder) for generation in range(GENERATIONS)]
+
+def encode_save(game_state: Dict[str, Any]) -> bytes:
+	"""
+	Compact JSON, zlib compressed, behind a header holding the JSON's CRC-32 and length.
+	"""
+	text = json.dumps(game_state, separators=(",", ":")).encode()
+	return HEADER.pack(MAGIC, VERSION, zlib.crc32(text), len(text)) + zlib.compress(text, COMPRESSION_LEVEL)
+
+def decode_save(data: bytes) -> Dict[str, Any]:
+	"""
+	:raises ValueError: If the data is truncated, corrupted or not a compressed save.
+	"""
+	if len(data) < HEADER.size:
+		raise ValueError("Save file is truncated.")
+	magic, version, checksum, length = HEADER.unpack_from(data)
+	if magic != MAGIC or version != VERSION:
+		raise ValueError("Not a compressed save file.")
+	try:
+		text = zlib.decompress(data[HEADER.size:])
+	except zlib.error as e:
+		raise ValueError(f"Save file is corrupted: {e}")
+	if len(text) != length or zlib.crc32(text) != checksum:
+		raise ValueError("Save file failed its checksum.")
+	return json.loads(text)
+
+def write_save(save_slot: int, game_state: Dict[str, Any], folder: str = SAVE_FOLDER) -> None:
+	"""
+	Write a compressed save as the slot's newest generation, keeping the previous ones.
+
+	The file is written and synced under a temporary name before the older generations are
+	shifted along and it is renamed into place, so a crash at any point leaves at least one
+	complete generation for load_save to fall back to.
+	"""
+	os.makedirs(folder, exist_ok=True)
+	data = encode_save(game_state)
+	temporary = save_path(save_slot, 0, folder) + ".tmp"
+	with open(temporary, 'wb') as file:
+		file.write(data)
+		file.flush()
+		os.fsync(file.fileno())
+	paths = generation_paths(save_slot, folder)
+	for older, newer in zip(reversed(paths[1:]), reversed(paths[:-1])):
+		if os.path.exists(newer):
+			os.replace(newer, older)
+	os.replace(temporary, paths[0])
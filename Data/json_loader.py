@@ -1,8 +1,8 @@
-import json
-import os
-
-def load_json(file_name: str):
-    base_path = os.path.dirname(__file__)
-    file_path = os.path.join(base_path, file_name)
-    with open(file_path, 'r') as file:
+import json
+import os
+
+def load_json(file_name: str):
+    base_path = os.path.dirname(__file__)
+    file_path = os.path.join(base_path, file_name)
+    with open(file_path, 'r') as file:
         return json.load(file)
\ No newline at end of file
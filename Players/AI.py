@@ -1,256 +1,362 @@
-from typing import Optional, List, Dict, Tuple
-from Players import Player
-from Core import Game
-from Board import Ownable_Space
-from Space_Types import Property
-from Board import Ownable_Card
-
-class AI(Player):
-    def __init__(self, name: str, starting_balance: int):
-        super().__init__(name, starting_balance)
-
-    # === Core Turn Logic ===
-    def decide_turn_actions(self, game: Game) -> None:
-        """
-        Determine and execute the AI's actions for this turn:
-        - Build houses
-        - Unmortgage properties
-        - Propose trades
-        """
-        actions = self.prioritize_actions(game)
-
-        for action in actions:
-            if action == "unmortgage":
-                for card in self.decide_unmortgage(game):
-                    self.unmortgage_property(card)
-
-            elif action == "build":
-                for prop in self.decide_build(game):
-                    game.bank.upgrade_property(prop.get_card())
-
-            elif action == "trade":
-                trade = self.decide_trade(game)
-                if trade:
-                    proposer, offer, request = trade
-                    self.trade(self, proposer, offer, request)
-
-            elif action == "mortgage":
-                for card in self.decide_mortgage(game):
-                    self.mortgage_property(card)
-
-    def decide_jail_strategy(self, game: Game) -> str:
-        """
-        Determine how to handle being in jail.
-        Returns one of: "use_card", "pay_bail", or "roll".
-        """
-        if self.use_get_out_of_jail_free_card():
-            return "use_card"
-        if self.can_afford(game.config.get("Bail_Amount", 50)):
-            return "pay_bail"
-        return "roll"
-
-    def decide_buy(self, property: Ownable_Space, game: Game) -> bool:
-        """
-        Decide whether to buy a property the AI has landed on.
-        Return True to buy, False to decline.
-        """
-        value = self.evaluate_property_value(property, game)
-        return value >= property.buying_price
-
-    def decide_build(self, game: Game) -> List[Property]:
-        """
-        Return a list of properties to build houses on this turn.
-        """
-        build_list = []
-        for card in self.owned_properties:
-            if hasattr(card, 'houses') and card.houses < 5:
-                group = card.location.group
-                if group.count_owned(self) == len(group.properties):
-                    if self.can_afford(card.location.build_cost):
-                        build_list.append(card.location)
-        return build_list
-
-    def decide_sell(self, game: Game) -> List[Property]:
-        """
-        Return a list of properties to downgrade/sell buildings from.
-        """
-        sell_list = []
-        for card in self.owned_properties:
-            if hasattr(card, 'houses') and card.houses > 0:
-                sell_list.append(card.location)
-        return sell_list
-
-    def decide_trade(self, game: Game) -> Optional[Tuple[Player, Dict, Dict]]:
-        """
-        Return a proposed trade as (target_player, offer_dict, request_dict), or None.
-        """
-        pass
-
-    def decide_mortgage(self, game: Game) -> List[Ownable_Card]:
-        """
-        Return a list of property cards to mortgage for cash.
-        """
-        mortgage_list = []
-        for card in self.owned_properties:
-            if not card.mortgaged and self.project_cashflow_risk(game) != "safe":
-                mortgage_list.append(card)
-        return mortgage_list
-
-    def decide_unmortgage(self, game: Game) -> List[Ownable_Card]:
-        """
-        Return a list of property cards to unmortgage this turn.
-        """
-        unmortgage_list = []
-        for card in self.owned_properties:
-            if card.mortgaged:
-                cost = int(card.location.mortgage_value * 1.1)
-                if self.can_afford(cost):
-                    unmortgage_list.append(card)
-        return unmortgage_list
-
-    # === Auction ===
-    def decide_auction_bid(self, property: Ownable_Space, current_bid: int, game: Game) -> int:
-        """
-        Return the maximum bid the AI is willing to make for a property in auction.
-        Return 0 to pass.
-        """
-        value = self.evaluate_property_value(property, game)
-        if value > current_bid:
-            increment = min(100, value - current_bid)
-            return current_bid + increment
-        return 0
-
-    # === Evaluation ===
-    def evaluate_property_value(self, property: "Ownable_Space", game: "Game") -> int:
-        """
-        Evaluate how much this property is worth to the AI based on monopoly potential,
-        blocking others, scarcity, and current balance.
-        """
-        group = property.group
-        group_props = group.properties
-        owned_by_self = group.count_owned(self)
-        total_in_group = len(group_props)
-        owned_by_others = sum(1 for p in group_props if p.get_card().owner not in [None, self])
-        remaining_unowned = sum(1 for p in group_props if p.get_card().owner is None)
-
-        base_value = property.buying_price
-
-        if owned_by_self == total_in_group - 1:
-            base_value *= 1.75  # Completing monopoly
-        elif owned_by_others == total_in_group - 1:
-            base_value *= 1.5  # Blocking opponent
-
-        remaining_ownables = sum(1 for p in game.board.spaces if isinstance(p, Ownable_Space) and p.get_card().owner is None)
-        scarcity_multiplier = 1.1 if remaining_ownables < 10 else 1.0
-        base_value *= scarcity_multiplier
-
-        max_bid = self.balance - self.calculate_safe_cash_reserve(game)
-        return min(int(base_value), max_bid)
-
-    def evaluate_group_value(self, group_name: str, game: Game) -> int:
-        """
-        Evaluate the strategic value of an entire group (monopoly potential, rent, build cost).
-        """
-        group = game.board.groups.get(group_name)
-        if not group:
-            return 0
-
-        total_value = 0
-        for prop in group.properties:
-            card = prop.get_card()
-            value = prop.buying_price
-            if hasattr(card, 'houses'):
-                value += card.houses * prop.build_cost
-            total_value += value
-
-        monopoly_factor = 2 if group.count_owned(self) == len(group.properties) else 1
-        return total_value * monopoly_factor
-
-    def calculate_safe_cash_reserve(self, game: Game) -> int:
-        """
-        Calculate how much cash the AI wants to keep in reserve.
-        """
-        avg_rent = 0
-        opponent_properties = [p for p in game.board.spaces if isinstance(p, Ownable_Space) and p.get_card().owner not in [None, self]]
-        if opponent_properties:
-            rent_values = [sum(card.rent.values()) / len(card.rent) for card in (p.get_card() for p in opponent_properties)]
-            avg_rent = sum(rent_values) / len(rent_values)
-        return max(200, int(avg_rent * 2))  # Keep at least double the average rent
-
-    def project_cashflow_risk(self, game: Game) -> str:
-        """
-        Analyze rent risk based on opponents' properties.
-        Returns: "safe", "moderate", or "danger"
-        """
-        high_rent_zones = [p.get_card().rent[max(p.get_card().rent.keys())] for p in game.board.spaces
-                           if isinstance(p, Ownable_Space) and p.get_card().owner not in [None, self]]
-        if not high_rent_zones:
-            return "safe"
-
-        risk_threshold = max(high_rent_zones)
-        if self.balance >= risk_threshold * 2:
-            return "safe"
-        elif self.balance >= risk_threshold:
-            return "moderate"
-        else:
-            return "danger"
-
-    # === Analysis ===
-    def predict_landing_distribution(self, game: Game) -> Dict[str, float]:
-        """
-        Estimate the chance of landing on each property in the next few turns.
-        """
-        steps_ahead = 12
-        distribution = {}
-        board_size = len(game.board.spaces)
-
-        for i in range(2, steps_ahead + 1):  # Typical dice roll is 2-12
-            pos = (self.position + i) % board_size
-            space = game.board.spaces[pos]
-            distribution[space.name] = distribution.get(space.name, 0) + 1
-
-        total = sum(distribution.values())
-        return {name: count / total for name, count in distribution.items()}
-
-    def prioritize_actions(self, game: Game) -> List[str]:
-        """
-        Return a list of recommended actions this turn, sorted by importance.
-        """
-        priorities = []
-        risk = self.project_cashflow_risk(game)
-
-        if risk == "danger":
-            priorities.append("mortgage")
-        if self.balance > 300:
-            priorities.append("unmortgage")
-            priorities.append("build")
-        if risk != "safe":
-            priorities.append("trade")
-        priorities.append("end_turn")
-
-        return priorities
-    # === Trading Strategy ===
-    def is_trade_worth_it(self, offer: Dict, request: Dict, game: Game) -> bool:
-        """
-        Evaluate if the proposed trade is favorable.
-        """
-        pass
-
-    def select_trade_partner(self, game: Game) -> Optional[Player]:
-        """
-        Select a player to propose a trade to.
-        """
-        pass
-
-    def generate_trade_offer(self, game: Game) -> Tuple[Dict, Dict]:
-        """
-        Create a trade offer dictionary (offering and requesting resources).
-        """
-        pass
-
-    # === Endgame ===
-    def switch_to_endgame_mode(self, game: Game) -> bool:
-        """
-        Return True if AI should adopt an endgame strategy (e.g., last 2 players).
-        """
-        pass
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple
+from Players.player import Player
+from Board.Space_Types import Property
+from Core.build_planner import plan_builds
+from Players.trade_engine import Trade_Engine
+from Core.analytics import Analytics
+from Players.eval_cache import Eval_Cache
+if TYPE_CHECKING:
+    from Core import Game
+    from Board import Ownable_Space, Ownable_Card
+
+DEVELOPED_HOUSES = 3  # Houses a completed monopoly is valued at
+
+# Tunable strategy weights (see Tuning.optimizer). An AI can be given its own values for any of them.
+DEFAULT_PARAMETERS: Dict[str, float] = {
+    "income_horizon": 30,  # Opponent turns expected rent is counted over when valuing property
+    "blocking_weight": 0.5,  # Share of the income denied to an opponent that counts as value
+    "scarcity_multiplier": 1.1,  # Applied to property values once few properties are left unowned
+    "scarcity_threshold": 10,  # Unowned properties below which the scarcity multiplier applies
+    "reserve_floor": 200,  # Least cash kept in reserve
+    "reserve_rent_multiple": 2,  # Reserve as a multiple of the average opponent rent
+    "action_balance_threshold": 300  # Balance above which the AI unmortgages and builds
+}
+
+class AI(Player):
+    def __init__(self, name: str, starting_balance: int, parameters: Optional[Dict[str, float]] = None, **kwargs):
+        """
+        :param parameters: Strategy weights overriding DEFAULT_PARAMETERS.
+        :param kwargs: Passed on to Player (position, jail state, ...), so Player.from_dict works for AIs too.
+        """
+        super().__init__(name, starting_balance, **kwargs)
+        self.parameters = dict(DEFAULT_PARAMETERS)
+        if parameters:
+            unknown = set(parameters) - set(DEFAULT_PARAMETERS)
+            if unknown:
+                raise ValueError(f"Unknown AI parameters: {', '.join(sorted(unknown))}")
+            self.parameters.update(parameters)
+        # Valuations are memoized per board state (see Eval_Cache); the stats show how often they are reused
+        self.eval_cache = Eval_Cache()
+
+    def to_dict(self) -> Dict:
+        data = super().to_dict()
+        data["AI"] = True
+        data["Parameters"] = dict(self.parameters)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict, card_lookup: Dict[str, "Ownable_Card"]) -> "AI":
+        ai = super().from_dict(data, card_lookup)
+        ai.parameters.update({k: v for k, v in data.get("Parameters", {}).items() if k in DEFAULT_PARAMETERS})
+        return ai
+
+    # === Core Turn Logic ===
+    def decide_turn_actions(self, game: "Game") -> None:
+        """
+        Determine and execute the AI's actions for this turn:
+        - Build houses
+        - Unmortgage properties
+        - Propose trades
+        """
+        actions = self.prioritize_actions(game)
+
+        for action in actions:
+            if not game.house_rules.allows(action, self):
+                continue  # In jail, only the actions a house rule allows
+            if action == "unmortgage":
+                for card in self.decide_unmortgage(game):
+                    self.unmortgage_property(card)
+
+            elif action == "build":
+                plan = self.decide_build(game)
+                if plan:
+                    game.bank.apply_builds(self, plan)
+
+            elif action == "trade":
+                trade = self.decide_trade(game)
+                if trade:
+                    target, offer, request = trade
+                    if not game.house_rules.allows("trade", target):
+                        continue
+                    try:
+                        game.bank.offer_trade(self, target, offer, request, game)
+                    except ValueError:
+                        pass  # Trade was no longer valid; nothing changed
+
+            elif action == "mortgage":
+                for card in self.decide_mortgage(game):
+                    self.mortgage_property(card)
+
+    def decide_jail_strategy(self, game: "Game") -> str:
+        """
+        Determine how to handle being in jail.
+        Returns one of: "use_card", "pay_bail", or "roll".
+        """
+        if self.use_get_out_of_jail_free_card():
+            return "use_card"
+        if self.can_afford(game.rules.bail_amount):
+            return "pay_bail"
+        return "roll"
+
+    def decide_buy(self, property: "Ownable_Space", game: "Game") -> bool:
+        """
+        Decide whether to buy a property the AI has landed on.
+        Return True to buy, False to decline.
+        """
+        value = self.evaluate_property_value(property, game)
+        return value >= property.buying_price
+
+    def decide_build(self, game: "Game") -> List[Property]:
+        """
+        Return the properties to build houses on this turn, in build order
+        (a property appears once per house), spending only cash above the safe reserve.
+        """
+        budget = self.balance - self.calculate_safe_cash_reserve(game)
+        if budget <= 0:
+            return []
+        return plan_builds(self, budget, game.bank.houses, game.bank.hotels)
+
+    def decide_sell(self, game: "Game") -> List[Property]:
+        """
+        Return a list of properties to downgrade/sell buildings from.
+        """
+        sell_list = []
+        for card in self.owned_properties:
+            if hasattr(card, 'houses') and card.houses > 0:
+                sell_list.append(card.location)
+        return sell_list
+
+    def decide_trade(self, game: "Game") -> Optional[Tuple[Player, Dict, Dict]]:
+        """
+        Return a proposed trade as (target_player, offer_dict, request_dict), or None.
+        Only trades that complete a monopoly for the AI, and leave the partner no worse off, are proposed.
+        """
+        best = Trade_Engine(game).best_trade(self, self.calculate_safe_cash_reserve(game))
+        if best is None:
+            return None
+        target, offer, request, _ = best
+        return target, offer, request
+
+    def decide_mortgage(self, game: "Game") -> List["Ownable_Card"]:
+        """
+        Return a list of property cards to mortgage for cash
+        (never one in a group with buildings, which must be sold first).
+        """
+        if self.project_cashflow_risk(game) == "safe":
+            return []
+        return [
+            card for card in self.owned_properties.unmortgaged
+            if not any(getattr(p.get_card(), "houses", 0) > 0 for p in card.location.group.properties)
+        ]
+
+    def decide_unmortgage(self, game: "Game") -> List["Ownable_Card"]:
+        """
+        Return a list of property cards to unmortgage this turn.
+        """
+        unmortgage_list = []
+        for card in self.owned_properties.mortgaged:
+            cost = int(card.location.mortgage_value * 1.1)
+            if self.can_afford(cost):
+                unmortgage_list.append(card)
+        return unmortgage_list
+
+    # === Auction ===
+    def decide_auction_bid(self, property: "Ownable_Space", current_bid: int, game: "Game") -> int:
+        """
+        Return the maximum bid the AI is willing to make for a property in auction.
+        Return 0 to pass.
+        """
+        value = self.evaluate_property_value(property, game)
+        if value > current_bid:
+            increment = min(100, value - current_bid)
+            return current_bid + increment
+        return 0
+
+    # === Evaluation ===
+    def _state_key(self, game: "Game") -> Tuple[int, int]:
+        """
+        What the valuations depend on besides their arguments: the board's state version (owners,
+        buildings and mortgages) and how many players are still in the game.
+        """
+        return game.board.version, len(game.alive_players())
+
+    def evaluate_property_value(self, property: "Ownable_Space", game: "Game") -> int:
+        """
+        Evaluate how much this property is worth to the AI: its price plus the expected rent it
+        would add over income_horizon opponent turns (valuing a completed monopoly as developed),
+        plus part of the rent it denies an opponent it would complete a monopoly for, scaled for
+        scarcity and capped by what the AI can afford.
+        """
+        key = ("property", property.position) + self._state_key(game)
+        base_value = self.eval_cache.get(game.board, key, lambda: self._property_value(property, game))
+        max_bid = self.balance - self.calculate_safe_cash_reserve(game)
+        return min(base_value, max_bid)
+
+    def _property_value(self, property: "Ownable_Space", game: "Game") -> int:
+        analytics = Analytics.for_game(game)
+        opponents = [p for p in game.alive_players() if p is not self]
+        group = property.group
+
+        income = analytics.ownership_gain(self, property, DEVELOPED_HOUSES) * max(len(opponents), 1)
+        # Blocking: what the property would be worth to an opponent one short of the group
+        blocked = 0.0
+        for opponent in opponents:
+            if group.count_owned(opponent) == len(group.properties) - 1:
+                blocked = max(blocked, analytics.ownership_gain(opponent, property, DEVELOPED_HOUSES))
+        weights = self.parameters
+        base_value = property.buying_price + (income + weights["blocking_weight"] * blocked) * weights["income_horizon"]
+
+        remaining_ownables = sum(1 for p in game.board.ownable_spaces if p.get_card().owner is None)
+        if remaining_ownables < weights["scarcity_threshold"]:
+            base_value *= weights["scarcity_multiplier"]
+        return int(base_value)
+
+    def evaluate_group_value(self, group_name: str, game: "Game") -> int:
+        """
+        Evaluate the strategic value of an entire group: what is invested in it (prices and
+        buildings) plus the expected rent it earns its owners over income_horizon opponent turns.
+        """
+        key = ("group", group_name) + self._state_key(game)
+        return self.eval_cache.get(game.board, key, lambda: self._group_value(group_name, game))
+
+    def _group_value(self, group_name: str, game: "Game") -> int:
+        group = game.board.groups.get(group_name)
+        if not group:
+            return 0
+
+        analytics = Analytics.for_game(game)
+        income = analytics.space_income()
+        opponents = max(len(game.alive_players()) - 1, 1)
+        total_value = 0.0
+        for prop in group.properties:
+            card = prop.get_card()
+            value = prop.buying_price
+            if hasattr(card, 'houses'):
+                value += card.houses * prop.build_cost
+            total_value += value + income[analytics.index[prop]] * opponents * self.parameters["income_horizon"]
+        return int(total_value)
+
+    def calculate_safe_cash_reserve(self, game: "Game") -> int:
+        """
+        Calculate how much cash the AI wants to keep in reserve.
+        """
+        key = ("reserve",) + self._state_key(game)
+        return self.eval_cache.get(game.board, key, lambda: self._safe_cash_reserve(game))
+
+    def _safe_cash_reserve(self, game: "Game") -> int:
+        avg_rent = 0
+        opponent_properties = [p for p in game.board.ownable_spaces if p.get_card().owner not in [None, self]]
+        # Railroads have a single rent and utilities a dice multiplier, only property rent tables count
+        rent_tables = [p.rent for p in opponent_properties if isinstance(p, Property)]
+        if rent_tables:
+            rent_values = [sum(rent.values()) / len(rent) for rent in rent_tables]
+            avg_rent = sum(rent_values) / len(rent_values)
+        # Keep at least a multiple of the average rent
+        return max(int(self.parameters["reserve_floor"]), int(avg_rent * self.parameters["reserve_rent_multiple"]))
+
+    def project_cashflow_risk(self, game: "Game") -> str:
+        """
+        Analyze rent risk based on opponents' properties: how the AI's balance compares with the
+        highest rent it could be charged at the moment.
+        Returns: "safe", "moderate", or "danger"
+        """
+        key = ("risk",) + self._state_key(game)
+        risk_threshold = self.eval_cache.get(game.board, key, lambda: self._highest_opponent_rent(game))
+        if not risk_threshold:
+            return "safe"
+        if self.balance >= risk_threshold * 2:
+            return "safe"
+        elif self.balance >= risk_threshold:
+            return "moderate"
+        else:
+            return "danger"
+
+    def _highest_opponent_rent(self, game: "Game") -> float:
+        analytics = Analytics.for_game(game)
+        highest = 0.0
+        for space in game.board.ownable_spaces:
+            card = space.get_card()
+            if card.owner in [None, self] or card.mortgaged:
+                continue
+            if isinstance(space, Property):
+                rent = space.rent[str(card.houses)]
+                if card.houses == 0 and space.group.is_monopoly():
+                    rent *= 2
+            else:
+                rent = analytics.flat_rent(space, space.group.count_owned(card.owner))
+            highest = max(highest, rent)
+        return highest
+
+    # === Analysis ===
+    def predict_landing_distribution(self, game: "Game") -> Dict[str, float]:
+        """
+        Estimate the chance of landing on each property in the next few turns.
+        """
+        steps_ahead = 12
+        distribution = {}
+        board_size = len(game.board.spaces)
+
+        for i in range(2, steps_ahead + 1):  # Typical dice roll is 2-12
+            pos = (self.position + i) % board_size
+            space = game.board.spaces[pos]
+            distribution[space.name] = distribution.get(space.name, 0) + 1
+
+        total = sum(distribution.values())
+        return {name: count / total for name, count in distribution.items()}
+
+    def prioritize_actions(self, game: "Game") -> List[str]:
+        """
+        Return a list of recommended actions this turn, sorted by importance.
+        """
+        priorities = []
+        risk = self.project_cashflow_risk(game)
+
+        if risk == "danger":
+            priorities.append("mortgage")
+        if self.balance > self.parameters["action_balance_threshold"]:
+            priorities.append("unmortgage")
+            priorities.append("build")
+        if risk != "safe":
+            priorities.append("trade")
+        priorities.append("end_turn")
+
+        return priorities
+    # === Trading Strategy ===
+    def is_trade_worth_it(self, offer: Dict, request: Dict, game: "Game") -> bool:
+        """
+        Evaluate if the proposed trade is favorable.
+
+        :param offer: What the AI would receive ("Money", "Properties", ...).
+        :param request: What the AI would give, in the same format.
+        """
+        if request["Money"] > self.balance - self.calculate_safe_cash_reserve(game):
+            return False
+        cash = offer["Money"] - request["Money"]
+        value = Trade_Engine(game).trade_value(self, offer["Properties"], request["Properties"], cash)
+        return value >= 0
+
+    def select_trade_partner(self, game: "Game") -> Optional[Player]:
+        """
+        Select a player to propose a trade to.
+        """
+        trade = self.decide_trade(game)
+        return trade[0] if trade else None
+
+    def generate_trade_offer(self, game: "Game") -> Tuple[Dict, Dict]:
+        """
+        Create a trade offer dictionary (offering and requesting resources).
+        Returns empty offers if no worthwhile trade exists.
+        """
+        trade = self.decide_trade(game)
+        if trade is None:
+            empty = {"Money": 0, "Get_Out_Of_Jail_Free_Card": (False, False), "Properties": []}
+            return dict(empty), dict(empty)
+        _, offer, request = trade
+        return offer, request
+
+    # === Endgame ===
+    def switch_to_endgame_mode(self, game: "Game") -> bool:
+        """
+        Return True if AI should adopt an endgame strategy (e.g., last 2 players).
+        """
+        pass
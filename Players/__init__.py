@@ -1,4 +1,6 @@
-from player import Player
-from AI import AI
-
-__all__ = ["Player", "AI"]
\ No newline at end of file
+from .player import Player
+from .AI import AI
+from .holdings import Holdings
+from .trade_engine import Trade_Engine
+
+__all__ = ["Player", "AI", "Holdings", "Trade_Engine"]
\ No newline at end of file
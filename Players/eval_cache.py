@@ -0,0 +1,77 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional
+if TYPE_CHECKING:
+	from Board import Board
+
+DEFAULT_SIZE = 1024  # Entries kept per cache
+
+class Eval_Cache:
+	"""
+	A bounded least recently used cache for an AI's valuations.
+
+	Entries are keyed by what the valuation depends on, which always includes the board's state
+	version (Board.version, bumped on every change of owner, buildings or mortgage). Once the board
+	changes, old keys are simply never asked for again and age out of the cache, so nothing has to
+	be invalidated. The cache is bound to one board, and is emptied when used with another one (a
+	new or reloaded game starts its version count again).
+
+	key responsibilities:
+	- returning stored values, computing and storing missing ones
+	- evicting the least recently used entries beyond the size limit
+	- counting hits and misses
+	"""
+	def __init__(self, size: int = DEFAULT_SIZE):
+		"""
+		:param size: Entries to keep at most.
+		"""
+		if size < 1:
+			raise ValueError("The cache size must be at least 1.")
+		self.size = size
+		self.board: Optional["Board"] = None
+		self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	def __len__(self) -> int:
+		return len(self.entries)
+
+	def get(self, board: "Board", key: Hashable, compute: Callable[[], Any]) -> Any:
+		"""
+		The value stored for key on this board, or compute() stored as it.
+		"""
+		if board is not self.board:
+			self.entries.clear()
+			self.board = board
+		try:
+			value = self.entries[key]
+		except KeyError:
+			self.misses += 1
+			value = self.entries[key] = compute()
+			if len(self.entries) > self.size:
+				self.entries.popitem(last=False)
+			return value
+		self.hits += 1
+		self.entries.move_to_end(key)
+		return value
+
+	def clear(self) -> None:
+		"""
+		Drop every entry and reset the statistics.
+		"""
+		self.entries.clear()
+		self.board = None
+		self.hits = 0
+		self.misses = 0
+
+	def stats(self) -> Dict[str, float]:
+		"""
+		:return: {"hits", "misses", "hit_rate", "entries", "size"}
+		"""
+		lookups = self.hits + self.misses
+		return {
+			"hits": self.hits,
+			"misses": self.misses,
+			"hit_rate": self.hits / lookups if lookups else 0.0,
+			"entries": len(self.entries),
+			"size": self.size
+		}
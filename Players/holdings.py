@@ -0,0 +1,124 @@
+from typing import TYPE_CHECKING, Dict, Iterator, List
+if TYPE_CHECKING:
+	from Board import Ownable_Card
+	from Board.Space_Types import Group
+
+class Holdings:
+	"""
+	The cards a player owns, indexed for the questions asked of them every turn.
+
+	Behaves like the list it replaces (iteration in the order cards were gained, len, indexing,
+	`in`, append and remove) but membership is O(1), cards are grouped by their Group, and the
+	house/hotel counts and mortgaged/unmortgaged partitions are kept as cards change.
+
+	Cards add and remove themselves when their owner is set, and report house and mortgage
+	changes, so the index never has to be rebuilt.
+
+	key responsibilities:
+	- tracking which cards a player owns
+	- answering ownership, group, building and mortgage queries without scanning
+	"""
+	def __init__(self):
+		self._cards: Dict["Ownable_Card", None] = {}  # ordered set
+		self._by_group: Dict["Group", Dict["Ownable_Card", None]] = {}
+		self.mortgaged: Dict["Ownable_Card", None] = {}
+		self.unmortgaged: Dict["Ownable_Card", None] = {}
+		self.houses = 0
+		self.hotels = 0
+
+	# === List-like view ===
+	def __iter__(self) -> Iterator["Ownable_Card"]:
+		# Iterate over a snapshot so callers can mortgage, sell or trade while looping
+		return iter(list(self._cards))
+
+	def __len__(self) -> int:
+		return len(self._cards)
+
+	def __contains__(self, card: object) -> bool:
+		return card in self._cards
+
+	def __getitem__(self, index):
+		return list(self._cards)[index]
+
+	def __repr__(self):
+		return f"Holdings({[card.location.name for card in self._cards]})"
+
+	def append(self, card: "Ownable_Card") -> None:
+		"""
+		Same as add, kept so list-style callers keep working.
+		"""
+		self.add(card)
+
+	def remove(self, card: "Ownable_Card") -> None:
+		"""
+		Remove a card, raising ValueError if it is not held (as list.remove does).
+		"""
+		if card not in self._cards:
+			raise ValueError(f"{card.location.name} is not held.")
+		self.discard(card)
+
+	# === Index maintenance ===
+	def add(self, card: "Ownable_Card") -> None:
+		"""
+		Add a card, doing nothing if it is already held.
+		"""
+		if card in self._cards:
+			return
+		self._cards[card] = None
+		self._by_group.setdefault(card.location.group, {})[card] = None
+		(self.mortgaged if card.mortgaged else self.unmortgaged)[card] = None
+		self.update_houses(0, getattr(card, "houses", 0))
+
+	def discard(self, card: "Ownable_Card") -> None:
+		"""
+		Remove a card if it is held.
+		"""
+		if card not in self._cards:
+			return
+		del self._cards[card]
+		group_cards = self._by_group[card.location.group]
+		del group_cards[card]
+		if not group_cards:
+			del self._by_group[card.location.group]
+		self.mortgaged.pop(card, None)
+		self.unmortgaged.pop(card, None)
+		self.update_houses(getattr(card, "houses", 0), 0)
+
+	def update_houses(self, previous_houses: int, houses: int) -> None:
+		"""
+		Adjust the house and hotel counts when a held property's buildings change (5 = hotel).
+		"""
+		for count, sign in [(previous_houses, -1), (houses, 1)]:
+			if count == 5:
+				self.hotels += sign
+			else:
+				self.houses += sign * count
+
+	def update_mortgaged(self, card: "Ownable_Card") -> None:
+		"""
+		Move a held card to the right partition after it is mortgaged or unmortgaged.
+		"""
+		if card not in self._cards:
+			return
+		if card.mortgaged:
+			self.unmortgaged.pop(card, None)
+			self.mortgaged[card] = None
+		else:
+			self.mortgaged.pop(card, None)
+			self.unmortgaged[card] = None
+
+	# === Queries ===
+	def in_group(self, group: "Group") -> List["Ownable_Card"]:
+		"""
+		The held cards belonging to a group.
+		"""
+		return list(self._by_group.get(group, ()))
+
+	def groups(self) -> List["Group"]:
+		"""
+		Every group the player holds at least one card in.
+		"""
+		return list(self._by_group)
+
+	def count_in_group(self, group: "Group") -> int:
+		return len(self._by_group.get(group, ()))
@@ -0,0 +1,203 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import numpy as np
+from Board.Space_Types import Property_Group
+from Core.analytics import Analytics
+if TYPE_CHECKING:
+	from Board.Space_Types import Property
+	from Players import Player
+	from Core import Game
+
+CASH_STEP = 10  # Cash in offers is rounded to this
+
+def _no_cards() -> Tuple[bool, bool]:
+	return (False, False)
+
+class Trade_Engine:
+	"""
+	Finds the best monopoly-completing trade for a player.
+
+	Works at group level: a group is "needed" by a player from a partner when the two of them
+	own every property in it between them, so a trade can complete it. For each partner the
+	engine pairs every group the player needs with every way of paying for it (nothing, the
+	cards the partner needs to complete one of their own groups, or a single card from a group
+	the player can not complete), and settles the difference in cash. Candidates are scored as
+	matrices with NumPy: change in property value plus expected rent income (from the board's
+	landing probabilities, see Core.analytics) over each side's income_horizon turns, valuing
+	a completed monopoly as an AI does (developed to DEVELOPED_HOUSES).
+
+	Partners and groups are visited best bound first, and skipped once their bound (the group's
+	gain plus all the cash the partner could pay above their reserve) can not beat the best
+	trade found.
+
+	key responsibilities:
+	- enumerating and pruning candidate trades
+	- scoring them for both sides
+	"""
+	def __init__(self, game: "Game"):
+		"""
+		Snapshot the per-group rent tables needed to score trades.
+
+		:param game: The current Game instance.
+		"""
+		self.game = game
+		self.opponents = max(len(game.alive_players()) - 1, 1)
+		self.groups = [
+			group for group in game.board.groups.values()
+			if isinstance(group, Property_Group) and group.properties
+			and group.house_levels[0] == len(group.properties)  # Built-on groups can not be traded
+		]
+		from Players.AI import DEVELOPED_HOUSES
+		# Expected rent per opponent turn for each property, unimproved and developed
+		analytics = Analytics.for_game(game)
+		landing = analytics.landing_probabilities()
+		self.base_income: Dict["Property", float] = {}
+		self.monopoly_income: Dict["Property_Group", float] = {}
+		for group in self.groups:
+			for prop in group.properties:
+				self.base_income[prop] = landing[analytics.index[prop]] * prop.rent["0"]
+			self.monopoly_income[group] = sum(landing[analytics.index[prop]] * prop.rent[str(DEVELOPED_HOUSES)] for prop in group.properties)
+
+	# === Valuation ===
+	@staticmethod
+	def _horizon(player: "Player") -> float:
+		"""
+		The opponent turns a player counts income over: their own income_horizon if they are
+		an AI, otherwise the AI default.
+		"""
+		from Players.AI import DEFAULT_PARAMETERS
+		return getattr(player, "parameters", DEFAULT_PARAMETERS)["income_horizon"]
+
+	def _reserve(self, player: "Player") -> int:
+		"""
+		The cash a player will not spend on a trade (an AI's safe cash reserve, nothing for others).
+		"""
+		reserve = getattr(player, "calculate_safe_cash_reserve", None)
+		return reserve(self.game) if reserve is not None else 0
+
+	def _income(self, group: "Property_Group", cards: List["Property"], horizon: float) -> float:
+		"""
+		Expected income over the horizon from holding these cards of a group
+		(the whole group counts as a developed monopoly).
+		"""
+		if len(cards) == len(group.properties):
+			income = self.monopoly_income[group]
+		else:
+			income = sum(self.base_income[prop] for prop in cards)
+		return income * horizon * self.opponents
+
+	def _value(self, group: "Property_Group", cards: List["Property"], horizon: float) -> float:
+		"""
+		What holding these cards of a group is worth: price plus income.
+		"""
+		return sum(prop.buying_price for prop in cards) + self._income(group, cards, horizon)
+
+	def _held(self, player: "Player", group: "Property_Group") -> List["Property"]:
+		return [card.location for card in player.owned_properties.in_group(group)]
+
+	def trade_value(self, player: "Player", gets: List["Property"], gives: List["Property"], cash: int) -> float:
+		"""
+		How much better off a player is after a trade, under the engine's model.
+
+		:param player: The player to evaluate for.
+		:param gets: Properties the player receives.
+		:param gives: Properties the player hands over.
+		:param cash: Net cash the player receives (negative if they pay).
+		:return: The change in value.
+		"""
+		change = float(cash)
+		horizon = self._horizon(player)
+		touched = {prop.group for prop in gets + gives}
+		for group in touched:
+			if group not in self.monopoly_income:
+				# Railroads, utilities or built-on groups: count face value only
+				change += sum(p.buying_price for p in gets if p.group is group)
+				change -= sum(p.buying_price for p in gives if p.group is group)
+				continue
+			before = self._held(player, group)
+			after = [p for p in before if p not in gives] + [p for p in gets if p.group is group]
+			change += self._value(group, after, horizon) - self._value(group, before, horizon)
+		return change
+
+	# === Search ===
+	def _needs(self, player: "Player", partner: "Player") -> List[Tuple["Property_Group", List["Property"]]]:
+		"""
+		Groups the player could complete with cards held only by the partner, and those cards.
+		"""
+		needs = []
+		for group in self.groups:
+			own = group.count_owned(player)
+			theirs = group.count_owned(partner)
+			if own and theirs and own + theirs == len(group.properties):
+				needs.append((group, self._held(partner, group)))
+		return needs
+
+	def _dead_cards(self, player: "Player", partner: "Player") -> List["Property"]:
+		"""
+		Single cards the player holds in groups they can not complete with this partner's help.
+		"""
+		dead = []
+		for group in self.groups:
+			own = group.count_owned(player)
+			if own and own + group.count_owned(partner) < len(group.properties):
+				dead.extend(self._held(player, group))
+		return dead
+
+	def best_trade(self, player: "Player", reserve: int = 0) -> Optional[Tuple["Player", Dict[str, Any], Dict[str, Any], float]]:
+		"""
+		Find the trade that most improves the player's position and that the partner gains from too.
+
+		:param player: The player proposing.
+		:param reserve: Cash the player will not spend on a trade.
+		:return: (partner, give, recieve, value to the player) in Bank.trade's format, or None.
+		"""
+		budget = max(player.balance - reserve, 0)
+		partners = []
+		for partner in self.game.alive_players():
+			if partner is player:
+				continue
+			needs = self._needs(player, partner)
+			if not needs:
+				continue
+			gains = [self.trade_value(player, cards, [], 0) for _, cards in needs]
+			# Like the player, the partner only pays out of cash above their reserve
+			partner_budget = max(partner.balance - self._reserve(partner), 0)
+			partners.append((max(gains) + partner_budget, partner, partner_budget, needs, gains))
+		partners.sort(key=lambda entry: entry[0], reverse=True)
+
+		best: Optional[Tuple["Player", Dict[str, Any], Dict[str, Any], float]] = None
+		best_value = 0.0
+		for bound, partner, partner_budget, needs, gains in partners:
+			if bound <= best_value:
+				break
+			# Ways of paying: nothing, the cards completing one of the partner's groups, or one dead card
+			payments: List[List["Property"]] = [[]]
+			payments += [cards for _, cards in self._needs(partner, player)]
+			payments += [[card] for card in self._dead_cards(player, partner)]
+			payment_groups = [cards[0].group if cards else None for cards in payments]
+			pay_me = np.array([self.trade_value(player, [], cards, 0) for cards in payments])
+			pay_partner = np.array([self.trade_value(partner, cards, [], 0) for cards in payments])
+
+			order = sorted(range(len(needs)), key=lambda i: gains[i], reverse=True)
+			for i in order:
+				if gains[i] + partner_budget <= best_value:
+					break
+				group, cards = needs[i]
+				gain_me = gains[i] + pay_me
+				gain_partner = self.trade_value(partner, [], cards, 0) + pay_partner
+				# Settle the difference in cash: the least the partner will accept,
+				# but never more than the partner can spare
+				cash = np.ceil(-gain_partner / CASH_STEP) * CASH_STEP
+				cash = np.maximum(cash, -partner_budget)
+				value = gain_me - cash
+				# Paying with cards from the group being completed would undo the trade
+				same_group = np.array([g is group for g in payment_groups])
+				feasible = (cash <= budget) & (gain_partner + cash >= 0) & ~same_group
+				value = np.where(feasible, value, -np.inf)
+				j = int(np.argmax(value))
+				if value[j] > best_value:
+					best_value = float(value[j])
+					money = int(cash[j])
+					give = {"Money": max(money, 0), "Get_Out_Of_Jail_Free_Card": _no_cards(), "Properties": payments[j]}
+					recieve = {"Money": max(-money, 0), "Get_Out_Of_Jail_Free_Card": _no_cards(), "Properties": cards}
+					best = (partner, give, recieve, best_value)
+		return best
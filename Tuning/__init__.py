@@ -0,0 +1,3 @@
+from .optimizer import Optimizer, to_vector, from_vector, PARAMETER_BOUNDS
+
+__all__ = ["Optimizer", "to_vector", "from_vector", "PARAMETER_BOUNDS"]
\ No newline at end of file
@@ -0,0 +1,253 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from Players.AI import DEFAULT_PARAMETERS
+from Benchmarks.benchmark import build_game, play_turns, MAX_TURNS
+
+# Search range of every tunable AI parameter, in DEFAULT_PARAMETERS order
+PARAMETER_BOUNDS: Dict[str, Tuple[float, float]] = {
+	"income_horizon": (5, 100),
+	"blocking_weight": (0, 1.5),
+	"scarcity_multiplier": (1, 2),
+	"scarcity_threshold": (0, 28),
+	"reserve_floor": (0, 600),
+	"reserve_rent_multiple": (0, 6),
+	"action_balance_threshold": (0, 1000)
+}
+PARAMETER_NAMES = list(DEFAULT_PARAMETERS)
+MUTATION_SCALE = 0.1  # Mutation standard deviation as a fraction of each parameter's range
+ELITE_FRACTION = 0.25  # Share of each generation kept unchanged and used as parents
+
+def to_vector(parameters: Dict[str, float]) -> np.ndarray:
+	"""
+	AI parameters as a vector in PARAMETER_NAMES order (missing ones take their defaults).
+	"""
+	return np.array([float(parameters.get(name, DEFAULT_PARAMETERS[name])) for name in PARAMETER_NAMES])
+
+def from_vector(vector: np.ndarray) -> Dict[str, float]:
+	"""
+	A parameter vector as the dictionary AI expects.
+	"""
+	return {name: float(value) for name, value in zip(PARAMETER_NAMES, vector)}
+
+def _bounds() -> Tuple[np.ndarray, np.ndarray]:
+	low = np.array([PARAMETER_BOUNDS[name][0] for name in PARAMETER_NAMES], dtype=float)
+	high = np.array([PARAMETER_BOUNDS[name][1] for name in PARAMETER_NAMES], dtype=float)
+	return low, high
+
+def play_match(task: Tuple[int, List[float], List[float], int, int, str]) -> Tuple[int, float]:
+	"""
+	Play one self-play game of a candidate against copies of a rival. Runs in a worker process.
+
+	:param task: (candidate index, candidate vector, rival vector, seed, players, board).
+	:return: (candidate index, score) where the score is 1 for a win, split between players
+			 still standing when the turn limit is reached (by wealth), and 0 for a loss.
+	"""
+	index, candidate, rival, seed, players, board = task
+	with contextlib.redirect_stdout(io.StringIO()):
+		seat = seed % players  # Rotate the candidate's seat so turn order does not bias the score
+		parameters = [from_vector(np.array(candidate if i == seat else rival)) for i in range(players)]
+		game = build_game(board, players, seed, parameters)
+		play_turns(game, MAX_TURNS)
+	me = game.players[seat]
+	if me.bankrupt:
+		return index, 0.0
+	alive = game.alive_players()
+	if len(alive) == 1:
+		return index, 1.0
+	total = sum(max(player.total_wealth(), 0) for player in alive)
+	return index, max(me.total_wealth(), 0) / total if total else 1 / len(alive)
+
+class Optimizer:
+	"""
+	Evolutionary search over the AI's strategy parameters using self-play.
+
+	Each generation every candidate vector plays the same batch of seeded games (so candidates
+	are compared on identical dice) against copies of the best vector found so far, spread over
+	a process pool. The top ELITE_FRACTION survive unchanged; the rest of the next generation is
+	bred from them by uniform crossover and Gaussian mutation, clipped to PARAMETER_BOUNDS.
+
+	The population is checkpointed to json after every generation, so an interrupted run resumes
+	where it stopped.
+
+	key responsibilities:
+	- evaluating candidate parameter vectors in parallel
+	- breeding new generations
+	- saving and resuming progress
+	"""
+	def __init__(self, population: int = 32, games: int = 16, players: int = 4, board: str = "standard",
+				 workers: Optional[int] = None, checkpoint: Optional[str] = None, seed: int = 0):
+		"""
+		:param population: Candidate vectors per generation.
+		:param games: Self-play games each candidate plays per generation.
+		:param players: Players per game.
+		:param board: A Benchmarks board name to play on.
+		:param workers: Worker processes (defaults to every core).
+		:param checkpoint: Json file to save each generation to, and resume from if it exists.
+		:param seed: Seed for the search and the games.
+		"""
+		self.population_size = population
+		self.games = games
+		self.players = players
+		self.board = board
+		self.workers = workers or os.cpu_count() or 1
+		self.checkpoint = checkpoint
+		self.seed = seed
+		self.rng = np.random.default_rng(seed)
+		self.low, self.high = _bounds()
+
+		self.generation = 0
+		self.best = to_vector(DEFAULT_PARAMETERS)
+		self.best_fitness = 0.0
+		self.history: List[Dict[str, Any]] = []
+		self.population = self._initial_population()
+		if checkpoint and os.path.exists(checkpoint):
+			self.load(checkpoint)
+
+	def _initial_population(self) -> np.ndarray:
+		"""
+		The defaults plus random vectors spread over the bounds.
+		"""
+		population = self.rng.uniform(self.low, self.high, (self.population_size, len(PARAMETER_NAMES)))
+		population[0] = to_vector(DEFAULT_PARAMETERS)
+		return population
+
+	# === Evaluation ===
+	def evaluate(self, pool: "Pool") -> np.ndarray:
+		"""
+		Mean self-play score of every candidate against the current best vector.
+		"""
+		seeds = [self.seed + self.generation * self.games + g for g in range(self.games)]
+		rival = self.best.tolist()
+		tasks = [(i, candidate.tolist(), rival, seed, self.players, self.board)
+				 for i, candidate in enumerate(self.population) for seed in seeds]
+		scores = np.zeros(len(self.population))
+		for index, score in pool.imap_unordered(play_match, tasks, chunksize=max(len(tasks) // (self.workers * 4), 1)):
+			scores[index] += score
+		return scores / self.games
+
+	# === Breeding ===
+	def breed(self, fitness: np.ndarray) -> np.ndarray:
+		"""
+		The next generation: the elite unchanged, then mutated crossovers of random elite pairs.
+		"""
+		order = np.argsort(fitness)[::-1]
+		elite = self.population[order[:max(int(self.population_size * ELITE_FRACTION), 2)]]
+		children = self.population_size - len(elite)
+		parents_a = elite[self.rng.integers(len(elite), size=children)]
+		parents_b = elite[self.rng.integers(len(elite), size=children)]
+		mask = self.rng.random(parents_a.shape) < 0.5
+		offspring = np.where(mask, parents_a, parents_b)
+		offspring += self.rng.normal(0, MUTATION_SCALE, offspring.shape) * (self.high - self.low)
+		offspring = np.clip(offspring, self.low, self.high)
+		return np.vstack([elite, offspring])
+
+	def step(self, pool: "Pool") -> Dict[str, Any]:
+		"""
+		Evaluate and breed one generation, then checkpoint.
+
+		:return: A summary of the generation.
+		"""
+		start = time.perf_counter()
+		fitness = self.evaluate(pool)
+		top = int(np.argmax(fitness))
+		# Scores are relative to the current best: beating it by more than an even share replaces it
+		if fitness[top] > 1 / self.players:
+			self.best = self.population[top].copy()
+			self.best_fitness = float(fitness[top])
+		summary = {
+			"generation": self.generation,
+			"best_score": float(fitness[top]),
+			"mean_score": float(fitness.mean()),
+			"best": from_vector(self.best),
+			"seconds": time.perf_counter() - start
+		}
+		self.history.append(summary)
+		self.population = self.breed(fitness)
+		self.generation += 1
+		if self.checkpoint:
+			self.save(self.checkpoint)
+		return summary
+
+	def run(self, generations: int) -> Dict[str, float]:
+		"""
+		Run until the given total number of generations (counting any resumed from a checkpoint).
+
+		:return: The best parameters found.
+		"""
+		with Pool(self.workers) as pool:
+			while self.generation < generations:
+				summary = self.step(pool)
+				print(f"Generation {summary['generation']}: best {summary['best_score']:.3f}, "
+					  f"mean {summary['mean_score']:.3f} ({summary['seconds']:.1f}s)")
+		return from_vector(self.best)
+
+	# === Checkpoints ===
+	def save(self, path: str) -> None:
+		"""
+		Write the search state to a json file (atomically, so a crash never leaves half a file).
+		"""
+		data = {
+			"generation": self.generation,
+			"parameters": PARAMETER_NAMES,
+			"population": self.population.tolist(),
+			"best": self.best.tolist(),
+			"best_fitness": self.best_fitness,
+			"history": self.history,
+			"rng": self.rng.bit_generator.state
+		}
+		temporary = path + ".tmp"
+		with open(temporary, "w") as file:
+			json.dump(data, file, indent=1)
+		os.replace(temporary, path)
+
+	def load(self, path: str) -> None:
+		"""
+		Resume the search state from a checkpoint.
+
+		:raises ValueError: If the checkpoint was made with a different parameter set.
+		"""
+		with open(path) as file:
+			data = json.load(file)
+		if data["parameters"] != PARAMETER_NAMES:
+			raise ValueError(f"Checkpoint {path} is for different AI parameters.")
+		self.generation = data["generation"]
+		self.population = np.array(data["population"])
+		self.population_size = len(self.population)
+		self.best = np.array(data["best"])
+		self.best_fitness = data["best_fitness"]
+		self.history = data["history"]
+		self.rng.bit_generator.state = data["rng"]
+
+def main(argv: Optional[List[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description="Tune the AI's strategy parameters by self-play.")
+	parser.add_argument("--generations", type=int, default=50)
+	parser.add_argument("--population", type=int, default=32)
+	parser.add_argument("--games", type=int, default=16, help="Games per candidate per generation.")
+	parser.add_argument("--players", type=int, default=4)
+	parser.add_argument("--board", default="standard")
+	parser.add_argument("--workers", type=int, help="Worker processes (default: every core).")
+	parser.add_argument("--checkpoint", default="tuning_checkpoint.json", help="Saved every generation and resumed from.")
+	parser.add_argument("--output", help="Write the best parameters to this json file.")
+	parser.add_argument("--seed", type=int, default=0)
+	args = parser.parse_args(argv)
+
+	optimizer = Optimizer(args.population, args.games, args.players, args.board, args.workers, args.checkpoint, args.seed)
+	best = optimizer.run(args.generations)
+	text = json.dumps(best, indent=4)
+	if args.output:
+		with open(args.output, "w") as file:
+			file.write(text)
+	else:
+		print(text)
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
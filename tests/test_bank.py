@@ -0,0 +1,48 @@
+import pytest
+from Core import Game
+from Core.build_planner import plan_builds
+
+def _game_with_monopoly(group: str = "Navy"):
+	game = Game()
+	game.add_ai("A")
+	player = game.players[0]
+	properties = game.board.find_by_group(group)
+	game.bank.transfer_property_multiple(properties, player)
+	return game, player, properties
+
+def test_apply_builds_places_a_legal_plan():
+	game, player, properties = _game_with_monopoly()
+	balance, houses = player.balance, game.bank.houses
+	game.bank.apply_builds(player, properties)
+	assert [p.get_card().houses for p in properties] == [1, 1]
+	assert game.bank.houses == houses - 2
+	assert player.balance == balance - sum(p.build_cost for p in properties)
+
+def test_apply_builds_rejects_a_group_with_a_mortgaged_property():
+	game, player, properties = _game_with_monopoly()
+	properties[1].get_card().mortgaged = True
+	balance, houses = player.balance, game.bank.houses
+	with pytest.raises(ValueError):
+		game.bank.apply_builds(player, [properties[0]])
+	assert properties[0].get_card().houses == 0
+	assert game.bank.houses == houses and player.balance == balance
+
+def test_plan_builds_skips_a_group_with_a_mortgaged_property():
+	game, player, properties = _game_with_monopoly()
+	properties[1].get_card().mortgaged = True
+	assert plan_builds(player, player.balance, game.bank.houses, game.bank.hotels) == []
+
+def test_mortgaging_is_refused_in_a_group_with_buildings():
+	game, player, properties = _game_with_monopoly()
+	game.bank.apply_builds(player, [properties[0]])
+	with pytest.raises(ValueError):
+		player.mortgage_property(properties[1].get_card())
+	assert not properties[1].get_card().mortgaged
+
+def test_the_ai_does_not_offer_to_mortgage_a_built_group():
+	game, player, properties = _game_with_monopoly()
+	railroad = game.board.find_by_group("Railroad")[0]
+	game.bank.transfer_property(railroad, player)
+	game.bank.apply_builds(player, [properties[0]])
+	player.project_cashflow_risk = lambda game: "danger"
+	assert player.decide_mortgage(game) == [railroad.get_card()]
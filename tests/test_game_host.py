@@ -0,0 +1,40 @@
+import contextlib
+import io
+import random
+from Core import Game
+from Core.game_host import Game_Host, deep_size, REMEASURE_TURNS
+
+def _host_with_games(folder, ids, max_memory=None):
+	host = Game_Host(str(folder), max_memory=max_memory)
+	for game_id in ids:
+		game = host.new_game(game_id)
+		game.add_ai("A")
+		game.add_ai("B")
+	return host
+
+def test_a_game_is_re_measured_every_few_turns_as_it_is_played(tmp_path):
+	random.seed(0)
+	host = _host_with_games(tmp_path, ["a"], max_memory=10 ** 9)
+	measured = host.sizes["a"]
+	with contextlib.redirect_stdout(io.StringIO()):
+		host.run_until("a", turns=REMEASURE_TURNS - 1)
+		assert host.sizes["a"] == measured
+		while host.get("a").existing_turn_machine.turns < REMEASURE_TURNS:
+			host.step("a")
+	assert host.sizes["a"] == deep_size(host.get("a")) != measured
+
+def test_max_memory_is_enforced_as_games_grow(tmp_path):
+	random.seed(0)
+	host = _host_with_games(tmp_path, ["a", "b"])
+	with contextlib.redirect_stdout(io.StringIO()):
+		host.run_until("b", turns=1)
+		host.run_until("a", turns=1)
+		host.sizes = {game_id: deep_size(host.get(game_id)) for game_id in ("b", "a")}
+		host.max_memory = host.memory_used + 1000
+		host.run_until("a", turns=REMEASURE_TURNS)
+	assert "b" in host.hibernated and "a" in host.active
+
+def test_existing_turn_machine_does_not_create_one():
+	game = Game()
+	assert game.existing_turn_machine is None
+	assert game.turn_machine is game.existing_turn_machine
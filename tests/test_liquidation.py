@@ -0,0 +1,49 @@
+import contextlib
+import io
+from Core import Game
+from Core.liquidation_planner import plan_liquidation
+
+def _game_with_hotels(group: str = "Navy"):
+	game = Game()
+	game.add_ai("A")
+	player = game.players[0]
+	properties = game.board.find_by_group(group)
+	game.bank.transfer_property_multiple(properties, player)
+	for property in properties:
+		property.get_card().houses = 5
+	return game, player, properties
+
+def test_planner_breaks_up_hotels_only_with_houses_in_the_bank():
+	game, player, properties = _game_with_hotels()
+	build_cost = properties[0].build_cost
+	sold, mortgaged, raised = plan_liquidation(player, build_cost // 2, houses_in_bank=4)
+	assert len(sold) == 1 and raised >= build_cost // 2
+	sold, mortgaged, raised = plan_liquidation(player, build_cost // 2, houses_in_bank=3)
+	assert sold == [] and mortgaged == [] and raised == 0
+
+def test_liquidate_without_houses_in_the_bank_declares_bankruptcy():
+	game, player, properties = _game_with_hotels()
+	game.bank.houses = 0
+	player.balance = 0
+	with contextlib.redirect_stdout(io.StringIO()):
+		player.pay(100)
+	assert player.bankrupt
+	assert all(property.get_card().houses == 5 for property in properties)
+	assert game.bank.houses == 0
+
+def test_liquidate_falls_back_to_mortgages_when_the_bank_refuses_the_sales():
+	game, player, navy = _game_with_hotels()
+	brown = game.board.find_by_group("Brown")
+	game.bank.transfer_property_multiple(brown, player)
+	for property in brown:
+		property.get_card().houses = 5
+	station = game.board.find_by_group("Railroad")[0]
+	game.bank.transfer_property(station, player)
+	# Each group can break up one hotel on its own, but not both together
+	game.bank.houses = 4
+	player.balance = -(station.mortgage_value + navy[0].build_cost // 2 + brown[0].build_cost // 2)
+	player.liquidate()
+	assert station.get_card().mortgaged
+	assert all(property.get_card().houses == 5 for property in navy + brown)
+	assert game.bank.houses == 4
+	assert player.bankrupt
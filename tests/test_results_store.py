@@ -0,0 +1,54 @@
+import contextlib
+import io
+import random
+import numpy as np
+import pytest
+from Core import Game
+from Core.results_store import Results_Store
+
+def _game(names):
+	game = Game()
+	for name in names:
+		game.add_ai(name)
+	return game
+
+def _play(game, recorder, turns):
+	machine = game.turn_machine
+	for _ in range(turns):
+		if machine.run_until(turns=1):
+			recorder.record_turn(machine.player)
+
+def test_recorders_open_at_once_write_to_their_own_game_rows(tmp_path):
+	random.seed(0)
+	with contextlib.redirect_stdout(io.StringIO()), Results_Store(str(tmp_path)) as store:
+		first, second = _game(["A", "B"]), _game(["C", "D", "E"])
+		first_recorder, second_recorder = store.recorder(first, seed=1), store.recorder(second, seed=2)
+		_play(first, first_recorder, 5)
+		_play(second, second_recorder, 7)
+		_play(first, first_recorder, 3)
+		second_recorder.finish()
+		first_recorder.finish()
+		with pytest.raises(ValueError):
+			first_recorder.finish()
+	games = Results_Store(str(tmp_path)).games
+	assert list(games.column("seed")) == [2, 1]
+	turns = Results_Store(str(tmp_path)).turns.column("game")
+	assert second_recorder.game_row == 0 and first_recorder.game_row == 1
+	assert np.count_nonzero(turns == 0) == second_recorder.turn == 7
+	assert np.count_nonzero(turns == 1) == first_recorder.turn == 8
+
+def test_batch_games_are_tagged_with_the_same_config_hash_as_recorded_games(tmp_path):
+	from Core.batch_simulator import Batch_Simulator
+	from Core.shared_tables import Shared_Tables
+	simulator = Batch_Simulator(games=4, players=2, seed=1)
+	simulator.run(max_turns=20)
+	arrays, values = simulator.tables()
+	with Shared_Tables.publish(arrays, values) as shared:
+		attached = Batch_Simulator(games=4, players=2, seed=2, tables=shared)
+		attached.run(max_turns=20)
+		with Results_Store(str(tmp_path)) as store:
+			simulator.record(store)
+			attached.record(store)
+			hashes = store.games.column("config_hash")
+	assert len(hashes) == 8
+	assert set(hashes.tolist()) == {Game().rules.hash}
@@ -0,0 +1,18 @@
+from Board import Board
+from Board.space_definitions import space_definitions
+from Data.Config import load_config, load_spaces, compile_config
+
+def test_an_equal_layout_shares_its_definitions():
+	assert space_definitions(load_spaces()) is space_definitions(load_spaces())
+
+def test_a_layout_changed_in_place_is_rebuilt():
+	config = compile_config(load_config())
+	spaces = load_spaces()
+	before = Board(spaces, config, {})
+	index = next(i for i, space in enumerate(spaces) if space["Type"] == "Property")
+	spaces[index]["Name"] = "Renamed Street"
+	spaces[index]["Price"] += 1
+	after = Board(spaces, config, {})
+	assert after.spaces[index].name == "Renamed Street"
+	assert after.spaces[index].buying_price == before.spaces[index].buying_price + 1
+	assert before.spaces[index].name != "Renamed Street"
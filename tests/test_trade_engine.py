@@ -0,0 +1,38 @@
+import contextlib
+import io
+import random
+from Core import Game
+from Players import Trade_Engine
+
+def test_trade_value_counts_income_over_the_players_own_horizon():
+	game = Game()
+	game.add_ai("A")
+	game.add_ai("B")
+	player = game.players[0]
+	first, second = game.board.find_by_group("Brown")
+	game.bank.transfer_property(first, player)
+	game.bank.transfer_property(second, game.players[1])
+	engine = Trade_Engine(game)
+	short = engine.trade_value(player, [second], [], 0)
+	player.parameters["income_horizon"] *= 2
+	long = engine.trade_value(player, [second], [], 0)
+	assert long > short > 0
+
+def test_partners_only_pay_out_of_cash_above_their_reserve():
+	random.seed(2)
+	game = Game()
+	for name in ("A", "B", "C"):
+		game.add_ai(name)
+	trades = 0
+	with contextlib.redirect_stdout(io.StringIO()):
+		for _ in range(60):
+			game.run_until(turns=1)
+			for player in game.alive_players():
+				trade = Trade_Engine(game).best_trade(player, player.calculate_safe_cash_reserve(game))
+				if trade is None:
+					continue
+				partner, give, recieve, value = trade
+				trades += 1
+				assert give["Money"] <= max(player.balance - player.calculate_safe_cash_reserve(game), 0)
+				assert recieve["Money"] <= max(partner.balance - partner.calculate_safe_cash_reserve(game), 0)
+	assert trades
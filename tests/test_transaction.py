@@ -0,0 +1,97 @@
+import pytest
+from Board.Space_Types.group import MONOPOLY_FORMED
+from Core import Game, Action_Stack
+
+def _game():
+	game = Game()
+	game.add_ai("A")
+	game.add_ai("B")
+	return game, game.players[0], game.players[1]
+
+def _state(game):
+	return (
+		[(p.balance, p.net_worth, len(p.owned_properties)) for p in game.players],
+		[(s.get_card().owner, getattr(s.get_card(), "houses", 0), s.get_card().mortgaged) for s in game.board.ownable_spaces],
+		game.bank.houses, game.bank.hotels
+	)
+
+def test_commit_applies_the_whole_batch_and_rollback_restores_it():
+	game, a, b = _game()
+	brown = game.board.find_by_group("Brown")
+	before = _state(game)
+	tx = game.bank.transaction()
+	tx.transfer(brown[0], a).transfer(brown[1], a).build(brown[0]).pay(a, 50, b)
+	tx.commit()
+	assert brown[0].get_card().houses == 1 and brown[1].get_card().owner is a
+	assert b.balance == before[0][1][0] + 50
+	tx.rollback()
+	assert _state(game) == before
+
+def test_a_rejected_operation_leaves_nothing_applied():
+	game, a, b = _game()
+	brown = game.board.find_by_group("Brown")
+	before = _state(game)
+	tx = game.bank.transaction().transfer(brown[0], a).build(brown[0])  # No monopoly
+	with pytest.raises(ValueError):
+		tx.commit()
+	assert _state(game) == before
+
+def test_any_exception_part_way_through_rolls_the_batch_back():
+	game, a, b = _game()
+	brown = game.board.find_by_group("Brown")
+	group = brown[0].group
+	raised = []
+	def listener(group, event, player):
+		if not raised:
+			raised.append(event)
+			raise RuntimeError("listener failed")
+	group.subscribe(listener)
+	before = _state(game)
+	tx = game.bank.transaction().pay(a, 10, b).transfer(brown[0], a).transfer(brown[1], a)
+	with pytest.raises(RuntimeError):
+		tx.commit()
+	assert raised and _state(game) == before
+
+def test_a_property_can_not_leave_a_group_with_buildings():
+	game, a, b = _game()
+	pink = game.board.find_by_group("Pink")
+	game.bank.transfer_property_multiple(pink, a)
+	game.bank.transaction().build(pink[0]).commit()
+	before = _state(game)
+	with pytest.raises(ValueError):
+		game.bank.transaction().transfer(pink[1], b).commit()
+	with pytest.raises(ValueError):
+		game.bank.trade(a, b, {"Money": 0, "Get_Out_Of_Jail_Free_Card": (False, False), "Properties": [pink[2]]},
+						{"Money": 0, "Get_Out_Of_Jail_Free_Card": (False, False), "Properties": []})
+	assert _state(game) == before
+
+def test_undo_to_restores_the_state_at_the_mark():
+	game, a, b = _game()
+	navy = game.board.find_by_group("Navy")
+	actions = Action_Stack(game)
+	before = _state(game)
+	mark = actions.mark()
+	actions.transfer_property(navy[0], a)
+	actions.transfer_property(navy[1], a)
+	inner = actions.mark()
+	actions.upgrade(navy[0])
+	actions.pay(a, 5000, b)
+	assert a.balance < 0
+	actions.undo_to(inner)
+	assert navy[0].get_card().houses == 0 and navy[1].get_card().owner is a
+	actions.undo_to(mark)
+	assert _state(game) == before and len(actions) == 0
+
+def test_an_action_interrupted_part_way_is_undone():
+	game, a, b = _game()
+	navy = game.board.find_by_group("Navy")
+	def listener(group, event, player):
+		if event == MONOPOLY_FORMED:
+			raise KeyboardInterrupt
+	navy[0].group.subscribe(listener)
+	actions = Action_Stack(game)
+	actions.transfer_property(navy[0], a)
+	before = _state(game)
+	with pytest.raises(KeyboardInterrupt):
+		actions.transfer_property(navy[1], a)
+	assert _state(game) == before and len(actions) == 1
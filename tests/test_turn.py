@@ -0,0 +1,36 @@
+import contextlib
+import io
+import random
+from Core import Game
+from Core.turn import GAME_OVER
+
+MAX_TURNS = 3000
+
+def _seeded_game(seed: int) -> Game:
+	random.seed(seed)
+	game = Game()
+	for name in ("A", "B", "C"):
+		game.add_ai(name)
+	return game
+
+def test_run_until_plays_a_game_to_game_over():
+	game = _seeded_game(0)
+	with contextlib.redirect_stdout(io.StringIO()):
+		turns = game.run_until(turns=MAX_TURNS)
+	assert game.turn_machine.phase == GAME_OVER
+	assert 0 < turns < MAX_TURNS
+	assert sum(not player.bankrupt for player in game.players) == 1
+
+def test_stepping_plays_the_same_game_as_run_until():
+	ran = _seeded_game(1)
+	with contextlib.redirect_stdout(io.StringIO()):
+		turns = ran.run_until(turns=MAX_TURNS)
+	stepped = _seeded_game(1)
+	events = []
+	with contextlib.redirect_stdout(io.StringIO()):
+		while stepped.turn_machine.phase != GAME_OVER:
+			events.extend(stepped.step())
+	assert ran.turn_machine.phase == GAME_OVER
+	assert stepped.turn_machine.turns == turns
+	assert events[-1].kind == "game_over"
+	assert [player.balance for player in stepped.players] == [player.balance for player in ran.players]